@@ -4,7 +4,6 @@ Admin for checks (called tests by the users)
 
 from django.contrib import admin
 
-from ..common.admin import ExportCsvMixin
 from .models import (
     Audit,
     AuditOverview,
@@ -231,7 +230,7 @@ class WcagCheckResultRetestNotesHistoryAdmin(admin.ModelAdmin):
     show_facets = admin.ShowFacets.ALWAYS
 
 
-class WcagDefinitionAdmin(admin.ModelAdmin, ExportCsvMixin):
+class WcagDefinitionAdmin(admin.ModelAdmin):
 
     search_fields = ["name", "description"]
     list_display = [
@@ -243,11 +242,10 @@ class WcagDefinitionAdmin(admin.ModelAdmin, ExportCsvMixin):
         "date_end",
     ]
     list_filter = ["type"]
-    actions = ["export_as_csv"]
     show_facets = admin.ShowFacets.ALWAYS
 
 
-class StatementCheckAdmin(admin.ModelAdmin, ExportCsvMixin):
+class StatementCheckAdmin(admin.ModelAdmin):
 
     search_fields = ["label", "success_criteria", "report_text"]
     list_display = [
@@ -275,7 +273,6 @@ class StatementCheckAdmin(admin.ModelAdmin, ExportCsvMixin):
         ),
     )
     readonly_fields = ["issue_number"]
-    actions = ["export_as_csv"]
     show_facets = admin.ShowFacets.ALWAYS
 
 
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.7 on 2026-10-19 05:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audits", "0027_create_statement_checks"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="auditoverview",
+            name="initial_date_of_test",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+    ]
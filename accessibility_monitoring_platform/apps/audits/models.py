@@ -239,7 +239,7 @@ class AuditOverview(models.Model):
         blank=True,
         null=True,
     )
-    initial_date_of_test = models.DateField(null=True, blank=True)
+    initial_date_of_test = models.DateField(null=True, blank=True, db_index=True)
     published_report_data_updated_time = models.DateTimeField(null=True, blank=True)
     updated = models.DateTimeField(null=True, blank=True)
 
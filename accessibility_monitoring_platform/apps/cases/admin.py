@@ -4,7 +4,7 @@ Admin for cases
 
 from django.contrib import admin
 
-from .models import BaseCase, CaseFile
+from .models import BaseCase, CaseFile, ExportJob, SavedSearch
 
 
 class BaseCaseAdmin(admin.ModelAdmin):
@@ -49,5 +49,44 @@ class CaseFileAdmin(admin.ModelAdmin):
     show_facets = admin.ShowFacets.ALWAYS
 
 
+class SavedSearchAdmin(admin.ModelAdmin):
+    """Django admin configuration for SavedSearch model"""
+
+    readonly_fields = ["parameters_hash", "case_ids", "cached", "created"]
+    search_fields = ["name", "user__username"]
+    list_display = ["name", "user", "cached", "created"]
+    list_filter = [("user", admin.RelatedOnlyFieldListFilter)]
+
+
+class ExportJobAdmin(admin.ModelAdmin):
+    """Django admin configuration for ExportJob model"""
+
+    readonly_fields = [
+        "uuid",
+        "parameters_hash",
+        "case_ids",
+        "cases_exported",
+        "parts_written",
+        "created",
+        "updated",
+        "completed",
+    ]
+    list_display = [
+        "__str__",
+        "status",
+        "requested_by",
+        "cases_exported",
+        "created",
+        "completed",
+    ]
+    list_filter = [
+        "type",
+        "status",
+        ("requested_by", admin.RelatedOnlyFieldListFilter),
+    ]
+
+
 admin.site.register(BaseCase, BaseCaseAdmin)
 admin.site.register(CaseFile, CaseFileAdmin)
+admin.site.register(SavedSearch, SavedSearchAdmin)
+admin.site.register(ExportJob, ExportJobAdmin)
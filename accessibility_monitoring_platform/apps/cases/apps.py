@@ -0,0 +1,12 @@
+"""
+App configuration for cases app
+"""
+
+from django.apps import AppConfig
+
+
+class CasesConfig(AppConfig):
+    name = "accessibility_monitoring_platform.apps.cases"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
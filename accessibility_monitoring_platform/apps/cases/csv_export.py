@@ -1,13 +1,26 @@
 """Utility functions for CSV exports"""
 
-import copy
 import csv
+import hashlib
+import zlib
+from collections.abc import Iterable
+from dataclasses import replace
+from itertools import batched
 from typing import Any, Generator
 
-from django.db.models import QuerySet
+from django.core.cache import cache
+from django.db.models import Max, OuterRef, Prefetch, QuerySet, Subquery
+from django.http import HttpRequest, StreamingHttpResponse
 from django.urls import reverse
 
-from ..audits.models import StatementAudit, WcagAudit
+from ..audits.models import (
+    AuditRound,
+    StatementAudit,
+    StatementCheckResult,
+    WcagAudit,
+    WcagCheckResultInitial,
+    WcagCheckResultRetest,
+)
 from ..common.csv_export import (
     INITIAL_STATEMENT_AUDIT,
     INITIAL_WCAG_AUDIT,
@@ -16,18 +29,32 @@ from ..common.csv_export import (
     CSVColumn,
     EqualityBodyCSVColumn,
     ExportableClassKeys,
-    format_model_field,
+    build_csv_row,
 )
+from ..detailed.csv_export import DETAILED_EQUALITY_BODY_COLUMNS_FOR_EXPORT
 from ..detailed.models import Contact as DetailedContact
 from ..detailed.models import DetailedCase
 from ..mobile.models import MobileCase, MobileContact
 from ..reports.models import Report
+from ..s3_read_write.models import S3Report
 from ..simplified.csv_export import SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT
 from ..simplified.models import CaseStatus
 from ..simplified.models import Contact as SimplifiedContact
 from ..simplified.models import SimplifiedCase
+from .models import BaseCase
 
 DOWNLOAD_CASES_CHUNK_SIZE: int = 500
+EXPORT_FORMAT_PARAM: str = "format"
+EXPORT_FORMAT_GZIP: str = "gzip"
+GZIP_WBITS: int = 16 + zlib.MAX_WBITS
+EQUALITY_BODY_COLUMNS_CACHE_TIMEOUT: int = 24 * 60 * 60
+EXPORT_SELECT_RELATED: list[str] = [
+    "auditor",
+    "reviewer",
+    "created_by",
+    "sector",
+    "subcategory",
+]
 
 EqualityBodySourceClasses = (
     WcagAudit
@@ -40,15 +67,211 @@ EqualityBodySourceClasses = (
 )
 
 
-def populate_equality_body_columns(
-    case: DetailedCase | SimplifiedCase,
-    column_definitions: list[
-        EqualityBodyCSVColumn
-    ] = SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT,
-) -> list[EqualityBodyCSVColumn]:
+EQUALITY_BODY_COLUMNS_FOR_EXPORT: dict[str, list[EqualityBodyCSVColumn]] = {
+    BaseCase.TestType.SIMPLIFIED: SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT,
+    BaseCase.TestType.DETAILED: DETAILED_EQUALITY_BODY_COLUMNS_FOR_EXPORT,
+}
+
+
+def get_check_results_updated_annotations() -> dict[str, Subquery]:
+    """
+    Return annotations of the latest time the WCAG and statement check results
+    of a simplified case were updated
+    """
+    return {
+        f"{check_result_class.__name__.lower()}_updated": Subquery(
+            check_result_class.objects.filter(
+                **{f"{audit_field}__simplified_case_id": OuterRef("id")}
+            )
+            .order_by()
+            .values(f"{audit_field}__simplified_case_id")
+            .annotate(latest_updated=Max("updated"))
+            .values("latest_updated")
+        )
+        for check_result_class, audit_field in [
+            (WcagCheckResultInitial, "wcag_audit"),
+            (WcagCheckResultRetest, "wcag_audit"),
+            (StatementCheckResult, "statement_audit"),
+        ]
+    }
+
+
+def get_check_results_updated(case: SimplifiedCase) -> list[Any]:
     """
-    Collect data for a case to export to the equality body
+    Return the latest times the check results of a case were updated, taken
+    from the annotations of the export queryset when it loaded the case
     """
+    annotations: dict[str, Subquery] = get_check_results_updated_annotations()
+    if all(hasattr(case, annotation_name) for annotation_name in annotations):
+        return [getattr(case, annotation_name) for annotation_name in annotations]
+    return list(
+        SimplifiedCase.objects.filter(id=case.id)
+        .annotate(**annotations)
+        .values_list(*annotations)
+        .first()
+        or []
+    )
+
+
+def get_export_cases_querysets() -> dict[str, QuerySet]:
+    """
+    Return querysets for each testing type which fetch the related objects
+    used when exporting a chunk of cases
+    """
+    return {
+        SimplifiedCase.TestType.SIMPLIFIED: SimplifiedCase.objects.select_related(
+            *EXPORT_SELECT_RELATED, "auditoverview_simplifiedcase"
+        )
+        .annotate(**get_check_results_updated_annotations())
+        .prefetch_related(
+            Prefetch(
+                "contact_set",
+                queryset=SimplifiedContact.objects.filter(is_deleted=False),
+                to_attr="export_contacts",
+            ),
+            Prefetch(
+                "wcagaudit_set",
+                queryset=WcagAudit.objects.filter(is_deleted=False),
+                to_attr="export_wcag_audits",
+            ),
+            Prefetch(
+                "statementaudit_set",
+                queryset=StatementAudit.objects.filter(is_deleted=False),
+                to_attr="export_statement_audits",
+            ),
+            Prefetch("report_basecase", to_attr="export_reports"),
+            Prefetch(
+                "s3report_set",
+                queryset=S3Report.objects.filter(latest_published=True).order_by("id"),
+                to_attr="export_latest_s3_reports",
+            ),
+        ),
+        DetailedCase.TestType.DETAILED: DetailedCase.objects.select_related(
+            *EXPORT_SELECT_RELATED
+        ).prefetch_related(
+            Prefetch(
+                "detailed_contacts",
+                queryset=DetailedContact.objects.filter(is_deleted=False),
+                to_attr="export_contacts",
+            )
+        ),
+        MobileCase.TestType.MOBILE: MobileCase.objects.select_related(
+            *EXPORT_SELECT_RELATED
+        ).prefetch_related(
+            Prefetch(
+                "mobile_contacts",
+                queryset=MobileContact.objects.filter(is_deleted=False),
+                to_attr="export_contacts",
+            )
+        ),
+    }
+
+
+def load_export_cases(
+    cases: Iterable[BaseCase], chunk_size: int = DOWNLOAD_CASES_CHUNK_SIZE
+) -> Generator[SimplifiedCase | DetailedCase | MobileCase, None, None]:
+    """
+    Yield the concrete case for each case in turn, fetching each chunk of
+    cases with their contacts, audits and reports in a fixed number of queries.
+    Cases deleted since their ids were read are skipped.
+
+    Case ids are streamed from a server-side cursor on PostgreSQL so only the
+    current chunk of cases is held in memory.
+    """
+    if isinstance(cases, QuerySet):
+        ids_and_test_types: Iterable[tuple[int, str]] = cases.values_list(
+            "id", "test_type"
+        ).iterator(chunk_size=chunk_size)
+    else:
+        ids_and_test_types = ((case.id, case.test_type) for case in cases)
+
+    export_cases_querysets: dict[str, QuerySet] = get_export_cases_querysets()
+    for chunk in batched(ids_and_test_types, chunk_size):
+        case_ids_by_test_type: dict[str, list[int]] = {}
+        for case_id, test_type in chunk:
+            case_ids_by_test_type.setdefault(test_type, []).append(case_id)
+        concrete_cases: dict[int, SimplifiedCase | DetailedCase | MobileCase] = {}
+        for test_type, case_ids in case_ids_by_test_type.items():
+            if test_type in export_cases_querysets:
+                concrete_cases.update(
+                    export_cases_querysets[test_type].in_bulk(case_ids)
+                )
+        for case_id, _ in chunk:
+            if case_id in concrete_cases:
+                yield concrete_cases[case_id]
+
+
+def get_case_contacts(
+    case: DetailedCase | MobileCase | SimplifiedCase,
+) -> list[DetailedContact | MobileContact | SimplifiedContact] | QuerySet:
+    """Return contacts of case, using contacts prefetched for export"""
+    if hasattr(case, "export_contacts"):
+        return case.export_contacts
+    if isinstance(case, DetailedCase):
+        return case.detailed_contacts.filter(is_deleted=False)
+    if isinstance(case, MobileCase):
+        return case.mobile_contacts.filter(is_deleted=False)
+    return case.contact_set.filter(is_deleted=False)
+
+
+def get_first_contact(
+    case: DetailedCase | MobileCase | SimplifiedCase,
+) -> DetailedContact | MobileContact | SimplifiedContact | None:
+    """Return first contact of case, using contacts prefetched for export"""
+    contacts: list[DetailedContact | MobileContact | SimplifiedContact] | QuerySet = (
+        get_case_contacts(case=case)
+    )
+    if isinstance(contacts, QuerySet):
+        return contacts.first()
+    return contacts[0] if contacts else None
+
+
+def get_first_audit_of_round_type(
+    audits: list[AuditRound], audit_round_type: str
+) -> AuditRound | None:
+    """Return first of the audits prefetched for export of the round type"""
+    for audit in audits:
+        if audit.audit_round_type == audit_round_type:
+            return audit
+    return None
+
+
+def get_audit_source_instances(
+    case: SimplifiedCase,
+) -> dict[ExportableClassKeys, WcagAudit | StatementAudit | None]:
+    """Return initial and 12-week audits, using audits prefetched for export"""
+    if not hasattr(case, "audit_overview") or case.audit_overview is None:
+        return {}
+    if hasattr(case, "export_wcag_audits") and hasattr(case, "export_statement_audits"):
+        return {
+            INITIAL_WCAG_AUDIT: get_first_audit_of_round_type(
+                case.export_wcag_audits, WcagAudit.AuditRoundType.INITIAL
+            ),
+            TWELVE_WEEK_WCAG_AUDIT: get_first_audit_of_round_type(
+                case.export_wcag_audits, WcagAudit.AuditRoundType.TWELVE_WEEK
+            ),
+            INITIAL_STATEMENT_AUDIT: get_first_audit_of_round_type(
+                case.export_statement_audits, StatementAudit.AuditRoundType.INITIAL
+            ),
+            TWELVE_WEEK_STATEMENT_AUDIT: get_first_audit_of_round_type(
+                case.export_statement_audits,
+                StatementAudit.AuditRoundType.TWELVE_WEEK,
+            ),
+        }
+    return {
+        INITIAL_WCAG_AUDIT: case.audit_overview.initial_wcag_audit,
+        TWELVE_WEEK_WCAG_AUDIT: case.audit_overview.first_twelve_week_wcag_audit,
+        INITIAL_STATEMENT_AUDIT: case.audit_overview.initial_statement_audit,
+        TWELVE_WEEK_STATEMENT_AUDIT: (
+            case.audit_overview.first_twelve_week_statement_audit
+        ),
+    }
+
+
+def get_equality_body_source_instances(
+    case: DetailedCase | SimplifiedCase,
+) -> dict[type[EqualityBodySourceClasses], EqualityBodySourceClasses]:
+    """Return the objects the equality body export columns take their data from"""
     source_instances: dict[
         type[EqualityBodySourceClasses], EqualityBodySourceClasses
     ] = {}
@@ -56,96 +279,211 @@ def populate_equality_body_columns(
         source_instances[DetailedCase] = case
     elif isinstance(case, SimplifiedCase):
         source_instances[SimplifiedCase] = case
-        if hasattr(case, "audit_overview") and case.audit_overview is not None:
-            source_instances[INITIAL_WCAG_AUDIT] = (
-                case.audit_overview.initial_wcag_audit
-            )
-            source_instances[TWELVE_WEEK_WCAG_AUDIT] = (
-                case.audit_overview.first_twelve_week_wcag_audit
-            )
-            source_instances[INITIAL_STATEMENT_AUDIT] = (
-                case.audit_overview.initial_statement_audit
+        source_instances.update(get_audit_source_instances(case=case))
+        if hasattr(case, "export_reports"):
+            source_instances[Report] = (
+                case.export_reports[0] if case.export_reports else None
             )
-            source_instances[TWELVE_WEEK_STATEMENT_AUDIT] = (
-                case.audit_overview.first_twelve_week_statement_audit
-            )
-        if hasattr(case, "report"):
+        elif hasattr(case, "report"):
             source_instances[Report] = case.report
+    return source_instances
 
-    columns: list[EqualityBodyCSVColumn] = copy.deepcopy(column_definitions)
 
-    for column in columns:
-        source_instance: EqualityBodySourceClasses = source_instances.get(
-            column.source_classkey
-        )
-        edit_url_instance: EqualityBodySourceClasses = source_instances.get(
-            column.edit_url_classkey
+def get_csv_source_instances(
+    case: DetailedCase | MobileCase | SimplifiedCase,
+) -> dict[type[ExportableClassKeys], ExportableClassKeys]:
+    """Return the objects the export columns take their data from"""
+    source_instances: dict[type[ExportableClassKeys], ExportableClassKeys] = {}
+    if isinstance(case, DetailedCase):
+        source_instances[DetailedCase] = case
+        source_instances[DetailedContact] = get_first_contact(case=case)
+    if isinstance(case, MobileCase):
+        source_instances[MobileCase] = case
+        source_instances[MobileContact] = get_first_contact(case=case)
+    elif isinstance(case, SimplifiedCase):
+        source_instances[SimplifiedCase] = case
+        source_instances[CaseStatus] = case.status
+        source_instances[SimplifiedContact] = get_first_contact(case=case)
+        source_instances.update(get_audit_source_instances(case=case))
+    return source_instances
+
+
+def get_latest_s3_report_id(case: SimplifiedCase) -> int | None:
+    """Return id of latest published report, using reports prefetched for export"""
+    if hasattr(case, "export_latest_s3_reports"):
+        return (
+            case.export_latest_s3_reports[-1].id
+            if case.export_latest_s3_reports
+            else None
         )
+    return (
+        S3Report.objects.filter(base_case=case, latest_published=True)
+        .values_list("id", flat=True)
+        .last()
+    )
 
-        column.formatted_data = format_model_field(
-            source_instance=source_instance, column=column
+
+def get_equality_body_columns_cache_key(
+    case: DetailedCase | SimplifiedCase,
+    source_instances: dict[type[EqualityBodySourceClasses], EqualityBodySourceClasses],
+) -> str:
+    """
+    Return key for the cached equality body columns of a case which changes
+    whenever the case, its contacts, the audits, check results and report the
+    columns take their data from are saved or a report is published.
+
+    Check results are covered by the latest time any of them was updated as
+    they are edited in formsets on many audit pages.
+    """
+    versions: list[tuple[Any, ...]] = [
+        (
+            getattr(source_classkey, "__name__", source_classkey),
+            source_instance.id,
+            getattr(source_instance, "version", None),
+            getattr(source_instance, "updated", None),
         )
+        for source_classkey, source_instance in source_instances.items()
+        if source_instance is not None
+    ]
+    versions += [
+        ("contact", contact.id, contact.version)
+        for contact in get_case_contacts(case=case)
+    ]
+    if isinstance(case, SimplifiedCase):
+        if case.audit_overview is not None:
+            versions.append(
+                (
+                    "audit-overview",
+                    case.audit_overview.id,
+                    case.audit_overview.updated,
+                    case.audit_overview.published_report_data_updated_time,
+                )
+            )
+        versions.append(("check-results", *get_check_results_updated(case=case)))
+        versions.append(("s3-report", get_latest_s3_report_id(case=case)))
+    versions_hash: str = hashlib.sha256(repr(versions).encode("utf-8")).hexdigest()
+    return f"equality-body-columns:{case.test_type}:{case.id}:{versions_hash}"
 
+
+def build_equality_body_columns(
+    source_instances: dict[type[EqualityBodySourceClasses], EqualityBodySourceClasses],
+    column_definitions: list[EqualityBodyCSVColumn],
+) -> list[EqualityBodyCSVColumn]:
+    """Format the data and edit link of each equality body column"""
+    columns: list[EqualityBodyCSVColumn] = []
+
+    for column_definition, formatted_data in zip(
+        column_definitions,
+        build_csv_row(
+            source_instances=source_instances, column_definitions=column_definitions
+        ),
+    ):
+        column: EqualityBodyCSVColumn = replace(
+            column_definition, formatted_data=formatted_data
+        )
+        edit_url_instance: EqualityBodySourceClasses = source_instances.get(
+            column.edit_url_classkey
+        )
         if column.edit_url_name is not None and edit_url_instance is not None:
             column.edit_url = reverse(
                 column.edit_url_name, kwargs={"pk": edit_url_instance.id}
             )
             if column.edit_url_anchor:
                 column.edit_url += f"#{column.edit_url_anchor}"
+        columns.append(column)
 
     return columns
 
 
+def populate_equality_body_columns(
+    case: DetailedCase | SimplifiedCase,
+    column_definitions: list[
+        EqualityBodyCSVColumn
+    ] = SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT,
+) -> list[EqualityBodyCSVColumn]:
+    """
+    Collect data for a case to export to the equality body.
+
+    All the equality body columns of the case are cached together so the
+    closing case pages, export pages and CSV exports share them and only
+    format data and reverse edit links again once the case has changed.
+    """
+    source_instances: dict[
+        type[EqualityBodySourceClasses], EqualityBodySourceClasses
+    ] = get_equality_body_source_instances(case=case)
+    all_column_definitions: list[EqualityBodyCSVColumn] = (
+        EQUALITY_BODY_COLUMNS_FOR_EXPORT.get(case.test_type, [])
+    )
+    column_definition_ids: set[int] = {
+        id(column_definition) for column_definition in all_column_definitions
+    }
+    if any(
+        id(column_definition) not in column_definition_ids
+        for column_definition in column_definitions
+    ):
+        return build_equality_body_columns(
+            source_instances=source_instances, column_definitions=column_definitions
+        )
+
+    cache_key: str = get_equality_body_columns_cache_key(
+        case=case, source_instances=source_instances
+    )
+    cached_columns: list[tuple[Any, str | None]] | None = cache.get(cache_key)
+    if cached_columns is None:
+        cached_columns = [
+            (column.formatted_data, column.edit_url)
+            for column in build_equality_body_columns(
+                source_instances=source_instances,
+                column_definitions=all_column_definitions,
+            )
+        ]
+        cache.set(
+            cache_key, cached_columns, timeout=EQUALITY_BODY_COLUMNS_CACHE_TIMEOUT
+        )
+    cached_columns_by_definition: dict[int, tuple[Any, str | None]] = {
+        id(column_definition): cached_column
+        for column_definition, cached_column in zip(
+            all_column_definitions, cached_columns
+        )
+    }
+    return [
+        replace(
+            column_definition,
+            formatted_data=cached_columns_by_definition[id(column_definition)][0],
+            edit_url=cached_columns_by_definition[id(column_definition)][1],
+        )
+        for column_definition in column_definitions
+    ]
+
+
+def get_equality_body_row(case: DetailedCase | SimplifiedCase) -> list[Any]:
+    """Return formatted data of the equality body columns of a case"""
+    return [
+        column.formatted_data for column in populate_equality_body_columns(case=case)
+    ]
+
+
 def populate_csv_columns(
     case: DetailedCase | SimplifiedCase, column_definitions: list[CSVColumn]
 ) -> list[CSVColumn]:
     """Collect data for a case to export"""
-    source_instances: dict[type[ExportableClassKeys], ExportableClassKeys] = {}
-    if isinstance(case, DetailedCase):
-        source_instances[DetailedCase] = case
-        source_instances[DetailedContact] = case.detailed_contacts.filter(
-            is_deleted=False
-        ).first()
-    if isinstance(case, MobileCase):
-        source_instances[MobileCase] = case
-        source_instances[MobileContact] = case.mobile_contacts.filter(
-            is_deleted=False
-        ).first()
-    elif isinstance(case, SimplifiedCase):
-        source_instances[SimplifiedCase] = case
-        source_instances[CaseStatus] = case.status
-        source_instances[SimplifiedContact] = case.contact_set.filter(
-            is_deleted=False
-        ).first()
-        if hasattr(case, "audit_overview") and case.audit_overview is not None:
-            source_instances[INITIAL_WCAG_AUDIT] = (
-                case.audit_overview.initial_wcag_audit
-            )
-            source_instances[TWELVE_WEEK_WCAG_AUDIT] = (
-                case.audit_overview.first_twelve_week_wcag_audit
-            )
-            source_instances[INITIAL_STATEMENT_AUDIT] = (
-                case.audit_overview.initial_statement_audit
-            )
-            source_instances[TWELVE_WEEK_STATEMENT_AUDIT] = (
-                case.audit_overview.first_twelve_week_statement_audit
-            )
-
-    columns: list[CSVColumn] = copy.deepcopy(column_definitions)
-    for column in columns:
-        source_instance: ExportableClassKeys = source_instances.get(
-            column.source_classkey
+    return [
+        replace(column, formatted_data=formatted_data)
+        for column, formatted_data in zip(
+            column_definitions,
+            build_csv_row(
+                source_instances=get_csv_source_instances(case=case),
+                column_definitions=column_definitions,
+            ),
         )
-        column.formatted_data = format_model_field(
-            source_instance=source_instance, column=column
-        )
-    return columns
+    ]
 
 
 def csv_output_generator(
     cases: QuerySet[SimplifiedCase] | QuerySet[DetailedCase] | QuerySet[MobileCase],
     columns_for_export: list[CSVColumn],
     equality_body_csv: bool = False,
+    include_header: bool = True,
 ) -> Generator[str, None, None]:
     """
     Generate a series of strings containing the content for a CSV streaming response
@@ -158,21 +496,54 @@ def csv_output_generator(
     writer: Any = csv.writer(DummyFile())
     column_row: list[str] = [column.column_header for column in columns_for_export]
 
-    output: str = writer.writerow(column_row)
+    output: str = writer.writerow(column_row) if include_header else ""
 
-    for counter, case in enumerate(cases):
+    for counter, case in enumerate(
+        load_export_cases(cases=cases, chunk_size=DOWNLOAD_CASES_CHUNK_SIZE)
+    ):
         if equality_body_csv is True:
-            case_columns: list[EqualityBodyCSVColumn] = populate_equality_body_columns(
-                case=case.get_case()
-            )
+            row: list[Any] = get_equality_body_row(case=case)
         else:
-            case_columns: list[CSVColumn] = populate_csv_columns(
-                case=case.get_case(), column_definitions=columns_for_export
+            row: list[Any] = build_csv_row(
+                source_instances=get_csv_source_instances(case=case),
+                column_definitions=columns_for_export,
             )
-        row = [column.formatted_data for column in case_columns]
         output += writer.writerow(row)
         if counter % DOWNLOAD_CASES_CHUNK_SIZE == 0:
             yield output
             output = ""
     if output:
         yield output
+
+
+def gzip_output_generator(
+    output_generator: Iterable[str],
+) -> Generator[bytes, None, None]:
+    """Compress each string generated into a single gzip stream"""
+    compressor: Any = zlib.compressobj(wbits=GZIP_WBITS)
+    for output in output_generator:
+        compressed: bytes = compressor.compress(output.encode("utf-8"))
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def is_compressed_export_requested(request: HttpRequest) -> bool:
+    """Return True if the export has been requested as gzip compressed CSV"""
+    return request.GET.get(EXPORT_FORMAT_PARAM) == EXPORT_FORMAT_GZIP
+
+
+def csv_streaming_response(
+    output_generator: Iterable[str], filename: str, compress: bool = False
+) -> StreamingHttpResponse:
+    """Return response streaming CSV as a download, optionally gzip compressed"""
+    if compress:
+        response = StreamingHttpResponse(
+            gzip_output_generator(output_generator=output_generator),
+            content_type="application/gzip",
+        )
+        filename = f"{filename}.gz"
+    else:
+        response = StreamingHttpResponse(output_generator, content_type="text/csv")
+    response["Content-Disposition"] = f"attachment; filename={filename}"
+    return response
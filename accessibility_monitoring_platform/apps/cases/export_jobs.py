@@ -0,0 +1,389 @@
+"""
+Background CSV exports written to S3 in parts by the run_export_jobs command
+"""
+
+import logging
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import timedelta
+from functools import partial
+from typing import Any, Generator
+
+import django
+from django.contrib.auth.models import User
+from django.db import IntegrityError, connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from ..common.s3_utils import S3Wrapper
+from ..detailed.csv_export import (
+    DETAILED_CASE_COLUMNS_FOR_EXPORT,
+    DETAILED_EQUALITY_BODY_COLUMNS_FOR_EXPORT,
+    DETAILED_FEEDBACK_SURVEY_COLUMNS_FOR_EXPORT,
+)
+from ..mobile.csv_export import (
+    MOBILE_CASE_COLUMNS_FOR_EXPORT,
+    MOBILE_FEEDBACK_SURVEY_COLUMNS_FOR_EXPORT,
+    csv_mobile_equality_body_output_generator,
+)
+from ..simplified.csv_export import (
+    SIMPLIFIED_CASE_COLUMNS_FOR_EXPORT,
+    SIMPLIFIED_FEEDBACK_SURVEY_COLUMNS_FOR_EXPORT,
+)
+from .csv_export import DOWNLOAD_CASES_CHUNK_SIZE, csv_output_generator
+from .forms import CaseSearchForm
+from .models import BaseCase, ExportJob
+from .utils import (
+    filter_cases,
+    get_case_search_form,
+    hash_case_search_parameters,
+    normalise_case_search_parameters,
+)
+
+logger = logging.getLogger(__name__)
+
+EXPORT_JOB_CHUNK_SIZE: int = DOWNLOAD_CASES_CHUNK_SIZE
+EXPORT_JOB_STALE_AFTER: timedelta = timedelta(minutes=10)
+EXPORT_JOB_PENDING_CHUNKS_PER_WORKER: int = 2
+
+EXPORT_JOB_TEST_TYPES: dict[str, str] = {
+    ExportJob.Type.SIMPLIFIED: BaseCase.TestType.SIMPLIFIED,
+    ExportJob.Type.SIMPLIFIED_FEEDBACK_SURVEY: BaseCase.TestType.SIMPLIFIED,
+    ExportJob.Type.DETAILED: BaseCase.TestType.DETAILED,
+    ExportJob.Type.DETAILED_FEEDBACK_SURVEY: BaseCase.TestType.DETAILED,
+    ExportJob.Type.DETAILED_EQUALITY_BODY: BaseCase.TestType.DETAILED,
+    ExportJob.Type.MOBILE: BaseCase.TestType.MOBILE,
+    ExportJob.Type.MOBILE_FEEDBACK_SURVEY: BaseCase.TestType.MOBILE,
+    ExportJob.Type.MOBILE_EQUALITY_BODY: BaseCase.TestType.MOBILE,
+}
+EXPORT_JOB_GENERATORS: dict[str, Callable[..., Generator[str, None, None]]] = {
+    ExportJob.Type.SIMPLIFIED: partial(
+        csv_output_generator, columns_for_export=SIMPLIFIED_CASE_COLUMNS_FOR_EXPORT
+    ),
+    ExportJob.Type.SIMPLIFIED_FEEDBACK_SURVEY: partial(
+        csv_output_generator,
+        columns_for_export=SIMPLIFIED_FEEDBACK_SURVEY_COLUMNS_FOR_EXPORT,
+    ),
+    ExportJob.Type.DETAILED: partial(
+        csv_output_generator, columns_for_export=DETAILED_CASE_COLUMNS_FOR_EXPORT
+    ),
+    ExportJob.Type.DETAILED_FEEDBACK_SURVEY: partial(
+        csv_output_generator,
+        columns_for_export=DETAILED_FEEDBACK_SURVEY_COLUMNS_FOR_EXPORT,
+    ),
+    ExportJob.Type.DETAILED_EQUALITY_BODY: partial(
+        csv_output_generator,
+        columns_for_export=DETAILED_EQUALITY_BODY_COLUMNS_FOR_EXPORT,
+    ),
+    ExportJob.Type.MOBILE: partial(
+        csv_output_generator, columns_for_export=MOBILE_CASE_COLUMNS_FOR_EXPORT
+    ),
+    ExportJob.Type.MOBILE_FEEDBACK_SURVEY: partial(
+        csv_output_generator,
+        columns_for_export=MOBILE_FEEDBACK_SURVEY_COLUMNS_FOR_EXPORT,
+    ),
+    ExportJob.Type.MOBILE_EQUALITY_BODY: csv_mobile_equality_body_output_generator,
+}
+
+
+class ExportJobClaimLost(Exception):
+    """Export job has been claimed by another worker"""
+
+
+class S3ReadWriteExportJob(S3Wrapper):
+    def write_export_job_part_to_s3(
+        self, export_job: ExportJob, part: int, content: str
+    ) -> None:
+        self.s3_client.put_object(
+            Body=content.encode("utf-8"),
+            Bucket=self.bucket,
+            Key=export_job.get_part_s3_key(part=part),
+        )
+
+    def read_export_job_part_from_s3(self, export_job: ExportJob, part: int) -> str:
+        s3_object: Any = self.s3_resource.Object(
+            self.bucket, export_job.get_part_s3_key(part=part)
+        )
+        return s3_object.get()["Body"].read().decode("utf-8")
+
+
+def request_export_job(
+    export_type: str, case_search_form: CaseSearchForm, user: User
+) -> ExportJob:
+    """
+    Queue export of cases matching search, returning the queued or running job
+    for an identical export if there is one
+    """
+    parameters: dict[str, str] = normalise_case_search_parameters(
+        cleaned_data=getattr(case_search_form, "cleaned_data", {})
+    )
+    parameters["test_type"] = EXPORT_JOB_TEST_TYPES[export_type]
+    parameters_hash: str = hash_case_search_parameters(parameters=parameters)
+    active_export_jobs = ExportJob.objects.filter(
+        type=export_type,
+        parameters_hash=parameters_hash,
+        status__in=ExportJob.ACTIVE_STATUSES,
+    )
+    export_job: ExportJob | None = active_export_jobs.first()
+    if export_job is not None:
+        return export_job
+    try:
+        with transaction.atomic():
+            return ExportJob.objects.create(
+                type=export_type,
+                parameters=parameters,
+                parameters_hash=parameters_hash,
+                requested_by=user,
+            )
+    except IntegrityError:
+        return active_export_jobs.get()
+
+
+def claim_export_job() -> ExportJob | None:
+    """
+    Mark the oldest queued export job, or a running job whose worker has
+    stopped updating it, as running in this worker and return it.
+
+    Each claim gets a new token so a worker which has stopped updating its
+    job can tell when another worker has taken it over.
+    """
+    stale: Any = timezone.now() - EXPORT_JOB_STALE_AFTER
+    for export_job in ExportJob.objects.filter(
+        Q(status=ExportJob.Status.QUEUED)
+        | Q(status=ExportJob.Status.RUNNING, updated__lt=stale)
+    ).order_by("id"):
+        claimed: int = ExportJob.objects.filter(
+            id=export_job.id, status=export_job.status, updated=export_job.updated
+        ).update(
+            status=ExportJob.Status.RUNNING,
+            claim_token=uuid.uuid4(),
+            updated=timezone.now(),
+        )
+        if claimed:
+            export_job.refresh_from_db()
+            return export_job
+    return None
+
+
+def save_claimed_export_job(export_job: ExportJob, update_fields: list[str]) -> None:
+    """
+    Save fields of export job only if this worker still holds its claim,
+    raising ExportJobClaimLost if another worker has claimed it since
+    """
+    export_job.updated = timezone.now()
+    updated: int = ExportJob.objects.filter(
+        id=export_job.id, claim_token=export_job.claim_token
+    ).update(
+        **{
+            field_name: getattr(export_job, field_name)
+            for field_name in update_fields + ["updated"]
+        }
+    )
+    if not updated:
+        raise ExportJobClaimLost(
+            f"Export job {export_job.id} claimed by another worker"
+        )
+
+
+def get_export_job_case_ids(export_job: ExportJob) -> list[int]:
+    """Return ids of cases to export, recording them when the job first runs"""
+    if export_job.case_ids is None:
+        export_job.case_ids = list(
+            filter_cases(
+                form=get_case_search_form(parameters=export_job.parameters)
+            ).values_list("id", flat=True)
+        )
+        save_claimed_export_job(export_job=export_job, update_fields=["case_ids"])
+    return export_job.case_ids
+
+
+def get_cases_in_order(case_ids: list[int]) -> list[BaseCase]:
+    """Return cases with ids in the order given"""
+    cases_by_id: dict[int, BaseCase] = BaseCase.objects.in_bulk(case_ids)
+    return [cases_by_id[case_id] for case_id in case_ids if case_id in cases_by_id]
+
+
+def get_export_job_chunks(
+    export_job: ExportJob, case_ids: list[int], chunk_size: int
+) -> list[list[int]]:
+    """
+    Return ids of cases in each part of the export still to be written; An
+    export of no cases has one part containing only the header
+    """
+    chunks: list[list[int]] = [
+        case_ids[start : start + chunk_size]
+        for start in range(export_job.cases_exported, len(case_ids), chunk_size)
+    ]
+    if not chunks and export_job.parts_written == 0:
+        return [[]]
+    return chunks
+
+
+def format_export_job_chunk(
+    export_type: str, case_ids: list[int], include_header: bool
+) -> str:
+    """Return CSV content for a chunk of cases"""
+    output_generator: Callable[..., Generator[str, None, None]] = EXPORT_JOB_GENERATORS[
+        export_type
+    ]
+    return "".join(
+        output_generator(
+            get_cases_in_order(case_ids=case_ids), include_header=include_header
+        )
+    )
+
+
+def initialise_export_worker() -> None:
+    """Set up Django in export worker process, which opens its own connections"""
+    django.setup()
+
+
+def ordered_parallel_map(
+    executor: Executor,
+    function: Callable[..., Any],
+    *iterables: Iterable[Any],
+    max_pending: int,
+) -> Generator[Any, None, None]:
+    """
+    Call function in executor for each set of arguments and yield the results
+    in order, keeping no more than max_pending calls waiting to be yielded
+    """
+    pending: deque[Future] = deque()
+    for arguments in zip(*iterables):
+        pending.append(executor.submit(function, *arguments))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def generate_export_job_parts(
+    export_type: str,
+    chunks: list[list[int]],
+    first_part: int = 1,
+    workers: int = 1,
+    executor: Executor | None = None,
+) -> Generator[str, None, None]:
+    """
+    Generate CSV content of each chunk of cases in order, formatting chunks
+    concurrently in a pool of processes when more than one worker is used
+    """
+    include_headers: list[bool] = [
+        first_part + position == 1 for position in range(len(chunks))
+    ]
+    export_types: list[str] = [export_type] * len(chunks)
+    if workers <= 1 and executor is None:
+        yield from map(format_export_job_chunk, export_types, chunks, include_headers)
+        return
+    if executor is None:
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=initialise_export_worker
+        ) as process_pool:
+            yield from generate_export_job_parts(
+                export_type=export_type,
+                chunks=chunks,
+                first_part=first_part,
+                workers=workers,
+                executor=process_pool,
+            )
+        return
+    yield from ordered_parallel_map(
+        executor,
+        format_export_job_chunk,
+        export_types,
+        chunks,
+        include_headers,
+        max_pending=workers * EXPORT_JOB_PENDING_CHUNKS_PER_WORKER,
+    )
+
+
+def run_export_job(
+    export_job: ExportJob,
+    s3_read_write: S3ReadWriteExportJob | None = None,
+    chunk_size: int = EXPORT_JOB_CHUNK_SIZE,
+    workers: int = 1,
+    executor: Executor | None = None,
+) -> None:
+    """
+    Write CSV for export job to S3 one part per chunk of cases, recording
+    progress after each part so an interrupted job carries on where it stopped.
+    Stops with ExportJobClaimLost if another worker has taken over the job.
+
+    With more than one worker, chunks are formatted concurrently in a pool of
+    processes and written to S3 in order as they complete.
+    """
+    if s3_read_write is None:
+        s3_read_write = S3ReadWriteExportJob()
+    case_ids: list[int] = get_export_job_case_ids(export_job=export_job)
+    chunks: list[list[int]] = get_export_job_chunks(
+        export_job=export_job, case_ids=case_ids, chunk_size=chunk_size
+    )
+    for chunk_case_ids, content in zip(
+        chunks,
+        generate_export_job_parts(
+            export_type=export_job.type,
+            chunks=chunks,
+            first_part=export_job.parts_written + 1,
+            workers=workers,
+            executor=executor,
+        ),
+    ):
+        part: int = export_job.parts_written + 1
+        s3_read_write.write_export_job_part_to_s3(
+            export_job=export_job, part=part, content=content
+        )
+        export_job.parts_written = part
+        export_job.cases_exported += len(chunk_case_ids)
+        save_claimed_export_job(
+            export_job=export_job, update_fields=["parts_written", "cases_exported"]
+        )
+    export_job.status = ExportJob.Status.COMPLETE
+    export_job.completed = timezone.now()
+    save_claimed_export_job(
+        export_job=export_job, update_fields=["status", "completed"]
+    )
+
+
+def run_export_jobs(
+    s3_read_write: S3ReadWriteExportJob | None = None,
+    chunk_size: int = EXPORT_JOB_CHUNK_SIZE,
+    workers: int = 1,
+) -> int:
+    """Run export jobs until none are waiting and return how many were run"""
+    jobs_run: int = 0
+    while (export_job := claim_export_job()) is not None:
+        try:
+            run_export_job(
+                export_job=export_job,
+                s3_read_write=s3_read_write,
+                chunk_size=chunk_size,
+                workers=workers,
+            )
+        except ExportJobClaimLost:
+            logger.warning("Export job %s claimed by another worker", export_job.id)
+        except Exception as error:  # pylint: disable=broad-except
+            logger.exception("Export job %s failed", export_job.id)
+            export_job.status = ExportJob.Status.FAILED
+            export_job.error = str(error)
+            ExportJob.objects.filter(
+                id=export_job.id, claim_token=export_job.claim_token
+            ).update(
+                status=export_job.status, error=export_job.error, updated=timezone.now()
+            )
+        jobs_run += 1
+    return jobs_run
+
+
+def export_job_output_generator(
+    export_job: ExportJob, s3_read_write: S3ReadWriteExportJob | None = None
+) -> Generator[str, None, None]:
+    """Generate the parts of a completed export job's CSV in turn"""
+    if s3_read_write is None:
+        s3_read_write = S3ReadWriteExportJob()
+    for part in range(1, export_job.parts_written + 1):
+        yield s3_read_write.read_export_job_part_from_s3(
+            export_job=export_job, part=part
+        )
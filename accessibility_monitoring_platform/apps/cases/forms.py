@@ -14,6 +14,8 @@ from ..cases.models import (
     BaseCase,
     CaseFile,
     Complaint,
+    ExportJob,
+    SavedSearch,
     Sort,
     extract_id_from_case_url,
 )
@@ -99,6 +101,32 @@ class CaseSearchForm(AMPDateRangeForm):
         self.fields["reviewer"].choices = auditor_choices
 
 
+class SavedSearchCreateForm(forms.ModelForm):
+    """Form for saving the current case search"""
+
+    name = AMPCharFieldWide(label="Saved search name")
+
+    class Meta:
+        model = SavedSearch
+        fields = [
+            "name",
+        ]
+
+
+class ExportJobCreateForm(forms.ModelForm):
+    """Form for exporting the current case search in the background"""
+
+    type = AMPChoiceField(
+        label="Background export", choices=ExportJob.Type.choices, required=True
+    )
+
+    class Meta:
+        model = ExportJob
+        fields = [
+            "type",
+        ]
+
+
 class PreviousCaseURLForm(forms.ModelForm):
     """Form for a case with a previous URL field"""
 
@@ -0,0 +1,192 @@
+"""
+In-memory prefix index used to look up cases as the user types
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import BaseCase
+
+CASE_LOOKUP_MIN_LENGTH: int = 2
+CASE_LOOKUP_RESULTS_LIMIT: int = 10
+CASE_LOOKUP_REFRESH_INTERVAL: timedelta = timedelta(seconds=30)
+CASE_LOOKUP_FIELDS: list[str] = [
+    "id",
+    "case_identifier",
+    "organisation_name",
+    "domain",
+    "test_type",
+]
+
+
+@dataclass
+class CaseLookupEntry:
+    """Case details returned by case lookup"""
+
+    id: int
+    case_identifier: str
+    organisation_name: str
+    domain: str
+    test_type: str
+
+    @property
+    def keys(self) -> set[str]:
+        """Return lowercase strings the case can be found by prefix of"""
+        keys: set[str] = {
+            self.case_identifier.lower(),
+            self.case_identifier.lstrip("#").lower(),
+        }
+        if "-" in self.case_identifier:
+            keys.add(self.case_identifier.split("-", 1)[1])
+        organisation_name: str = self.organisation_name.lower()
+        words: list[str] = organisation_name.split()
+        for position in range(len(words)):
+            keys.add(" ".join(words[position:]))
+        domain: str = self.domain.lower()
+        keys.add(domain)
+        keys.add(domain.removeprefix("www."))
+        keys.discard("")
+        return keys
+
+    def as_dict(self) -> dict[str, str | int]:
+        return {
+            "id": self.id,
+            "case_identifier": self.case_identifier,
+            "organisation_name": self.organisation_name,
+            "domain": self.domain,
+            "url": reverse(f"{self.test_type}:case-detail", kwargs={"pk": self.id}),
+        }
+
+
+class CaseLookupIndex:
+    """
+    Sorted list of (key, case id) pairs searched by prefix using bisect.
+
+    The index is loaded on first use, updated when a case is saved in this
+    process and periodically refreshed with cases updated by other processes.
+    Cases are read from the database without holding the lock used by
+    searches, which is only held while the new keys are swapped or added in.
+    """
+
+    def __init__(self) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self.refresh_lock: threading.Lock = threading.Lock()
+        self.keys: list[tuple[str, int]] = []
+        self.entries: dict[int, CaseLookupEntry] = {}
+        self.loaded: datetime | None = None
+        self.refreshed: datetime | None = None
+
+    def clear(self) -> None:
+        """Empty index so that it is loaded again on next search"""
+        with self.lock:
+            self.keys = []
+            self.entries = {}
+            self.loaded = None
+            self.refreshed = None
+
+    def add(self, entry: CaseLookupEntry) -> None:
+        """Add or replace case in index"""
+        previous_entry: CaseLookupEntry | None = self.entries.get(entry.id)
+        if previous_entry is not None:
+            for key in previous_entry.keys:
+                position: int = bisect.bisect_left(self.keys, (key, entry.id))
+                if position < len(self.keys) and self.keys[position] == (
+                    key,
+                    entry.id,
+                ):
+                    del self.keys[position]
+        self.entries[entry.id] = entry
+        for key in entry.keys:
+            bisect.insort(self.keys, (key, entry.id))
+
+    def load(self) -> None:
+        """Build index from all cases and swap it in"""
+        now: datetime = timezone.now()
+        entries: dict[int, CaseLookupEntry] = {}
+        keys: list[tuple[str, int]] = []
+        for values in BaseCase.objects.values(*CASE_LOOKUP_FIELDS).iterator():
+            entry: CaseLookupEntry = build_case_lookup_entry(values)
+            entries[entry.id] = entry
+            keys.extend((key, entry.id) for key in entry.keys)
+        keys.sort()
+        with self.lock:
+            self.entries = entries
+            self.keys = keys
+            self.loaded = now
+            self.refreshed = now
+
+    def refresh(self) -> None:
+        """
+        Load index or add cases updated since it was last refreshed.
+
+        Only one thread reads cases at a time. Until the index is first loaded
+        other searches wait for it, after that they use the index as it is.
+        """
+        if not self.refresh_lock.acquire(blocking=self.loaded is None):
+            return
+        try:
+            now: datetime = timezone.now()
+            if self.loaded is None:
+                self.load()
+                return
+            if self.refreshed is not None and now - self.refreshed < (
+                CASE_LOOKUP_REFRESH_INTERVAL
+            ):
+                return
+            entries: list[CaseLookupEntry] = [
+                build_case_lookup_entry(values)
+                for values in BaseCase.objects.filter(
+                    updated__gte=self.refreshed - CASE_LOOKUP_REFRESH_INTERVAL
+                ).values(*CASE_LOOKUP_FIELDS)
+            ]
+            with self.lock:
+                for entry in entries:
+                    self.add(entry)
+                self.refreshed = now
+        finally:
+            self.refresh_lock.release()
+
+    def update(self, entry: CaseLookupEntry) -> None:
+        """Update saved case if index has been loaded"""
+        with self.lock:
+            if self.loaded is not None:
+                self.add(entry)
+
+    def search(
+        self, prefix: str, limit: int = CASE_LOOKUP_RESULTS_LIMIT
+    ) -> list[CaseLookupEntry]:
+        """Return cases with a key starting with prefix"""
+        prefix = " ".join(prefix.lower().split())
+        if len(prefix) < CASE_LOOKUP_MIN_LENGTH:
+            return []
+        self.refresh()
+        with self.lock:
+            case_ids: list[int] = []
+            position: int = bisect.bisect_left(self.keys, (prefix, 0))
+            while position < len(self.keys) and len(case_ids) < limit:
+                key, case_id = self.keys[position]
+                if not key.startswith(prefix):
+                    break
+                if case_id not in case_ids:
+                    case_ids.append(case_id)
+                position += 1
+            return [self.entries[case_id] for case_id in case_ids]
+
+
+def build_case_lookup_entry(values: dict) -> CaseLookupEntry:
+    """Create lookup entry from case values"""
+    return CaseLookupEntry(
+        id=values["id"],
+        case_identifier=values["case_identifier"],
+        organisation_name=values["organisation_name"],
+        domain=values["domain"],
+        test_type=values["test_type"],
+    )
+
+
+case_lookup_index: CaseLookupIndex = CaseLookupIndex()
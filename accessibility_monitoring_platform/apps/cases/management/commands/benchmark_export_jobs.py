@@ -0,0 +1,87 @@
+"""
+Time formatting of a background CSV export by number of chunks and workers.
+
+Every combination formats the same cases; The CSV content is checked to be
+identical to that of the first combination run.
+"""
+
+import hashlib
+import math
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...export_jobs import EXPORT_JOB_TEST_TYPES, generate_export_job_parts
+from ...models import ExportJob
+from ...utils import filter_cases, get_case_search_form
+
+
+def parse_counts(value: str) -> list[int]:
+    return [int(count) for count in value.split(",") if count.strip()]
+
+
+class Command(BaseCommand):
+    help = "Compare wall-clock time of formatting an export by chunk and worker count"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            choices=ExportJob.Type.values,
+            default=ExportJob.Type.SIMPLIFIED,
+            help="Type of export to format",
+        )
+        parser.add_argument(
+            "--chunks",
+            type=parse_counts,
+            default=[1, 4, 16, 64],
+            help="Comma separated numbers of chunks to split the cases into",
+        )
+        parser.add_argument(
+            "--workers",
+            type=parse_counts,
+            default=[1, 2, 4],
+            help="Comma separated numbers of worker processes",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Only export this many cases",
+        )
+
+    def handle(self, *args, **options):  # pylint: disable=unused-argument
+        case_ids: list[int] = list(
+            filter_cases(
+                form=get_case_search_form(
+                    parameters={"test_type": EXPORT_JOB_TEST_TYPES[options["type"]]}
+                )
+            ).values_list("id", flat=True)[: options["limit"]]
+        )
+        self.stdout.write(
+            f"Formatting {options['type']} export of {len(case_ids)} cases"
+        )
+        self.stdout.write(
+            f"{'Workers':>8}{'Chunks':>8}{'Chunk size':>12}{'Seconds':>10}"
+        )
+        expected_hash: str | None = None
+        for chunk_count in options["chunks"]:
+            chunk_size: int = max(math.ceil(len(case_ids) / chunk_count), 1)
+            chunks: list[list[int]] = [
+                case_ids[start : start + chunk_size]
+                for start in range(0, len(case_ids), chunk_size)
+            ] or [[]]
+            for workers in options["workers"]:
+                content_hash = hashlib.sha256()
+                start_time: float = time.perf_counter()
+                for content in generate_export_job_parts(
+                    export_type=options["type"], chunks=chunks, workers=workers
+                ):
+                    content_hash.update(content.encode("utf-8"))
+                seconds: float = time.perf_counter() - start_time
+                self.stdout.write(
+                    f"{workers:>8}{len(chunks):>8}{chunk_size:>12}{seconds:>10.2f}"
+                )
+                if expected_hash is None:
+                    expected_hash = content_hash.hexdigest()
+                elif content_hash.hexdigest() != expected_hash:
+                    self.stderr.write("CSV content differs from first run")
@@ -0,0 +1,51 @@
+"""Command to run queued background CSV exports"""
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...export_jobs import run_export_jobs
+
+DEFAULT_POLL_INTERVAL_SECONDS: int = 10
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Write queued case exports to S3, polling for new jobs unless --once"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the export jobs waiting now and then exit",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=int,
+            default=DEFAULT_POLL_INTERVAL_SECONDS,
+            help="Seconds to wait between checks for new export jobs",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes to format chunks of each export in concurrently",
+        )
+
+    def handle(self, *args, **options):  # pylint: disable=unused-argument
+        while True:
+            try:
+                jobs_run: int = run_export_jobs(workers=options["workers"])
+                if jobs_run:
+                    self.stdout.write(f"Ran {jobs_run} export jobs")
+            except Exception:  # pylint: disable=broad-exception-caught
+                if options["once"]:
+                    raise
+                logger.exception("Running export jobs failed")
+                close_old_connections()
+            if options["once"]:
+                return
+            time.sleep(options["poll_interval"])
@@ -0,0 +1,81 @@
+# Generated by Django 6.0.7 on 2026-10-19 05:02
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+SEARCH_DOCUMENT_SEPARATOR: str = "\n"
+BATCH_SIZE: int = 500
+
+
+def populate_search_document(apps, schema_editor):
+    BaseCase = apps.get_model("cases", "BaseCase")
+    MobileCase = apps.get_model("mobile", "MobileCase")
+
+    mobile_values: dict[int, list[str]] = {
+        mobile_case.id: [
+            mobile_case.app_name,
+            mobile_case.android_app_url,
+            mobile_case.ios_app_url,
+        ]
+        for mobile_case in MobileCase.objects.only(
+            "id", "app_name", "android_app_url", "ios_app_url"
+        )
+    }
+    base_cases = []
+    for base_case in BaseCase.objects.select_related("sector", "subcategory"):
+        values: list[str] = [
+            base_case.organisation_name,
+            base_case.home_page_url,
+            base_case.psb_location,
+            base_case.sector.name if base_case.sector is not None else "",
+            base_case.parental_organisation_name,
+            base_case.website_name,
+            base_case.subcategory.name if base_case.subcategory is not None else "",
+        ] + mobile_values.get(base_case.id, [])
+        base_case.search_document = SEARCH_DOCUMENT_SEPARATOR.join(
+            value for value in values if value
+        ).lower()
+        base_cases.append(base_case)
+    BaseCase.objects.bulk_update(base_cases, ["search_document"], batch_size=BATCH_SIZE)
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS cases_basecase_search_vector_idx "
+        "ON cases_basecase USING gin "
+        "(to_tsvector('simple'::regconfig, COALESCE(search_document, '')))"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS cases_basecase_search_trgm_idx "
+        "ON cases_basecase USING gin (search_document gin_trgm_ops)"
+    )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS cases_basecase_search_vector_idx")
+    schema_editor.execute("DROP INDEX IF EXISTS cases_basecase_search_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cases", "0021_casefile"),
+        ("mobile", "0004_alter_mobilecasehistory_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="basecase",
+            name="search_document",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.RunPython(
+            populate_search_document, reverse_code=migrations.RunPython.noop
+        ),
+        TrigramExtension(),
+        migrations.RunPython(create_search_indexes, reverse_code=drop_search_indexes),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.7 on 2026-10-19 04:49
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+TRIGRAM_INDEXED_FIELDS: list[str] = ["organisation_name", "home_page_url"]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for field_name in TRIGRAM_INDEXED_FIELDS:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS cases_basecase_{field_name}_trgm_idx "
+            f"ON cases_basecase USING gin (UPPER({field_name}::text) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for field_name in TRIGRAM_INDEXED_FIELDS:
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS cases_basecase_{field_name}_trgm_idx"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cases", "0022_basecase_search_document"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="basecase",
+            name="domain",
+            field=models.TextField(blank=True, db_index=True, default=""),
+        ),
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, reverse_code=drop_trigram_indexes),
+    ]
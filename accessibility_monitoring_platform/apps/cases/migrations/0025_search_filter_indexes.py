@@ -0,0 +1,69 @@
+# Generated by Django 6.0.7 on 2026-10-19 05:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cases", "0024_savedsearch"),
+        ("common", "0016_add_update_email_templates"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="basecase",
+            index=models.Index(
+                fields=["status", "id"], name="cases_basec_status_c43ffc_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="basecase",
+            index=models.Index(
+                fields=["test_type", "status", "id"],
+                name="cases_basec_test_ty_38fc16_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="basecase",
+            index=models.Index(
+                fields=["auditor", "status", "id"],
+                name="cases_basec_auditor_0de877_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="basecase",
+            index=models.Index(
+                fields=["reviewer", "status", "id"],
+                name="cases_basec_reviewe_5661b8_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="basecase",
+            index=models.Index(
+                fields=["enforcement_body", "recommendation_for_enforcement", "id"],
+                name="cases_basec_enforce_0d4590_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="basecase",
+            index=models.Index(
+                fields=["is_complaint", "id"], name="cases_basec_is_comp_56bb2f_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="basecase",
+            index=models.Index(
+                fields=["updated_date", "id"], name="cases_basec_updated_438b30_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="basecase",
+            index=models.Index(
+                fields=["organisation_name", "id"],
+                name="cases_basec_organis_5e2fba_idx",
+            ),
+        ),
+    ]
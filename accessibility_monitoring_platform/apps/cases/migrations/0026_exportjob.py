@@ -0,0 +1,92 @@
+# Generated by Django 6.0.7 on 2026-10-19 05:31
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cases", "0025_search_filter_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExportJob",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("uuid", models.UUIDField(default=uuid.uuid4, editable=False)),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("simplified", "Simplified cases"),
+                            (
+                                "simplified_feedback_survey",
+                                "Simplified feedback survey",
+                            ),
+                            ("detailed", "Detailed cases"),
+                            ("detailed_feedback_survey", "Detailed feedback survey"),
+                            ("detailed_equality_body", "Detailed equality body"),
+                            ("mobile", "Mobile cases"),
+                            ("mobile_feedback_survey", "Mobile feedback survey"),
+                            ("mobile_equality_body", "Mobile equality body"),
+                        ],
+                        default="simplified",
+                        max_length=40,
+                    ),
+                ),
+                ("parameters", models.JSONField(default=dict)),
+                ("parameters_hash", models.CharField(db_index=True, max_length=64)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "Queued"),
+                            ("running", "Running"),
+                            ("complete", "Complete"),
+                            ("failed", "Failed"),
+                        ],
+                        default="queued",
+                        max_length=20,
+                    ),
+                ),
+                ("case_ids", models.JSONField(blank=True, null=True)),
+                ("cases_exported", models.IntegerField(default=0)),
+                ("parts_written", models.IntegerField(default=0)),
+                ("error", models.TextField(blank=True, default="")),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                ("completed", models.DateTimeField(blank=True, null=True)),
+                (
+                    "requested_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="export_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-id"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("status__in", ["queued", "running"])),
+                        fields=("type", "parameters_hash"),
+                        name="unique_active_export_job",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.7 on 2026-10-19 08:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cases", "0026_exportjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exportjob",
+            name="claim_token",
+            field=models.UUIDField(blank=True, null=True),
+        ),
+    ]
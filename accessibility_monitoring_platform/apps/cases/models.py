@@ -327,7 +327,7 @@ class BaseCase(VersionModel):
         max_length=10, choices=TestType.choices, default=TestType.SIMPLIFIED
     )
     home_page_url = models.TextField(default="", blank=True)
-    domain = models.TextField(default="", blank=True)
+    domain = models.TextField(default="", blank=True, db_index=True)
 
     organisation_name = models.TextField(default="", blank=True)
     psb_location = models.CharField(
@@ -368,9 +368,22 @@ class BaseCase(VersionModel):
         choices=RecommendationForEnforcement.choices,
         default=RecommendationForEnforcement.UNKNOWN,
     )
+    search_document = models.TextField(default="", blank=True)
 
     class Meta:
         ordering = ["-id"]
+        indexes = [
+            models.Index(fields=["status", "id"]),
+            models.Index(fields=["test_type", "status", "id"]),
+            models.Index(fields=["auditor", "status", "id"]),
+            models.Index(fields=["reviewer", "status", "id"]),
+            models.Index(
+                fields=["enforcement_body", "recommendation_for_enforcement", "id"]
+            ),
+            models.Index(fields=["is_complaint", "id"]),
+            models.Index(fields=["updated_date", "id"]),
+            models.Index(fields=["organisation_name", "id"]),
+        ]
 
     def __str__(self) -> str:
         if self.organisation_name:
@@ -509,3 +522,104 @@ class CaseFile(models.Model):
     @property
     def s3_key(self) -> str:
         return f"base_cases/{self.base_case.id}/{self.name} {self.uuid}"
+
+
+class SavedSearch(models.Model):
+    """Case search saved by a user with its cached matching case ids"""
+
+    user = models.ForeignKey(
+        User, on_delete=models.PROTECT, related_name="saved_searches"
+    )
+    name = models.CharField(max_length=200, default="", blank=True)
+    parameters = models.JSONField(default=dict)
+    parameters_hash = models.CharField(max_length=64, db_index=True)
+    case_ids = models.JSONField(null=True, blank=True)
+    cached = models.DateTimeField(null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering: list[str] = ["name", "id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "parameters_hash"],
+                name="unique_saved_search_per_user",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.name
+
+    def get_absolute_url(self) -> str:
+        return f"{reverse('cases:case-list')}?saved_search={self.id}"
+
+
+class ExportJob(models.Model):
+    """CSV export of a case search written to S3 in parts by a background worker"""
+
+    class Type(models.TextChoices):
+        SIMPLIFIED = "simplified", "Simplified cases"
+        SIMPLIFIED_FEEDBACK_SURVEY = (
+            "simplified_feedback_survey",
+            "Simplified feedback survey",
+        )
+        DETAILED = "detailed", "Detailed cases"
+        DETAILED_FEEDBACK_SURVEY = (
+            "detailed_feedback_survey",
+            "Detailed feedback survey",
+        )
+        DETAILED_EQUALITY_BODY = "detailed_equality_body", "Detailed equality body"
+        MOBILE = "mobile", "Mobile cases"
+        MOBILE_FEEDBACK_SURVEY = "mobile_feedback_survey", "Mobile feedback survey"
+        MOBILE_EQUALITY_BODY = "mobile_equality_body", "Mobile equality body"
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        COMPLETE = "complete", "Complete"
+        FAILED = "failed", "Failed"
+
+    ACTIVE_STATUSES: list[str] = [Status.QUEUED, Status.RUNNING]
+
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False)
+    type = models.CharField(max_length=40, choices=Type, default=Type.SIMPLIFIED)
+    parameters = models.JSONField(default=dict)
+    parameters_hash = models.CharField(max_length=64, db_index=True)
+    requested_by = models.ForeignKey(
+        User, on_delete=models.PROTECT, related_name="export_jobs"
+    )
+    status = models.CharField(max_length=20, choices=Status, default=Status.QUEUED)
+    claim_token = models.UUIDField(null=True, blank=True)
+    case_ids = models.JSONField(null=True, blank=True)
+    cases_exported = models.IntegerField(default=0)
+    parts_written = models.IntegerField(default=0)
+    error = models.TextField(default="", blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+    completed = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering: list[str] = ["-id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["type", "parameters_hash"],
+                condition=models.Q(status__in=["queued", "running"]),
+                name="unique_active_export_job",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_type_display()} CSV export #{self.id}"
+
+    def get_absolute_url(self) -> str:
+        return reverse("cases:export-job-detail", kwargs={"pk": self.id})
+
+    @property
+    def filename(self) -> str:
+        return f"{self.type}_cases.csv"
+
+    @property
+    def total_cases(self) -> int | None:
+        return None if self.case_ids is None else len(self.case_ids)
+
+    def get_part_s3_key(self, part: int) -> str:
+        return f"export_jobs/{self.uuid}/part-{part:05d}.csv"
@@ -0,0 +1,96 @@
+"""
+Signal receivers for cases app
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from ..common.models import Sector, SubCategory
+from ..detailed.models import DetailedCase
+from ..mobile.models import MobileCase
+from ..simplified.models import SimplifiedCase
+from .lookup_utils import CASE_LOOKUP_FIELDS, build_case_lookup_entry, case_lookup_index
+from .models import BaseCase
+from .utils import (
+    SEARCH_DOCUMENT_FIELDS,
+    invalidate_saved_search_results,
+    update_search_documents,
+)
+
+
+@receiver(post_save, sender=SimplifiedCase)
+@receiver(post_save, sender=DetailedCase)
+@receiver(post_save, sender=MobileCase)
+def update_case_search_document(
+    sender: type[BaseCase],
+    instance: BaseCase,
+    update_fields: frozenset[str] | None = None,
+    **kwargs  # pylint: disable=unused-argument
+) -> None:
+    """
+    Rebuild search document of case on save, before saved searches are
+    matched against it, unless only fields outside the search were saved
+    """
+    if update_fields is None or not update_fields.isdisjoint(SEARCH_DOCUMENT_FIELDS):
+        update_search_documents(cases=BaseCase.objects.filter(id=instance.id))
+
+
+@receiver(post_save, sender=SimplifiedCase)
+@receiver(post_save, sender=DetailedCase)
+@receiver(post_save, sender=MobileCase)
+def invalidate_saved_searches(
+    sender: type[BaseCase],
+    instance: BaseCase,
+    **kwargs  # pylint: disable=unused-argument
+) -> None:
+    """Discard cached results of saved searches matching the case on case save"""
+    invalidate_saved_search_results(base_case=instance)
+
+
+@receiver(post_save, sender=SimplifiedCase)
+@receiver(post_save, sender=DetailedCase)
+@receiver(post_save, sender=MobileCase)
+def update_case_lookup_index(
+    sender: type[BaseCase],
+    instance: BaseCase,
+    **kwargs  # pylint: disable=unused-argument
+) -> None:
+    """Update case lookup index of this process once case save is committed"""
+    transaction.on_commit(
+        partial(
+            case_lookup_index.update,
+            entry=build_case_lookup_entry(
+                {
+                    field_name: getattr(instance, field_name)
+                    for field_name in CASE_LOOKUP_FIELDS
+                }
+            ),
+        )
+    )
+
+
+@receiver(post_save, sender=Sector)
+def update_sector_case_search_documents(
+    sender: type,
+    instance: Sector,
+    created: bool,
+    **kwargs  # pylint: disable=unused-argument
+) -> None:
+    """Rebuild search documents of cases in sector when it is renamed"""
+    if not created:
+        update_search_documents(cases=BaseCase.objects.filter(sector=instance))
+
+
+@receiver(post_save, sender=SubCategory)
+def update_subcategory_case_search_documents(
+    sender: type,
+    instance: SubCategory,
+    created: bool,
+    **kwargs  # pylint: disable=unused-argument
+) -> None:
+    """Rebuild search documents of cases in subcategory when it is renamed"""
+    if not created:
+        update_search_documents(cases=BaseCase.objects.filter(subcategory=instance))
@@ -1,26 +1,54 @@
 """Test utility functions of cases CSV export"""
 
+import gc
+import gzip
+import tracemalloc
 from typing import Generator
+from unittest.mock import patch
 
 import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
 
+from ...audits.models import WcagCheckResultInitial, WcagPageInitial
 from ...audits.tests.create_test_data import (
     create_simplified_case_with_initial_and_12_week_audits,
 )
-from ...common.csv_export import CSVColumn, EqualityBodyCSVColumn
+from ...common.csv_export import (
+    INITIAL_STATEMENT_AUDIT,
+    INITIAL_WCAG_AUDIT,
+    TWELVE_WEEK_STATEMENT_AUDIT,
+    TWELVE_WEEK_WCAG_AUDIT,
+    CSVColumn,
+    EqualityBodyCSVColumn,
+)
 from ...detailed.csv_export import DETAILED_CASE_COLUMNS_FOR_EXPORT
+from ...detailed.models import Contact as DetailedContact
 from ...detailed.models import DetailedCase
+from ...mobile.models import MobileCase, MobileContact
+from ...reports.models import Report
+from ...s3_read_write.models import S3Report
 from ...simplified.csv_export import (
     SIMPLIFIED_CASE_COLUMNS_FOR_EXPORT,
+    SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT,
+    SIMPLIFIED_EQUALITY_BODY_REPORT_COLUMNS_FOR_EXPORT,
     SIMPLIFIED_FEEDBACK_SURVEY_COLUMNS_FOR_EXPORT,
 )
 from ...simplified.models import Contact as SimplifiedContact
 from ...simplified.models import SimplifiedCase
 from ..csv_export import (
+    build_equality_body_columns,
     csv_output_generator,
+    csv_streaming_response,
+    get_audit_source_instances,
+    get_check_results_updated,
+    get_equality_body_row,
+    get_equality_body_source_instances,
+    load_export_cases,
     populate_csv_columns,
     populate_equality_body_columns,
 )
+from ..models import BaseCase
 
 SIMPLIFIED_CONTACT_NOTES: str = "Simplified contact notes"
 SIMPLIFIED_CONTACT_EMAIL: str = "simplified@example.com"
@@ -55,6 +83,9 @@ def test_populate_csv_columns_simplified():
     contact_email_cell: CSVColumn = contact_email[0]
 
     assert contact_email_cell.formatted_data == SIMPLIFIED_CONTACT_EMAIL
+    assert all(
+        column.formatted_data == "" for column in SIMPLIFIED_CASE_COLUMNS_FOR_EXPORT
+    )
 
 
 @pytest.mark.django_db
@@ -163,3 +194,361 @@ def test_populate_equality_body_columns():
         organisation_responded_cell.edit_url
         == "/simplified/1/edit-report-acknowledged/#id_report_acknowledged_date-label"
     )
+
+
+@pytest.mark.django_db
+def test_populate_equality_body_columns_cached():
+    """
+    Test equality body columns are cached for the case and shared between
+    groups of columns until the case or its contacts change
+    """
+    cache.clear()
+    simplified_case: SimplifiedCase = (
+        create_simplified_case_with_initial_and_12_week_audits()
+    )
+    contact: SimplifiedContact = SimplifiedContact.objects.create(
+        simplified_case=simplified_case, email=SIMPLIFIED_CONTACT_EMAIL
+    )
+
+    with patch("accessibility_monitoring_platform.apps.cases.csv_export.reverse") as (
+        mock_reverse
+    ):
+        mock_reverse.return_value = "/edit/"
+        populate_equality_body_columns(case=simplified_case)
+
+        assert mock_reverse.call_count > 0
+
+        mock_reverse.reset_mock()
+        report_columns: list[EqualityBodyCSVColumn] = populate_equality_body_columns(
+            case=simplified_case,
+            column_definitions=SIMPLIFIED_EQUALITY_BODY_REPORT_COLUMNS_FOR_EXPORT,
+        )
+
+        mock_reverse.assert_not_called()
+        assert [column.column_header for column in report_columns] == [
+            column.column_header
+            for column in SIMPLIFIED_EQUALITY_BODY_REPORT_COLUMNS_FOR_EXPORT
+        ]
+
+        contact.email = "changed@example.com"
+        contact.save()
+        columns: list[EqualityBodyCSVColumn] = populate_equality_body_columns(
+            case=simplified_case
+        )
+
+        assert mock_reverse.call_count > 0
+        assert "changed@example.com\n" in [column.formatted_data for column in columns]
+
+        mock_reverse.reset_mock()
+        simplified_case.recommendation_notes = "Changed notes"
+        simplified_case.save()
+        columns: list[EqualityBodyCSVColumn] = populate_equality_body_columns(
+            case=simplified_case
+        )
+
+        assert mock_reverse.call_count > 0
+        assert "Changed notes" in [column.formatted_data for column in columns]
+
+
+@pytest.mark.django_db
+def test_cached_equality_body_columns_match_uncached():
+    """Test cached equality body columns are the same as building them again"""
+    cache.clear()
+    simplified_case: SimplifiedCase = (
+        create_simplified_case_with_initial_and_12_week_audits()
+    )
+    SimplifiedContact.objects.create(
+        simplified_case=simplified_case, email=SIMPLIFIED_CONTACT_EMAIL
+    )
+    populate_equality_body_columns(case=simplified_case)
+
+    assert populate_equality_body_columns(
+        case=simplified_case
+    ) == build_equality_body_columns(
+        source_instances=get_equality_body_source_instances(case=simplified_case),
+        column_definitions=SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT,
+    )
+
+
+@pytest.mark.django_db
+def test_cached_equality_body_row_changes_when_check_result_changes():
+    """
+    Test the cached equality body row of a case is formatted again when one
+    of its check results is edited or its report is published
+    """
+    cache.clear()
+    simplified_case: SimplifiedCase = (
+        create_simplified_case_with_initial_and_12_week_audits()
+    )
+    total_website_issues_index: int = [
+        column.column_header for column in SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT
+    ].index("Total number of accessibility issues")
+    published_report_index: int = [
+        column.column_header for column in SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT
+    ].index("Published report")
+    row: list[str] = get_equality_body_row(case=simplified_case)
+
+    assert row[total_website_issues_index] == simplified_case.total_website_issues
+    assert row[published_report_index] == ""
+
+    wcag_check_result_initial: WcagCheckResultInitial = (
+        WcagCheckResultInitial.objects.filter(
+            wcag_audit__simplified_case=simplified_case,
+            wcag_page_initial__page_type=WcagPageInitial.Type.HOME,
+        ).first()
+    )
+    wcag_check_result_initial.check_result_state = WcagCheckResultInitial.Result.ERROR
+    wcag_check_result_initial.save()
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.get(id=simplified_case.id)
+    changed_row: list[str] = get_equality_body_row(case=simplified_case)
+
+    assert (
+        changed_row[total_website_issues_index] == row[total_website_issues_index] + 1
+    )
+
+    Report.objects.create(base_case=simplified_case)
+    S3Report.objects.create(
+        base_case=simplified_case, version=0, latest_published=True, guid="guid"
+    )
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.get(id=simplified_case.id)
+
+    assert get_equality_body_row(case=simplified_case)[published_report_index].endswith(
+        "/reports/guid"
+    )
+
+
+@pytest.mark.django_db
+def test_get_check_results_updated_from_export_annotations(
+    django_assert_num_queries,
+):
+    """
+    Test the latest check result update times of cases loaded for export come
+    from annotations and match those looked up for a single case
+    """
+    create_simplified_case_with_initial_and_12_week_audits()
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.get()
+    loaded_case: SimplifiedCase = next(load_export_cases(cases=BaseCase.objects.all()))
+
+    with django_assert_num_queries(0):
+        check_results_updated: list = get_check_results_updated(case=loaded_case)
+
+    assert all(updated is not None for updated in check_results_updated)
+    assert check_results_updated == get_check_results_updated(case=simplified_case)
+
+    wcag_check_result_initial: WcagCheckResultInitial = (
+        WcagCheckResultInitial.objects.filter(
+            wcag_audit__simplified_case=simplified_case
+        ).first()
+    )
+    wcag_check_result_initial.save()
+    loaded_case: SimplifiedCase = next(load_export_cases(cases=BaseCase.objects.all()))
+
+    assert get_check_results_updated(case=loaded_case) != check_results_updated
+
+
+def create_cases_of_each_test_type() -> None:
+    """Create a simplified, detailed and mobile case with contacts and audits"""
+    simplified_case: SimplifiedCase = (
+        create_simplified_case_with_initial_and_12_week_audits()
+    )
+    SimplifiedContact.objects.create(
+        simplified_case=simplified_case, email=SIMPLIFIED_CONTACT_EMAIL
+    )
+    Report.objects.create(base_case=simplified_case)
+    user: User = User.objects.create(username=f"user{User.objects.count()}")
+    detailed_case: DetailedCase = DetailedCase.objects.create()
+    DetailedContact.objects.create(
+        detailed_case=detailed_case, name=DETAILED_CONTACT_NAME, created_by=user
+    )
+    mobile_case: MobileCase = MobileCase.objects.create()
+    MobileContact.objects.create(
+        mobile_case=mobile_case, name=DETAILED_CONTACT_NAME, created_by=user
+    )
+
+
+def count_load_export_cases_queries(django_assert_max_num_queries) -> int:
+    """Load all cases for export and return the number of queries run"""
+    with django_assert_max_num_queries(100) as captured:
+        list(load_export_cases(cases=BaseCase.objects.all()))
+    return len(captured.captured_queries)
+
+
+@pytest.mark.django_db
+def test_load_export_cases():
+    """Test concrete cases are loaded in the order of the cases passed"""
+    create_cases_of_each_test_type()
+    base_cases: list[BaseCase] = list(BaseCase.objects.order_by("id"))
+
+    loaded_cases: list[SimplifiedCase | DetailedCase | MobileCase] = list(
+        load_export_cases(cases=BaseCase.objects.order_by("id"), chunk_size=2)
+    )
+
+    assert [type(case) for case in loaded_cases] == [
+        SimplifiedCase,
+        DetailedCase,
+        MobileCase,
+    ]
+    assert [case.id for case in loaded_cases] == [case.id for case in base_cases]
+    assert len(loaded_cases[0].export_contacts) == 1
+    assert len(loaded_cases[0].export_reports) == 1
+    assert len(loaded_cases[1].export_contacts) == 1
+    assert len(loaded_cases[2].export_contacts) == 1
+
+
+@pytest.mark.django_db
+def test_load_export_cases_skips_deleted_cases():
+    """Test cases deleted since they were listed are left out of the export"""
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name="Kept"
+    )
+    deleted_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name="Deleted"
+    )
+    cases: list[SimplifiedCase] = [simplified_case, deleted_case]
+    deleted_case.delete()
+
+    assert list(load_export_cases(cases=cases)) == [simplified_case]
+
+    csv_content: str = "".join(
+        csv_output_generator(
+            cases=cases, columns_for_export=SIMPLIFIED_CASE_COLUMNS_FOR_EXPORT
+        )
+    )
+
+    assert "Kept" in csv_content
+    assert "Deleted" not in csv_content
+
+
+@pytest.mark.django_db
+def test_load_export_cases_queries_do_not_grow_with_cases(
+    django_assert_max_num_queries,
+):
+    """Test number of queries depends on chunks rather than cases"""
+    create_cases_of_each_test_type()
+    number_of_queries: int = count_load_export_cases_queries(
+        django_assert_max_num_queries
+    )
+
+    create_cases_of_each_test_type()
+    create_cases_of_each_test_type()
+
+    assert (
+        count_load_export_cases_queries(django_assert_max_num_queries)
+        == number_of_queries
+    )
+
+
+@pytest.mark.django_db
+def test_get_audit_source_instances_prefetched():
+    """Test prefetched audits match those found by the audit overview"""
+    create_simplified_case_with_initial_and_12_week_audits()
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.get()
+    loaded_case: SimplifiedCase = next(load_export_cases(cases=BaseCase.objects.all()))
+
+    prefetched_audits = get_audit_source_instances(case=loaded_case)
+
+    assert prefetched_audits == get_audit_source_instances(case=simplified_case)
+    for audit_key in [
+        INITIAL_WCAG_AUDIT,
+        TWELVE_WEEK_WCAG_AUDIT,
+        INITIAL_STATEMENT_AUDIT,
+        TWELVE_WEEK_STATEMENT_AUDIT,
+    ]:
+        assert prefetched_audits[audit_key] is not None
+
+
+@pytest.mark.django_db
+def test_populate_columns_same_for_loaded_cases():
+    """Test exported data is unchanged by loading cases for export"""
+    create_cases_of_each_test_type()
+
+    for loaded_case in load_export_cases(cases=BaseCase.objects.all()):
+        case: SimplifiedCase | DetailedCase | MobileCase = BaseCase.objects.get(
+            id=loaded_case.id
+        ).get_case()
+        column_definitions: list[CSVColumn] = (
+            SIMPLIFIED_CASE_COLUMNS_FOR_EXPORT
+            if isinstance(case, SimplifiedCase)
+            else DETAILED_CASE_COLUMNS_FOR_EXPORT
+        )
+
+        assert [
+            column.formatted_data
+            for column in populate_csv_columns(
+                case=loaded_case, column_definitions=column_definitions
+            )
+        ] == [
+            column.formatted_data
+            for column in populate_csv_columns(
+                case=case, column_definitions=column_definitions
+            )
+        ]
+
+        if isinstance(case, SimplifiedCase):
+            assert [
+                column.formatted_data
+                for column in populate_equality_body_columns(case=loaded_case)
+            ] == [
+                column.formatted_data
+                for column in populate_equality_body_columns(case=case)
+            ]
+
+
+def get_peak_export_memory() -> int:
+    """
+    Export all cases, collecting garbage as each chunk of the CSV is streamed,
+    and return the peak memory allocated while doing so
+    """
+    gc.collect()
+    tracemalloc.start()
+    for _ in csv_output_generator(
+        cases=BaseCase.objects.order_by("id"),
+        columns_for_export=SIMPLIFIED_CASE_COLUMNS_FOR_EXPORT,
+    ):
+        gc.collect()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_memory
+
+
+@pytest.mark.django_db
+def test_csv_output_generator_memory_does_not_grow_with_cases():
+    """Test only a chunk of cases is held in memory at any time during export"""
+    for _ in range(40):
+        SimplifiedCase.objects.create(organisation_name="Organisation")
+
+    with patch(
+        "accessibility_monitoring_platform.apps.cases.csv_export.DOWNLOAD_CASES_CHUNK_SIZE",
+        20,
+    ):
+        get_peak_export_memory()
+        peak_memory: int = get_peak_export_memory()
+
+        for _ in range(160):
+            SimplifiedCase.objects.create(organisation_name="Organisation")
+
+        assert get_peak_export_memory() < peak_memory * 1.5
+
+
+def test_csv_streaming_response():
+    """Test CSV is streamed as a download"""
+    response = csv_streaming_response(
+        output_generator=iter(["a,b\r\n", "1,2\r\n"]), filename="cases.csv"
+    )
+
+    assert response["Content-Type"] == "text/csv"
+    assert response["Content-Disposition"] == "attachment; filename=cases.csv"
+    assert b"".join(response.streaming_content) == b"a,b\r\n1,2\r\n"
+
+
+def test_csv_streaming_response_compressed():
+    """Test CSV is streamed as a gzip compressed download"""
+    response = csv_streaming_response(
+        output_generator=iter(["a,b\r\n", "1,2\r\n"]),
+        filename="cases.csv",
+        compress=True,
+    )
+
+    assert response["Content-Type"] == "application/gzip"
+    assert response["Content-Disposition"] == "attachment; filename=cases.csv.gz"
+    assert gzip.decompress(b"".join(response.streaming_content)) == b"a,b\r\n1,2\r\n"
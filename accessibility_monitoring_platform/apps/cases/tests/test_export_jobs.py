@@ -0,0 +1,417 @@
+"""
+Tests for background CSV export jobs
+"""
+
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.utils import timezone
+from moto import mock_aws
+
+from ...detailed.models import DetailedCase
+from ...simplified.models import SimplifiedCase
+from ..export_jobs import (
+    ExportJobClaimLost,
+    S3ReadWriteExportJob,
+    claim_export_job,
+    export_job_output_generator,
+    get_export_job_chunks,
+    ordered_parallel_map,
+    request_export_job,
+    run_export_job,
+    run_export_jobs,
+)
+from ..forms import CaseSearchForm
+from ..models import ExportJob
+
+
+def get_case_search_form(**data) -> CaseSearchForm:
+    """Return validated case search form"""
+    form: CaseSearchForm = CaseSearchForm(data)
+    form.is_valid()
+    return form
+
+
+def get_export_job_csv(export_job: ExportJob) -> str:
+    return "".join(export_job_output_generator(export_job=export_job))
+
+
+@pytest.mark.django_db
+def test_request_export_job_deduplicates_active_jobs():
+    """Test identical export requests share a queued job"""
+    user: User = User.objects.create(username="one")
+    other_user: User = User.objects.create(username="two")
+
+    export_job: ExportJob = request_export_job(
+        export_type=ExportJob.Type.SIMPLIFIED,
+        case_search_form=get_case_search_form(case_search=" Org "),
+        user=user,
+    )
+
+    assert export_job.parameters == {"case_search": "Org", "test_type": "simplified"}
+    assert (
+        request_export_job(
+            export_type=ExportJob.Type.SIMPLIFIED,
+            case_search_form=get_case_search_form(case_search="Org"),
+            user=other_user,
+        )
+        == export_job
+    )
+    assert (
+        request_export_job(
+            export_type=ExportJob.Type.SIMPLIFIED_FEEDBACK_SURVEY,
+            case_search_form=get_case_search_form(case_search="Org"),
+            user=user,
+        )
+        != export_job
+    )
+
+    export_job.status = ExportJob.Status.COMPLETE
+    export_job.save()
+
+    assert (
+        request_export_job(
+            export_type=ExportJob.Type.SIMPLIFIED,
+            case_search_form=get_case_search_form(case_search="Org"),
+            user=user,
+        )
+        != export_job
+    )
+
+
+@pytest.mark.django_db
+def test_claim_export_job():
+    """Test queued and abandoned jobs are claimed once"""
+    user: User = User.objects.create()
+    running_export_job: ExportJob = ExportJob.objects.create(
+        requested_by=user, parameters_hash="a", status=ExportJob.Status.RUNNING
+    )
+    queued_export_job: ExportJob = ExportJob.objects.create(
+        requested_by=user, parameters_hash="b"
+    )
+
+    assert claim_export_job() == queued_export_job
+    assert claim_export_job() is None
+
+    ExportJob.objects.filter(id=running_export_job.id).update(
+        updated=timezone.now() - timedelta(hours=1)
+    )
+
+    assert claim_export_job() == running_export_job
+
+
+@pytest.mark.django_db
+def test_claim_export_job_sets_new_claim_token():
+    """Test each claim of a job gives it a new claim token"""
+    ExportJob.objects.create(requested_by=User.objects.create(), parameters_hash="a")
+    export_job: ExportJob = claim_export_job()
+
+    assert export_job.claim_token is not None
+
+    ExportJob.objects.filter(id=export_job.id).update(
+        updated=timezone.now() - timedelta(hours=1)
+    )
+    reclaimed_export_job: ExportJob = claim_export_job()
+
+    assert reclaimed_export_job == export_job
+    assert reclaimed_export_job.claim_token != export_job.claim_token
+
+
+@pytest.mark.django_db
+@mock_aws
+def test_run_export_job_stops_when_claimed_by_another_worker():
+    """
+    Test a worker whose export job has been claimed by another worker stops
+    without recording progress over that of the other worker
+    """
+    for organisation_name in ["Org A", "Org B", "Org C"]:
+        SimplifiedCase.objects.create(organisation_name=organisation_name)
+    request_export_job(
+        export_type=ExportJob.Type.SIMPLIFIED,
+        case_search_form=get_case_search_form(sort_by="id"),
+        user=User.objects.create(),
+    )
+    export_job: ExportJob = claim_export_job()
+    ExportJob.objects.filter(id=export_job.id).update(claim_token=uuid.uuid4())
+
+    with pytest.raises(ExportJobClaimLost):
+        run_export_job(export_job=export_job, chunk_size=2)
+
+    export_job.refresh_from_db()
+
+    assert export_job.status == ExportJob.Status.RUNNING
+    assert export_job.case_ids is None
+    assert export_job.parts_written == 0
+
+
+@pytest.mark.django_db
+@mock_aws
+def test_run_export_jobs_does_not_fail_job_claimed_by_another_worker():
+    """Test an export job taken over by another worker is not marked as failed"""
+    export_job: ExportJob = ExportJob.objects.create(
+        requested_by=User.objects.create(),
+        parameters_hash="a",
+        parameters={"test_type": "simplified"},
+    )
+
+    with patch(
+        "accessibility_monitoring_platform.apps.cases.export_jobs.run_export_job",
+        side_effect=ExportJobClaimLost,
+    ):
+        assert run_export_jobs() == 1
+
+    export_job.refresh_from_db()
+
+    assert export_job.status == ExportJob.Status.RUNNING
+    assert export_job.error == ""
+
+
+@pytest.mark.django_db
+@mock_aws
+def test_run_export_job_writes_csv_in_parts():
+    """Test export is written to S3 one part per chunk of cases"""
+    user: User = User.objects.create()
+    for organisation_name in ["Org A", "Org B", "Org C"]:
+        SimplifiedCase.objects.create(organisation_name=organisation_name)
+    DetailedCase.objects.create(organisation_name="Org D")
+    export_job: ExportJob = request_export_job(
+        export_type=ExportJob.Type.SIMPLIFIED,
+        case_search_form=get_case_search_form(sort_by="id"),
+        user=user,
+    )
+
+    run_export_job(export_job=export_job, chunk_size=2)
+
+    export_job.refresh_from_db()
+
+    assert export_job.status == ExportJob.Status.COMPLETE
+    assert export_job.completed is not None
+    assert export_job.total_cases == 3
+    assert export_job.cases_exported == 3
+    assert export_job.parts_written == 2
+
+    csv_lines: list[str] = get_export_job_csv(export_job=export_job).splitlines()
+
+    assert len(csv_lines) == 4
+    assert csv_lines[0].startswith("Case no.")
+    assert "Org A" in csv_lines[1]
+    assert "Org C" in csv_lines[3]
+
+
+@pytest.mark.django_db
+@mock_aws
+def test_run_export_job_resumes_from_checkpoint():
+    """Test interrupted export carries on from the last part written"""
+    user: User = User.objects.create()
+    for organisation_name in ["Org A", "Org B", "Org C"]:
+        SimplifiedCase.objects.create(organisation_name=organisation_name)
+    export_job: ExportJob = request_export_job(
+        export_type=ExportJob.Type.SIMPLIFIED,
+        case_search_form=get_case_search_form(sort_by="id"),
+        user=user,
+    )
+    complete_export_job: ExportJob = ExportJob.objects.get(id=export_job.id)
+    run_export_job(export_job=complete_export_job, chunk_size=2)
+    ExportJob.objects.filter(id=export_job.id).update(
+        status=ExportJob.Status.RUNNING, cases_exported=2, parts_written=1
+    )
+    export_job.refresh_from_db()
+    s3_read_write: S3ReadWriteExportJob = S3ReadWriteExportJob()
+    s3_read_write.write_export_job_part_to_s3(
+        export_job=export_job, part=2, content="stale\n"
+    )
+
+    run_export_job(export_job=export_job, s3_read_write=s3_read_write, chunk_size=2)
+
+    csv_lines: list[str] = get_export_job_csv(export_job=export_job).splitlines()
+
+    assert len(csv_lines) == 4
+    assert "stale" not in csv_lines
+    assert "Org C" in csv_lines[3]
+
+
+@pytest.mark.django_db
+@mock_aws
+def test_run_export_job_with_no_cases_writes_header():
+    """Test export of a search with no results contains the header row"""
+    export_job: ExportJob = request_export_job(
+        export_type=ExportJob.Type.MOBILE_EQUALITY_BODY,
+        case_search_form=get_case_search_form(),
+        user=User.objects.create(),
+    )
+
+    run_export_job(export_job=export_job)
+
+    assert export_job.parts_written == 1
+    assert get_export_job_csv(export_job=export_job).count("\n") == 1
+
+
+@pytest.mark.django_db
+@mock_aws
+def test_run_export_jobs_records_failure():
+    """Test failed export is marked as failed and other jobs still run"""
+    user: User = User.objects.create()
+    failing_export_job: ExportJob = ExportJob.objects.create(
+        requested_by=user, parameters_hash="a", type="unknown"
+    )
+    export_job: ExportJob = ExportJob.objects.create(
+        requested_by=user, parameters_hash="b", parameters={"test_type": "simplified"}
+    )
+
+    assert run_export_jobs() == 2
+
+    failing_export_job.refresh_from_db()
+    export_job.refresh_from_db()
+
+    assert failing_export_job.status == ExportJob.Status.FAILED
+    assert failing_export_job.error == "'unknown'"
+    assert export_job.status == ExportJob.Status.COMPLETE
+
+
+@pytest.mark.django_db
+@mock_aws
+def test_run_export_jobs_command():
+    """Test management command runs queued export jobs"""
+    SimplifiedCase.objects.create()
+    export_job: ExportJob = ExportJob.objects.create(
+        requested_by=User.objects.create(),
+        parameters_hash="a",
+        parameters={"test_type": "simplified"},
+    )
+
+    call_command("run_export_jobs", "--once")
+
+    export_job.refresh_from_db()
+
+    assert export_job.status == ExportJob.Status.COMPLETE
+    assert export_job.cases_exported == 1
+
+
+@pytest.mark.django_db
+def test_run_export_jobs_command_keeps_polling_after_error(caplog):
+    """Test management command logs a failure to run export jobs and carries on"""
+    stdout: StringIO = StringIO()
+
+    with (
+        patch(
+            "accessibility_monitoring_platform.apps.cases.management.commands.run_export_jobs.run_export_jobs",
+            side_effect=[ValueError("Database unavailable"), 2],
+        ) as mock_run_export_jobs,
+        patch(
+            "accessibility_monitoring_platform.apps.cases.management.commands.run_export_jobs.time.sleep",
+            side_effect=[None, KeyboardInterrupt],
+        ),
+        pytest.raises(KeyboardInterrupt),
+    ):
+        call_command("run_export_jobs", stdout=stdout)
+
+    assert mock_run_export_jobs.call_count == 2
+    assert "Running export jobs failed" in caplog.text
+    assert "Database unavailable" in caplog.text
+    assert stdout.getvalue() == "Ran 2 export jobs\n"
+
+
+@pytest.mark.django_db
+def test_get_export_job_chunks():
+    """Test cases still to export are split into chunks"""
+    export_job: ExportJob = ExportJob(cases_exported=0, parts_written=0)
+
+    assert get_export_job_chunks(
+        export_job=export_job, case_ids=[1, 2, 3, 4, 5], chunk_size=2
+    ) == [[1, 2], [3, 4], [5]]
+    assert get_export_job_chunks(export_job=export_job, case_ids=[], chunk_size=2) == [
+        []
+    ]
+
+    export_job.cases_exported = 4
+    export_job.parts_written = 2
+
+    assert get_export_job_chunks(
+        export_job=export_job, case_ids=[1, 2, 3, 4, 5], chunk_size=2
+    ) == [[5]]
+
+    export_job.cases_exported = 5
+    export_job.parts_written = 3
+
+    assert (
+        get_export_job_chunks(
+            export_job=export_job, case_ids=[1, 2, 3, 4, 5], chunk_size=2
+        )
+        == []
+    )
+
+
+def sleep_and_return(value: int) -> int:
+    time.sleep((5 - value) / 100)
+    return value
+
+
+def test_ordered_parallel_map():
+    """Test results are returned in order when later calls finish first"""
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        assert list(
+            ordered_parallel_map(executor, sleep_and_return, range(5), max_pending=5)
+        ) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.django_db(transaction=True)
+@mock_aws
+def test_run_export_job_with_executor_matches_serial_export():
+    """Test export formatted concurrently is merged back in case order"""
+    for organisation_name in ["Org A", "Org B", "Org C", "Org D", "Org E"]:
+        SimplifiedCase.objects.create(organisation_name=organisation_name)
+    user: User = User.objects.create()
+    serial_export_job: ExportJob = request_export_job(
+        export_type=ExportJob.Type.SIMPLIFIED,
+        case_search_form=get_case_search_form(sort_by="id"),
+        user=user,
+    )
+    run_export_job(export_job=serial_export_job, chunk_size=2)
+    export_job: ExportJob = request_export_job(
+        export_type=ExportJob.Type.SIMPLIFIED,
+        case_search_form=get_case_search_form(sort_by="id"),
+        user=user,
+    )
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        run_export_job(
+            export_job=export_job, chunk_size=2, workers=3, executor=executor
+        )
+
+    assert export_job.status == ExportJob.Status.COMPLETE
+    assert export_job.parts_written == 3
+    assert export_job.cases_exported == 5
+    assert get_export_job_csv(export_job=export_job) == get_export_job_csv(
+        export_job=serial_export_job
+    )
+
+
+@pytest.mark.django_db
+def test_benchmark_export_jobs_command():
+    """Test benchmark command times export for each number of chunks and workers"""
+    for organisation_name in ["Org A", "Org B", "Org C"]:
+        SimplifiedCase.objects.create(organisation_name=organisation_name)
+    stdout: StringIO = StringIO()
+    stderr: StringIO = StringIO()
+
+    call_command(
+        "benchmark_export_jobs",
+        "--chunks=1,3",
+        "--workers=1",
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+    lines: list[str] = stdout.getvalue().splitlines()
+
+    assert lines[0] == "Formatting simplified export of 3 cases"
+    assert lines[2].split()[:3] == ["1", "1", "3"]
+    assert lines[3].split()[:3] == ["1", "3", "1"]
+    assert stderr.getvalue() == ""
@@ -0,0 +1,245 @@
+"""
+Tests for case lookup prefix index
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from ...mobile.models import MobileCase
+from ...simplified.models import SimplifiedCase
+from ..lookup_utils import CaseLookupEntry, CaseLookupIndex, case_lookup_index
+
+ORGANISATION_NAME: str = "Bristol City Council"
+DOMAIN: str = "www.bristol.gov.uk"
+
+
+@pytest.fixture(autouse=True)
+def clear_case_lookup_index():
+    """Stop index loaded by one test being seen by another"""
+    case_lookup_index.clear()
+    yield
+    case_lookup_index.clear()
+
+
+def test_case_lookup_entry_keys():
+    """Test case can be found by identifier, organisation name words and domain"""
+    entry: CaseLookupEntry = CaseLookupEntry(
+        id=1,
+        case_identifier="#S-12",
+        organisation_name=ORGANISATION_NAME,
+        domain=DOMAIN,
+        test_type="simplified",
+    )
+
+    assert entry.keys == {
+        "#s-12",
+        "s-12",
+        "12",
+        "bristol city council",
+        "city council",
+        "council",
+        "www.bristol.gov.uk",
+        "bristol.gov.uk",
+    }
+
+
+def test_case_lookup_entry_as_dict():
+    """Test case lookup entry includes link to case"""
+    entry: CaseLookupEntry = CaseLookupEntry(
+        id=1,
+        case_identifier="#M-1",
+        organisation_name=ORGANISATION_NAME,
+        domain="",
+        test_type="mobile",
+    )
+
+    assert entry.as_dict() == {
+        "id": 1,
+        "case_identifier": "#M-1",
+        "organisation_name": ORGANISATION_NAME,
+        "domain": "",
+        "url": reverse("mobile:case-detail", kwargs={"pk": 1}),
+    }
+
+
+@pytest.mark.parametrize(
+    "prefix, expected_ids",
+    [
+        ("b", []),
+        ("br", [1]),
+        ("council", [1, 2]),
+        ("  Bristol   City ", [1]),
+        ("bristol.gov", [1]),
+        ("s-2", [2]),
+        ("leeds", [2]),
+        ("zzz", []),
+    ],
+)
+def test_case_lookup_index_search(prefix, expected_ids):
+    """Test cases are found by prefix"""
+    index: CaseLookupIndex = CaseLookupIndex()
+    index.loaded = index.refreshed = timezone.now()
+    index.add(
+        CaseLookupEntry(
+            id=1,
+            case_identifier="#S-1",
+            organisation_name=ORGANISATION_NAME,
+            domain=DOMAIN,
+            test_type="simplified",
+        )
+    )
+    index.add(
+        CaseLookupEntry(
+            id=2,
+            case_identifier="#S-2",
+            organisation_name="Leeds City Council",
+            domain="leeds.gov.uk",
+            test_type="simplified",
+        )
+    )
+
+    assert [entry.id for entry in index.search(prefix=prefix)] == expected_ids
+
+
+def test_case_lookup_index_search_limit():
+    """Test number of cases found is limited"""
+    index: CaseLookupIndex = CaseLookupIndex()
+    index.loaded = index.refreshed = timezone.now()
+    for case_id in range(1, 6):
+        index.add(
+            CaseLookupEntry(
+                id=case_id,
+                case_identifier=f"#S-{case_id}",
+                organisation_name=ORGANISATION_NAME,
+                domain="",
+                test_type="simplified",
+            )
+        )
+
+    assert len(index.search(prefix="bristol", limit=3)) == 3
+
+
+def test_case_lookup_index_replaces_changed_case():
+    """Test keys of a case are replaced when it is added again"""
+    index: CaseLookupIndex = CaseLookupIndex()
+    index.loaded = index.refreshed = timezone.now()
+    entry: CaseLookupEntry = CaseLookupEntry(
+        id=1,
+        case_identifier="#S-1",
+        organisation_name="Old name",
+        domain="",
+        test_type="simplified",
+    )
+    index.add(entry)
+    entry = CaseLookupEntry(
+        id=1,
+        case_identifier="#S-1",
+        organisation_name="New name",
+        domain="",
+        test_type="simplified",
+    )
+    index.add(entry)
+
+    assert index.search(prefix="old") == []
+    assert index.search(prefix="new") == [entry]
+    assert len(index.keys) == len(entry.keys)
+
+
+@pytest.mark.django_db
+def test_case_lookup_index_loaded_on_first_search(django_assert_num_queries):
+    """Test index is loaded from database once"""
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+    mobile_case: MobileCase = MobileCase.objects.create(organisation_name="Bristol app")
+
+    with django_assert_num_queries(1):
+        assert [entry.id for entry in case_lookup_index.search(prefix="bristol")] == [
+            mobile_case.id,
+            simplified_case.id,
+        ]
+
+    with django_assert_num_queries(0):
+        case_lookup_index.search(prefix="bristol")
+
+
+@pytest.mark.django_db
+def test_case_lookup_index_updated_on_save(django_capture_on_commit_callbacks):
+    """Test saving a case updates a loaded index"""
+    case_lookup_index.search(prefix="bristol")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+            organisation_name=ORGANISATION_NAME
+        )
+
+    assert [entry.id for entry in case_lookup_index.search(prefix="bristol")] == [
+        simplified_case.id
+    ]
+
+
+@pytest.mark.django_db
+def test_case_lookup_index_refreshed_with_cases_updated_elsewhere():
+    """Test cases updated by other processes are added once index is stale"""
+    case_lookup_index.search(prefix="bristol")
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+
+    assert case_lookup_index.search(prefix="bristol") == []
+
+    case_lookup_index.refreshed -= timedelta(minutes=1)
+
+    assert [entry.id for entry in case_lookup_index.search(prefix="bristol")] == [
+        simplified_case.id
+    ]
+
+
+def test_case_lookup_view(admin_client):
+    """Test case lookup returns matching cases as JSON"""
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+
+    response = admin_client.get(reverse("cases:case-lookup"), {"q": "bris"})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": [
+            {
+                "id": simplified_case.id,
+                "case_identifier": simplified_case.case_identifier,
+                "organisation_name": ORGANISATION_NAME,
+                "domain": "",
+                "url": simplified_case.get_absolute_url(),
+            }
+        ]
+    }
+
+
+@pytest.mark.django_db
+def test_case_lookup_view_requires_login(client):
+    """Test case lookup is only available to logged in users"""
+    response = client.get(reverse("cases:case-lookup"), {"q": "bris"})
+
+    assert response.status_code == 302
+
+
+@pytest.mark.django_db
+def test_case_lookup_index_searched_while_another_thread_refreshes(
+    django_assert_num_queries,
+):
+    """Test searches use the loaded index while another thread refreshes it"""
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+    case_lookup_index.search(prefix="bristol")
+    case_lookup_index.refreshed -= timedelta(minutes=1)
+
+    with case_lookup_index.refresh_lock, django_assert_num_queries(0):
+        assert [entry.id for entry in case_lookup_index.search(prefix="bristol")] == [
+            simplified_case.id
+        ]
@@ -3,16 +3,21 @@ Tests for cases models
 """
 
 from datetime import date, datetime
+from unittest.mock import patch
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection, models
 from django.db.models.query import QuerySet
 
+from ...audits.models import AuditOverview
 from ...comments.models import Comment
+from ...common.models import Sector, SubCategory
 from ...detailed.models import DetailedCase
 from ...mobile.models import MobileCase
 from ...notifications.models import Task
 from ...simplified.models import SimplifiedCase
+from ..forms import DateType
 from ..models import (
     ALL_CASE_STATUS_CHOICES,
     BaseCase,
@@ -22,10 +27,12 @@ from ..models import (
     DetailedCaseStatus,
     MobileCaseStatus,
     SimplifiedCaseStatus,
+    Sort,
     TestType,
     extract_id_from_case_url,
     get_previous_case_identifier,
 )
+from ..utils import SavedSearchValues, filter_cases
 
 REMINDER_DUE_DATE: date = date(2022, 1, 1)
 ORGANISATION_NAME: str = "Organisation Name"
@@ -375,6 +382,97 @@ def test_mobile_case_name_prefix():
     assert mobile_case.name_prefix == APP_NAME
 
 
+@pytest.mark.django_db
+def test_base_case_search_document():
+    """Test search document is built from the searchable fields on save"""
+    sector: Sector = Sector.objects.create(name="Sector Name")
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME,
+        home_page_url=HOME_PAGE_URL,
+        sector=sector,
+        website_name=WEBSITE_NAME,
+    )
+    simplified_case.refresh_from_db()
+
+    assert simplified_case.search_document == (
+        "organisation name\nhttps://example.com\nunknown\nsector name\nwebsite"
+    )
+
+    simplified_case.organisation_name = "New Name"
+    simplified_case.save()
+    simplified_case.refresh_from_db()
+
+    assert simplified_case.search_document.startswith("new name\n")
+
+
+@pytest.mark.django_db
+def test_mobile_case_search_document():
+    """Test search document of mobile case includes the app fields"""
+    mobile_case: MobileCase = MobileCase.objects.create(
+        organisation_name=ORGANISATION_NAME,
+        app_name=APP_NAME,
+        ios_app_url="https://apps.apple.com/app",
+    )
+    mobile_case.refresh_from_db()
+
+    assert mobile_case.search_document == (
+        "organisation name\nunknown\napp name\nhttps://apps.apple.com/app"
+    )
+
+    base_case: BaseCase = BaseCase.objects.get(id=mobile_case.id)
+    base_case.save()
+    base_case.refresh_from_db()
+
+    assert base_case.search_document == mobile_case.search_document
+
+
+@pytest.mark.django_db
+def test_search_document_not_rebuilt_when_only_unsearched_fields_saved():
+    """
+    Test search document is only rebuilt when the fields saved include
+    searchable fields
+    """
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+
+    with patch(
+        "accessibility_monitoring_platform.apps.cases.signals.update_search_documents"
+    ) as mock_update_search_documents:
+        simplified_case.save(update_fields=["recommendation_notes"])
+
+        mock_update_search_documents.assert_not_called()
+
+        simplified_case.save(update_fields=["recommendation_notes", "website_name"])
+
+        mock_update_search_documents.assert_called_once()
+
+        mock_update_search_documents.reset_mock()
+        simplified_case.save()
+
+        mock_update_search_documents.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_search_document_follows_sector_and_subcategory_renames():
+    """Test search documents of cases are rebuilt when their sector is renamed"""
+    sector: Sector = Sector.objects.create(name="Sector Name")
+    subcategory: SubCategory = SubCategory.objects.create(name="Subcategory Name")
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        sector=sector, subcategory=subcategory
+    )
+
+    sector.name = "Renamed Sector"
+    sector.save()
+    subcategory.name = "Renamed Subcategory"
+    subcategory.save()
+    simplified_case.refresh_from_db()
+
+    assert simplified_case.search_document == (
+        "unknown\nrenamed sector\nrenamed subcategory"
+    )
+
+
 @pytest.mark.django_db
 def test_base_case_name_suffix():
     """Test case name_suffix for base case"""
@@ -547,3 +645,117 @@ def test_document_s3_key():
         case_file.s3_key
         == f"base_cases/{case_file.base_case.id}/{case_file.name} {case_file.uuid}"
     )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model, fields",
+    [
+        (BaseCase, ["status", "id"]),
+        (BaseCase, ["test_type", "status", "id"]),
+        (BaseCase, ["auditor", "status", "id"]),
+        (BaseCase, ["reviewer", "status", "id"]),
+        (BaseCase, ["enforcement_body", "recommendation_for_enforcement", "id"]),
+        (BaseCase, ["is_complaint", "id"]),
+        (BaseCase, ["updated_date", "id"]),
+        (BaseCase, ["organisation_name", "id"]),
+        (SimplifiedCase, ["sent_to_enforcement_body_sent_date"]),
+        (AuditOverview, ["initial_date_of_test"]),
+    ],
+)
+def test_case_search_filter_indexes_exist(model: type[models.Model], fields: list[str]):
+    """Test common case search filters and sorts are covered by a database index"""
+    columns: list[str] = [model._meta.get_field(field).column for field in fields]
+    with connection.cursor() as cursor:
+        constraints: dict[str, dict] = connection.introspection.get_constraints(
+            cursor, model._meta.db_table
+        )
+
+    assert any(
+        constraint["index"] and constraint["columns"] == columns
+        for constraint in constraints.values()
+    )
+
+
+def get_index_name(model: type[models.Model], fields: list[str]) -> str:
+    """Return name of model index on fields"""
+    for index in model._meta.indexes:
+        if index.fields == fields:
+            return index.name
+    raise ValueError(f"{model.__name__} has no index on {fields}")
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="EXPLAIN output is PostgreSQL specific"
+)
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "cleaned_data, column, index_fields",
+    [
+        ({"status": "unassigned-case"}, "status", ["status", "id"]),
+        (
+            {"test_type": "simplified", "status": "unassigned-case"},
+            "test_type",
+            ["test_type", "status", "id"],
+        ),
+        (
+            {"auditor": "1", "status": "unassigned-case"},
+            "auditor_id",
+            ["auditor", "status", "id"],
+        ),
+        (
+            {"reviewer": "1", "status": "unassigned-case"},
+            "reviewer_id",
+            ["reviewer", "status", "id"],
+        ),
+        (
+            {"enforcement_body": "ehrc", "recommendation_for_enforcement": "other"},
+            "enforcement_body",
+            ["enforcement_body", "recommendation_for_enforcement", "id"],
+        ),
+        ({"is_complaint": "yes"}, "is_complaint", ["is_complaint", "id"]),
+        (
+            {"date_type": DateType.UPDATED, "date_start": date(2024, 1, 1)},
+            "updated_date",
+            ["updated_date", "id"],
+        ),
+        (
+            {"sort_by": Sort.NAME},
+            None,
+            ["organisation_name", "id"],
+        ),
+        (
+            {"date_type": DateType.SENT, "date_start": date(2024, 1, 1)},
+            "sent_to_enforcement_body_sent_date",
+            None,
+        ),
+        (
+            {"date_type": DateType.TEST_START, "date_start": date(2024, 1, 1)},
+            "initial_date_of_test",
+            None,
+        ),
+    ],
+)
+def test_case_search_filters_use_index_scans(cleaned_data, column, index_fields):
+    """
+    Test the case searches run by filter_cases for common filters and sorts
+    are planned as index scans on the case search indexes
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+    plan: str = filter_cases(
+        form=SavedSearchValues(cleaned_data=cleaned_data)
+    ).explain()
+
+    assert "Seq Scan" not in plan, plan
+    if column is not None:
+        assert any(
+            "Index Cond" in line and column in line for line in plan.splitlines()
+        ), plan
+    if index_fields is not None:
+        index_name: str = get_index_name(BaseCase, index_fields)
+        assert any(
+            ("Index Scan" in line or "Index Only Scan" in line) and index_name in line
+            for line in plan.splitlines()
+        ), plan
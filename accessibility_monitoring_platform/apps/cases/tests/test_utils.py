@@ -2,23 +2,45 @@
 Test utility functions of cases app
 """
 
+import csv
 import io
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Q, QuerySet
 from moto import mock_aws
 
 from ...audits.models import AuditOverview
 from ...common.models import Boolean, Sector, SubCategory
+from ...detailed.models import DetailedCase
 from ...mobile.models import MobileCase
 from ...simplified.models import CaseStatus, SimplifiedCase
-from ..forms import DateType
-from ..models import BaseCase, CaseFile, Sort
-from ..utils import S3ReadWriteFile, filter_cases, find_duplicate_cases
+from ..forms import CaseSearchForm, DateType
+from ..models import BaseCase, CaseFile, SavedSearch, Sort
+from ..utils import (
+    CASE_SEARCH_COUNT_CACHE_TIMEOUT,
+    SAVED_SEARCH_CACHE_TIMEOUT,
+    S3ReadWriteFile,
+    build_case_search_query,
+    bulk_url_search,
+    bulk_url_search_csv_generator,
+    filter_cases,
+    find_cases_matching_urls,
+    find_duplicate_cases,
+    get_case_search_count,
+    get_saved_search_case_ids,
+    get_saved_search_form,
+    hash_case_search_parameters,
+    invalidate_saved_search_results,
+    normalise_case_search_parameters,
+    prefetch_concrete_cases,
+    update_search_documents,
+)
 
 ORGANISATION_NAME: str = "Organisation name one"
 ORGANISATION_NAME_COMPLAINT: str = "Organisation name two"
@@ -333,6 +355,63 @@ def test_case_filtered_by_search_string(search_string):
     assert len(filtered_cases) == 1
 
 
+@pytest.mark.django_db
+def test_case_search_uses_search_document():
+    """Test case search matches the search document without joining other tables"""
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+    form: MockForm = MockForm(cleaned_data={"case_search": "ORGANISATION"})
+
+    filtered_cases: QuerySet[BaseCase] = filter_cases(form)
+
+    sql: str = str(filtered_cases.query)
+
+    assert "mobile_mobilecase" not in sql
+    assert "common_sector" not in sql
+    assert list(filtered_cases) == [simplified_case.basecase_ptr]
+
+    simplified_case.organisation_name = "Renamed"
+    simplified_case.save()
+
+    assert list(filter_cases(form)) == []
+
+
+@pytest.mark.django_db
+def test_case_search_matches_are_combined_with_union():
+    """
+    Test search document and case identifier are matched by separate queries
+    so that each can use its own index
+    """
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+    search_query: Q = build_case_search_query(search=str(simplified_case.case_number))
+
+    assert "UNION" in str(BaseCase.objects.filter(search_query).query)
+    assert list(BaseCase.objects.filter(search_query)) == [simplified_case.basecase_ptr]
+
+
+@pytest.mark.django_db
+def test_update_search_documents():
+    """Test search documents follow changes made by QuerySet.update()"""
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+    BaseCase.objects.filter(id=simplified_case.id).update(
+        organisation_name="Updated Name", psb_location=""
+    )
+
+    assert (
+        update_search_documents(cases=BaseCase.objects.filter(id=simplified_case.id))
+        == 1
+    )
+
+    simplified_case.refresh_from_db()
+
+    assert simplified_case.search_document == "updated name"
+
+
 @pytest.mark.django_db
 def test_simplified_case_filtered_by_ready_to_qa():
     """Test that case with status Ready to QA is found"""
@@ -643,6 +722,198 @@ def test_find_duplicate_cases(url, domain, expected_number_of_duplicates):
         )
 
 
+@pytest.mark.django_db
+def test_bulk_url_search(django_assert_num_queries):
+    """Test bulk_url_search matches exact domains then substrings of URLs"""
+    SimplifiedCase.objects.create(home_page_url="https://www.exact.gov.uk/home")
+    SimplifiedCase.objects.create(home_page_url="https://Partial.example.com/")
+    urls: list[str] = [
+        "https://www.exact.gov.uk",
+        "http://www.partial.co.uk/path",
+        "https://missing.com",
+        "not a url",
+    ]
+
+    with django_assert_num_queries(2):
+        bulk_search_results: list[dict] = bulk_url_search(urls=urls)
+
+    assert bulk_search_results == [
+        {
+            "search_term": "exact",
+            "found_flag": True,
+            "url": "https://www.exact.gov.uk",
+        },
+        {
+            "search_term": "partial",
+            "found_flag": True,
+            "url": "http://www.partial.co.uk/path",
+        },
+        {"search_term": "missing", "found_flag": False, "url": "https://missing.com"},
+        {"search_term": "not", "found_flag": False, "url": "not a url"},
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_url_search_all_exact_domains(django_assert_num_queries):
+    """Test bulk_url_search skips substring matching when all domains match"""
+    SimplifiedCase.objects.create(home_page_url="https://www.exact.gov.uk/home")
+
+    with django_assert_num_queries(1):
+        bulk_search_results: list[dict] = bulk_url_search(
+            urls=["https://www.exact.gov.uk"]
+        )
+
+    assert bulk_search_results[0]["found_flag"] is True
+
+
+@pytest.mark.django_db
+def test_bulk_url_search_ignores_blank_lines(django_assert_num_queries):
+    """Test blank URLs are not searched for, so do not match every case"""
+    SimplifiedCase.objects.create(home_page_url="https://www.example.com")
+
+    with django_assert_num_queries(2):
+        bulk_search_results: list[dict] = bulk_url_search(
+            urls=["", "  ", "https://missing.com"]
+        )
+
+    assert bulk_search_results == [
+        {"search_term": "missing", "found_flag": False, "url": "https://missing.com"}
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_url_search_exact_domain_checks_home_page_url():
+    """
+    Test a case whose domain no longer matches its edited home page URL is not
+    found by its old domain
+    """
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        home_page_url="https://www.exact.gov.uk/home"
+    )
+    simplified_case.home_page_url = "https://www.renamed.gov.uk/home"
+    simplified_case.save()
+
+    assert simplified_case.domain == "www.exact.gov.uk"
+    assert bulk_url_search(urls=["https://www.exact.gov.uk"])[0]["found_flag"] is False
+    assert bulk_url_search(urls=["https://www.renamed.gov.uk"])[0]["found_flag"] is True
+
+
+@pytest.mark.django_db
+def test_bulk_url_search_batches_substring_matching(django_assert_num_queries):
+    """Test bulk_url_search matches substrings in batches"""
+    SimplifiedCase.objects.create(home_page_url="https://www.found.com")
+    urls: list[str] = [f"https://site{count}.com" for count in range(3)] + [
+        "https://found.co.uk"
+    ]
+
+    with patch(
+        "accessibility_monitoring_platform.apps.cases.utils.BULK_URL_SEARCH_BATCH_SIZE",
+        2,
+    ):
+        with django_assert_num_queries(3):
+            bulk_search_results: list[dict] = bulk_url_search(urls=urls)
+
+    assert [result["found_flag"] for result in bulk_search_results] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_url_search_csv_generator(django_assert_num_queries):
+    """Test bulk URL search CSV lists matching cases a batch of URLs at a time"""
+    user: User = User.objects.create(first_name="Paul", last_name="Auditor")
+    first_case: SimplifiedCase = SimplifiedCase.objects.create(
+        home_page_url="https://www.council.gov.uk", auditor=user
+    )
+    second_case: SimplifiedCase = SimplifiedCase.objects.create(
+        home_page_url="https://council.gov.uk/other",
+        status=SimplifiedCase.Status.COMPLETE,
+    )
+    urls: list[str] = [
+        "https://missing.com",
+        "https://www.council.gov.uk",
+        "https://www.council.gov.uk/page",
+    ]
+
+    with patch(
+        "accessibility_monitoring_platform.apps.cases.utils.BULK_URL_SEARCH_BATCH_SIZE",
+        2,
+    ):
+        with django_assert_num_queries(2):
+            csv_chunks: list[str] = list(bulk_url_search_csv_generator(urls=urls))
+
+    assert len(csv_chunks) == 3
+    assert "".join(csv_chunks).splitlines() == [
+        "URL,Search term,Found,Number of cases,Case identifiers,Statuses,Auditors",
+        "https://missing.com,missing,No,0,,,",
+        f"https://www.council.gov.uk,council,Yes,2,{first_case.case_identifier}; "
+        f"{second_case.case_identifier},Unassigned case; Complete,Paul Auditor; ",
+        f"https://www.council.gov.uk/page,council,Yes,2,{first_case.case_identifier}; "
+        f"{second_case.case_identifier},Unassigned case; Complete,Paul Auditor; ",
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_url_search_csv_generator_ignores_blank_urls():
+    """Test blank URLs are left out of the bulk URL search CSV"""
+    SimplifiedCase.objects.create(home_page_url="https://www.council.gov.uk")
+
+    assert "".join(bulk_url_search_csv_generator(urls=["", " "])).splitlines() == [
+        "URL,Search term,Found,Number of cases,Case identifiers,Statuses,Auditors",
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_url_search_and_csv_find_the_same_urls():
+    """Test bulk URL search and its CSV agree on which URLs are found"""
+    SimplifiedCase.objects.create(home_page_url="https://www.exact.gov.uk/home")
+    stale_domain_case: SimplifiedCase = SimplifiedCase.objects.create(
+        home_page_url="https://www.stale.gov.uk"
+    )
+    stale_domain_case.home_page_url = "https://www.renamed.gov.uk"
+    stale_domain_case.save()
+    urls: list[str] = [
+        "https://www.exact.gov.uk",
+        "https://www.stale.gov.uk",
+        "https://renamed.com",
+        "not a url",
+    ]
+
+    csv_rows: list[list[str]] = list(
+        csv.reader("".join(bulk_url_search_csv_generator(urls=urls)).splitlines())
+    )
+
+    assert [row[2] == "Yes" for row in csv_rows[1:]] == [
+        result["found_flag"] for result in bulk_url_search(urls=urls)
+    ]
+    assert [row[2] for row in csv_rows[1:]] == ["Yes", "No", "Yes", "No"]
+
+
+@pytest.mark.django_db
+def test_find_cases_matching_urls_exact_domains_found_first(
+    django_assert_num_queries,
+):
+    """
+    Test cases with the same domain are found by it when all matching cases
+    are not needed
+    """
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        home_page_url="https://www.exact.gov.uk/home"
+    )
+
+    with django_assert_num_queries(1):
+        matching_cases: dict[str, list[BaseCase]] = find_cases_matching_urls(
+            urls=["https://www.exact.gov.uk", ""],
+            cases=BaseCase.objects.all(),
+            all_matching_cases=False,
+        )
+
+    assert matching_cases == {"exact": [simplified_case.basecase_ptr]}
+
+
 @pytest.mark.django_db
 @mock_aws
 def test_writing_to_s3():
@@ -701,3 +972,247 @@ def test_document_not_on_s3():
     file_from_s3: str = s3_read_write.read_case_file_from_s3(case_file=case_file)
 
     assert file_from_s3 == f"File not found: {DOCUMENT_NAME}"
+
+
+def test_normalise_case_search_parameters():
+    """Test case search values are normalised to non-empty strings"""
+    sector: Sector = Sector(id=7, name=SECTOR_NAME)
+
+    assert normalise_case_search_parameters(
+        cleaned_data={
+            "case_search": " search ",
+            "sector": sector,
+            "date_start": date(2026, 1, 31),
+            "case_number": 5,
+            "status": "",
+            "auditor": None,
+            "start_date": datetime(2020, 1, 1),
+        }
+    ) == {
+        "case_search": "search",
+        "sector": "7",
+        "date_start": "2026-01-31",
+        "case_number": "5",
+    }
+
+
+def test_hash_case_search_parameters_ignores_key_order():
+    """Test hash of search parameters does not depend on their order"""
+    assert hash_case_search_parameters(
+        parameters={"a": "1", "b": "2"}
+    ) == hash_case_search_parameters(parameters={"b": "2", "a": "1"})
+    assert hash_case_search_parameters(
+        parameters={"a": "1"}
+    ) != hash_case_search_parameters(parameters={"a": "2"})
+
+
+@pytest.mark.django_db
+def test_get_saved_search_form():
+    """Test saved search parameters populate a valid case search form"""
+    user: User = User.objects.create(username="user")
+    saved_search: SavedSearch = SavedSearch.objects.create(
+        user=user,
+        parameters={
+            "case_search": "search",
+            "date_type": DateType.UPDATED,
+            "date_start": "2026-01-31",
+        },
+    )
+
+    form = get_saved_search_form(saved_search=saved_search)
+
+    assert form.errors == {}
+    assert form.cleaned_data["case_search"] == "search"
+    assert form.cleaned_data["date_start"] == date(2026, 1, 31)
+
+
+@pytest.mark.django_db
+def test_get_saved_search_case_ids_caches_results(django_assert_num_queries):
+    """Test saved search results are cached after first search"""
+    user: User = User.objects.create(username="user")
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+    SimplifiedCase.objects.create(organisation_name="Other")
+    saved_search: SavedSearch = SavedSearch.objects.create(
+        user=user, parameters={"case_search": ORGANISATION_NAME}
+    )
+
+    assert get_saved_search_case_ids(saved_search=saved_search) == [simplified_case.id]
+
+    saved_search.refresh_from_db()
+
+    assert saved_search.case_ids == [simplified_case.id]
+    assert saved_search.cached is not None
+
+    with django_assert_num_queries(0):
+        assert get_saved_search_case_ids(saved_search=saved_search) == [
+            simplified_case.id
+        ]
+
+
+@pytest.mark.django_db
+def test_saved_search_results_invalidated_when_matching_case_saved():
+    """Test saving a case which matches a saved search clears its cached results"""
+    user: User = User.objects.create(username="user")
+    saved_search: SavedSearch = SavedSearch.objects.create(
+        user=user, parameters={"case_search": ORGANISATION_NAME}
+    )
+    get_saved_search_case_ids(saved_search=saved_search)
+
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+    saved_search.refresh_from_db()
+
+    assert saved_search.case_ids is None
+    assert saved_search.cached is None
+    assert get_saved_search_case_ids(saved_search=saved_search) == [simplified_case.id]
+
+    simplified_case.organisation_name = "Other"
+    simplified_case.save()
+    saved_search.refresh_from_db()
+
+    assert saved_search.case_ids is None
+    assert get_saved_search_case_ids(saved_search=saved_search) == []
+
+
+@pytest.mark.django_db
+def test_saved_search_results_invalidated_only_for_matching_searches(
+    django_assert_num_queries,
+):
+    """Test saving a case only clears the results of saved searches it matches"""
+    user: User = User.objects.create(username="user")
+    matching_search, other_search = [
+        SavedSearch.objects.create(
+            user=user,
+            parameters={"case_search": case_search},
+            parameters_hash=case_search,
+        )
+        for case_search in [ORGANISATION_NAME, "Unrelated"]
+    ]
+    for saved_search in [matching_search, other_search]:
+        get_saved_search_case_ids(saved_search=saved_search)
+
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+    matching_search.refresh_from_db()
+    other_search.refresh_from_db()
+
+    assert matching_search.cached is None
+    assert other_search.cached is not None
+
+    get_saved_search_case_ids(saved_search=matching_search)
+
+    with django_assert_num_queries(3):
+        invalidate_saved_search_results(base_case=simplified_case)
+
+    assert list(
+        SavedSearch.objects.filter(cached__isnull=False).values_list("id", flat=True)
+    ) == [other_search.id]
+
+
+@pytest.mark.django_db
+def test_saved_search_results_expire():
+    """Test saved search results cached too long ago are found again"""
+    user: User = User.objects.create(username="user")
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name=ORGANISATION_NAME
+    )
+    saved_search: SavedSearch = SavedSearch.objects.create(
+        user=user,
+        parameters={"case_search": ORGANISATION_NAME},
+        case_ids=[],
+        cached=datetime.now(tz=timezone.utc) - SAVED_SEARCH_CACHE_TIMEOUT,
+    )
+
+    assert get_saved_search_case_ids(saved_search=saved_search) == [simplified_case.id]
+
+
+@pytest.mark.django_db
+def test_get_case_search_count_cached(django_assert_num_queries):
+    """Test case search count is cached for the same search values"""
+    cache.clear()
+    SimplifiedCase.objects.create(organisation_name=ORGANISATION_NAME)
+    form: CaseSearchForm = CaseSearchForm({"case_search": ORGANISATION_NAME})
+    form.is_valid()
+    cases: QuerySet[BaseCase] = filter_cases(form=form)
+
+    with django_assert_num_queries(1):
+        assert get_case_search_count(form=form, cases=cases) == (1, False)
+
+    with django_assert_num_queries(0):
+        assert get_case_search_count(form=form, cases=cases) == (1, False)
+
+    other_form: CaseSearchForm = CaseSearchForm({"case_search": "Other"})
+    other_form.is_valid()
+
+    assert get_case_search_count(
+        form=other_form, cases=filter_cases(form=other_form)
+    ) == (0, False)
+
+
+@pytest.mark.django_db
+def test_get_case_search_count_cached_until_timeout():
+    """Test case search count is cached only for the count cache timeout"""
+    form: CaseSearchForm = CaseSearchForm({"case_search": ORGANISATION_NAME})
+    form.is_valid()
+
+    with patch("accessibility_monitoring_platform.apps.cases.utils.cache") as (
+        mock_cache
+    ):
+        mock_cache.get.return_value = None
+        get_case_search_count(form=form, cases=filter_cases(form=form))
+
+    mock_cache.set.assert_called_once_with(
+        ANY, (0, False), timeout=CASE_SEARCH_COUNT_CACHE_TIMEOUT
+    )
+
+
+@pytest.mark.django_db
+def test_get_case_search_count_not_cached_for_invalid_search():
+    """Test counts of searches with errors are not cached"""
+    cache.clear()
+    form: CaseSearchForm = CaseSearchForm({"case_number": "not a number"})
+    form.is_valid()
+
+    with patch("accessibility_monitoring_platform.apps.cases.utils.cache") as (
+        mock_cache
+    ):
+        assert get_case_search_count(form=form, cases=BaseCase.objects.none()) == (
+            0,
+            False,
+        )
+
+    mock_cache.set.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_prefetch_concrete_cases(django_assert_num_queries):
+    """Test concrete cases are fetched with one query per testing type"""
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(archive="Yes")
+    detailed_case: DetailedCase = DetailedCase.objects.create()
+    mobile_cases: list[MobileCase] = [
+        MobileCase.objects.create(app_name=APP_NAME),
+        MobileCase.objects.create(app_name=APP_NAME),
+    ]
+    base_cases: list[BaseCase] = list(BaseCase.objects.all())
+
+    with django_assert_num_queries(3):
+        assert prefetch_concrete_cases(base_cases) == base_cases
+
+    with django_assert_num_queries(0):
+        assert [base_case.get_case() for base_case in base_cases] == [
+            mobile_cases[1],
+            mobile_cases[0],
+            detailed_case,
+            simplified_case,
+        ]
+        assert [base_case.tag_name_suffix for base_case in base_cases] == [
+            "mobile",
+            "mobile",
+            "detailed",
+            "archive",
+        ]
+        assert base_cases[0].name_prefix == APP_NAME
@@ -3,15 +3,22 @@ Tests for cases views
 """
 
 import io
+from unittest.mock import patch
 
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.db import connection
 from django.http import HttpResponse
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from moto import mock_aws
+from pytest_django.asserts import assertContains, assertNotContains
 
+from ...detailed.models import DetailedCase
+from ...mobile.models import MobileCase
 from ...simplified.models import SimplifiedCase
-from ..models import CaseFile
+from ..export_jobs import S3ReadWriteExportJob
+from ..models import CaseFile, ExportJob, SavedSearch
 from ..utils import S3ReadWriteFile
 
 CASE_FILE_NAME: str = "case_file.txt"
@@ -76,3 +83,211 @@ def test_document_download(admin_client):
     assert response.status_code == 200
 
     assert response.getvalue().decode() == CASE_FILE_CONTENT
+
+
+def test_case_list_keyset_pagination(admin_client):
+    """Test case list pages through results using keyset cursors"""
+    for count in range(25):
+        SimplifiedCase.objects.create(organisation_name=f"Org {count:02}")
+
+    response: HttpResponse = admin_client.get(
+        reverse("cases:case-list"), {"sort_by": "organisation_name"}
+    )
+
+    assert response.status_code == 200
+    assertContains(response, "Found 25 cases")
+    assertContains(response, "Org 00")
+    assertNotContains(response, "Org 20")
+    assertNotContains(response, "Previous")
+
+    keyset_page = response.context["keyset_page"]
+
+    response = admin_client.get(
+        reverse("cases:case-list"),
+        {"sort_by": "organisation_name", "after": keyset_page.next_cursor},
+    )
+
+    assert response.status_code == 200
+    assertContains(response, "Org 20")
+    assertContains(response, "Org 24")
+    assertNotContains(response, "Org 19")
+    assertContains(response, "Previous")
+    assertNotContains(response, 'rel="next"')
+
+
+def test_case_list_approximate_count(admin_client):
+    """Test case list shows approximate count when estimated"""
+    SimplifiedCase.objects.create()
+
+    with patch(
+        "accessibility_monitoring_platform.apps.cases.utils.get_approximate_count",
+        return_value=(12345, True),
+    ):
+        response: HttpResponse = admin_client.get(reverse("cases:case-list"))
+
+    assert response.status_code == 200
+    assertContains(response, "Found about 12,345 cases")
+
+
+def test_saved_search_create(admin_client, admin_user):
+    """Test current case search is saved with normalised parameters"""
+    response: HttpResponse = admin_client.post(
+        f"{reverse('cases:saved-search-create')}?case_search=+Org+&status=&page=2",
+        {"name": "My search", "save": "Save search"},
+    )
+
+    saved_search: SavedSearch = SavedSearch.objects.get(user=admin_user)
+
+    assert response.status_code == 302
+    assert response.url == saved_search.get_absolute_url()
+    assert saved_search.name == "My search"
+    assert saved_search.parameters == {"case_search": "Org"}
+
+    admin_client.post(
+        f"{reverse('cases:saved-search-create')}?case_search=Org",
+        {"name": "Renamed", "save": "Save search"},
+    )
+
+    saved_search.refresh_from_db()
+
+    assert SavedSearch.objects.count() == 1
+    assert saved_search.name == "Renamed"
+
+
+def test_case_list_shows_saved_search(admin_client, admin_user):
+    """Test case list shows cases found by saved search"""
+    SimplifiedCase.objects.create(organisation_name="Included")
+    SimplifiedCase.objects.create(organisation_name="Excluded")
+    saved_search: SavedSearch = SavedSearch.objects.create(
+        user=admin_user, name="Saved name", parameters={"case_search": "Included"}
+    )
+
+    response: HttpResponse = admin_client.get(saved_search.get_absolute_url())
+
+    assert response.status_code == 200
+    assertContains(response, "Found 1 case")
+    assertContains(response, "Included")
+    assertNotContains(response, "Excluded")
+    assertContains(response, "<strong>Saved name</strong>", html=True)
+    assertContains(response, "?case_search=Included")
+
+    saved_search.refresh_from_db()
+
+    assert saved_search.case_ids is not None
+
+
+def test_case_list_saved_search_of_other_user(admin_client):
+    """Test saved searches of other users cannot be opened"""
+    user: User = User.objects.create(username="other")
+    saved_search: SavedSearch = SavedSearch.objects.create(user=user)
+
+    response: HttpResponse = admin_client.get(saved_search.get_absolute_url())
+
+    assert response.status_code == 404
+
+
+def test_export_job_create(admin_client, admin_user):
+    """Test export of current case search is queued once"""
+    url: str = f"{reverse('cases:export-job-create')}?search=Org&page=2"
+
+    response: HttpResponse = admin_client.post(
+        url, {"type": ExportJob.Type.DETAILED, "export": "Export in background"}
+    )
+
+    export_job: ExportJob = ExportJob.objects.get(requested_by=admin_user)
+
+    assert response.status_code == 302
+    assert response.url == export_job.get_absolute_url()
+    assert export_job.parameters == {"case_search": "Org", "test_type": "detailed"}
+
+    admin_client.post(
+        url, {"type": ExportJob.Type.DETAILED, "export": "Export in background"}
+    )
+
+    assert ExportJob.objects.count() == 1
+
+
+def test_case_list_shows_export_jobs(admin_client, admin_user):
+    """Test case list shows user's background exports"""
+    export_job: ExportJob = ExportJob.objects.create(requested_by=admin_user)
+
+    response: HttpResponse = admin_client.get(reverse("cases:case-list"))
+
+    assertContains(response, "Background exports")
+    assertContains(response, export_job.get_absolute_url())
+
+
+def test_export_job_detail_while_running(admin_client, admin_user):
+    """Test export job page shows progress and no download link until complete"""
+    export_job: ExportJob = ExportJob.objects.create(
+        requested_by=admin_user,
+        status=ExportJob.Status.RUNNING,
+        case_ids=[1, 2, 3],
+        cases_exported=2,
+    )
+
+    response: HttpResponse = admin_client.get(export_job.get_absolute_url())
+
+    assert response.status_code == 200
+    assertContains(response, "2 of 3")
+    assertNotContains(
+        response,
+        reverse("cases:export-job-download", kwargs={"pk": export_job.id}),
+    )
+
+    response: HttpResponse = admin_client.get(
+        reverse("cases:export-job-download", kwargs={"pk": export_job.id})
+    )
+
+    assert response.status_code == 302
+    assert response.url == export_job.get_absolute_url()
+
+
+@mock_aws
+def test_export_job_download(admin_client, admin_user):
+    """Test completed export job parts are downloaded as one CSV"""
+    export_job: ExportJob = ExportJob.objects.create(
+        requested_by=admin_user, status=ExportJob.Status.COMPLETE, parts_written=2
+    )
+    s3_read_write: S3ReadWriteExportJob = S3ReadWriteExportJob()
+    s3_read_write.write_export_job_part_to_s3(
+        export_job=export_job, part=1, content="Header\n"
+    )
+    s3_read_write.write_export_job_part_to_s3(
+        export_job=export_job, part=2, content="Row\n"
+    )
+
+    response: HttpResponse = admin_client.get(
+        reverse("cases:export-job-download", kwargs={"pk": export_job.id})
+    )
+
+    assert response.status_code == 200
+    assert response["Content-Disposition"] == (
+        "attachment; filename=simplified_cases.csv"
+    )
+    assert b"".join(response.streaming_content) == b"Header\nRow\n"
+
+
+def test_case_list_queries_do_not_grow_with_cases(admin_client):
+    """Test number of queries for the case list does not depend on its length"""
+
+    def count_case_list_queries() -> int:
+        with CaptureQueriesContext(connection) as context:
+            response: HttpResponse = admin_client.get(
+                reverse("cases:case-list"), {"sort_by": "id"}
+            )
+        assert response.status_code == 200
+        return len(context.captured_queries)
+
+    count_case_list_queries()  # First request creates platform settings
+    SimplifiedCase.objects.create()
+    DetailedCase.objects.create()
+    MobileCase.objects.create()
+    number_of_queries: int = count_case_list_queries()
+
+    for _ in range(5):
+        SimplifiedCase.objects.create()
+        DetailedCase.objects.create()
+        MobileCase.objects.create()
+
+    assert count_case_list_queries() == number_of_queries
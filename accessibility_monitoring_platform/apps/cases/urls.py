@@ -12,12 +12,38 @@ from .views import (
     CaseFileUpdateView,
     CaseFileUploadView,
     CaseListView,
+    ExportJobCreateView,
+    ExportJobDetailView,
+    SavedSearchCreateView,
     case_file_download,
+    case_lookup,
+    export_job_download,
 )
 
 app_name: str = "cases"
 urlpatterns: list[URLPattern] = [
     path("", login_required(CaseListView.as_view()), name="case-list"),
+    path("case-lookup/", login_required(case_lookup), name="case-lookup"),
+    path(
+        "saved-search-create/",
+        login_required(SavedSearchCreateView.as_view()),
+        name="saved-search-create",
+    ),
+    path(
+        "export-job-create/",
+        login_required(ExportJobCreateView.as_view()),
+        name="export-job-create",
+    ),
+    path(
+        "export-jobs/<int:pk>/",
+        login_required(ExportJobDetailView.as_view()),
+        name="export-job-detail",
+    ),
+    path(
+        "export-jobs/<int:pk>/download/",
+        login_required(export_job_download),
+        name="export-job-download",
+    ),
     path(
         "<int:pk>/case-file-list/",
         login_required(CaseFileListView.as_view()),
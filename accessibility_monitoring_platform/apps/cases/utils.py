@@ -3,20 +3,52 @@ Utility functions for cases app
 """
 
 import copy
+import csv
+import hashlib
+import json
 import logging
 from dataclasses import dataclass
-from typing import Any
+from datetime import date, timedelta
+from typing import Any, Generator
 
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchVector,
+    SearchVectorExact,
+)
+from django.core.cache import cache
+from django.db import connection, models
 from django.db.models import Case as DjangoCase
-from django.db.models import Q, QuerySet, When
+from django.db.models import (
+    Exists,
+    Expression,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    TextField,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Concat, Lower, Substr
+from django.db.models.lookups import Exact
+from django.utils import timezone
 
 from ..common.form_extract_utils import FieldLabelAndValue
+from ..common.models import Sector, SubCategory
 from ..common.s3_utils import S3Wrapper
 from ..common.sitemap import PlatformPage
-from ..common.utils import build_filters, extract_domain_from_url
+from ..common.utils import (
+    build_filters,
+    extract_domain_from_url,
+    get_approximate_count,
+    sanitise_domain,
+)
+from ..detailed.models import DetailedCase
+from ..mobile.models import MobileCase
 from ..simplified.models import SimplifiedCase
 from .forms import CaseSearchForm
-from .models import CASE_STATUS_UNASSIGNED, BaseCase, CaseFile, Sort
+from .models import CASE_STATUS_UNASSIGNED, BaseCase, CaseFile, SavedSearch, Sort
 
 CASE_FIELD_AND_FILTER_NAMES: list[tuple[str, str]] = [
     ("auditor", "auditor_id"),
@@ -30,9 +62,65 @@ CASE_FIELD_AND_FILTER_NAMES: list[tuple[str, str]] = [
     ("recommendation_for_enforcement", "recommendation_for_enforcement"),
 ]
 
+SAVED_SEARCH_FIELD_NAMES: list[str] = [
+    field_name for field_name, _ in CASE_FIELD_AND_FILTER_NAMES
+] + ["sort_by", "case_search", "case_number", "date_type", "date_start", "date_end"]
+SAVED_SEARCH_DATE_FIELD_NAMES: list[str] = ["date_start", "date_end"]
+SAVED_SEARCH_CACHE_TIMEOUT: timedelta = timedelta(hours=1)
+
+CASE_SEARCH_COUNT_CACHE_TIMEOUT: int = 60
+
+CONCRETE_CASE_MODELS: dict[str, type[BaseCase]] = {
+    BaseCase.TestType.SIMPLIFIED: SimplifiedCase,
+    BaseCase.TestType.DETAILED: DetailedCase,
+    BaseCase.TestType.MOBILE: MobileCase,
+}
+
+SEARCH_CONFIG: str = "simple"
+SEARCH_DOCUMENT_SEPARATOR: str = "\n"
+MOBILE_SEARCH_DOCUMENT_FIELDS: list[str] = [
+    "app_name",
+    "android_app_url",
+    "ios_app_url",
+]
+SEARCH_DOCUMENT_FIELDS: frozenset[str] = frozenset(
+    [
+        "organisation_name",
+        "home_page_url",
+        "psb_location",
+        "sector",
+        "sector_id",
+        "parental_organisation_name",
+        "website_name",
+        "subcategory",
+        "subcategory_id",
+        *MOBILE_SEARCH_DOCUMENT_FIELDS,
+    ]
+)
+BULK_URL_SEARCH_BATCH_SIZE: int = 500
+BULK_URL_SEARCH_CSV_COLUMN_HEADERS: list[str] = [
+    "URL",
+    "Search term",
+    "Found",
+    "Number of cases",
+    "Case identifiers",
+    "Statuses",
+    "Auditors",
+]
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SavedSearchValues:
+    """
+    Normalised values of a saved search used in place of a validated search
+    form, so that matching cases can be filtered without querying for choices
+    """
+
+    cleaned_data: dict[str, str]
+
+
 @dataclass
 class CaseDetailPage:
     platform_page: PlatformPage
@@ -45,8 +133,89 @@ class CaseDetailSection:
     pages: list[CaseDetailPage]
 
 
+def build_search_document_value(value: Expression) -> Expression:
+    """Return value preceded by the search document separator, or nothing if empty"""
+    value = Coalesce(value, Value(""), output_field=TextField())
+    return DjangoCase(
+        When(Exact(value, Value("")), then=Value("")),
+        default=Concat(Value(SEARCH_DOCUMENT_SEPARATOR), value),
+        output_field=TextField(),
+    )
+
+
+def build_search_document_expression() -> Expression:
+    """
+    Return database expression for the lowercase text matched by the case
+    search, joining the non-empty searchable fields of the case, the names of
+    its sector and subcategory and, for mobile cases, its app fields
+    """
+    values: list[Expression] = [
+        models.F("organisation_name"),
+        models.F("home_page_url"),
+        models.F("psb_location"),
+        Subquery(Sector.objects.filter(id=OuterRef("sector_id")).values("name")),
+        models.F("parental_organisation_name"),
+        models.F("website_name"),
+        Subquery(
+            SubCategory.objects.filter(id=OuterRef("subcategory_id")).values("name")
+        ),
+    ] + [
+        Subquery(MobileCase.objects.filter(pk=OuterRef("id")).values(field_name))
+        for field_name in MOBILE_SEARCH_DOCUMENT_FIELDS
+    ]
+    return Lower(
+        Substr(
+            Concat(
+                *[build_search_document_value(value=value) for value in values],
+                output_field=TextField(),
+            ),
+            len(SEARCH_DOCUMENT_SEPARATOR) + 1,
+        )
+    )
+
+
+def update_search_documents(cases: QuerySet[BaseCase]) -> int:
+    """
+    Rebuild the search document of cases in the database with a single update,
+    so that it also follows changes made by QuerySet.update() or to the name
+    of a sector or subcategory
+    """
+    return cases.update(search_document=build_search_document_expression())
+
+
+def build_case_search_query(search: str) -> Q:
+    """
+    Build query matching search term against the search document of each case,
+    or the end of its case identifier.
+
+    Each match is a separate query combined with UNION so that, on Postgres,
+    the substring match can use the trigram index on the search document and
+    whole words its full text search index.
+    """
+    matching_cases: list[QuerySet[BaseCase]] = [
+        BaseCase.objects.filter(search_document__contains=search.lower()),
+        BaseCase.objects.filter(
+            Q(case_identifier__endswith=search.upper())
+            | Q(case_identifier__endswith=f"{search}A".upper())
+        ),
+    ]
+    if connection.vendor == "postgresql":
+        matching_cases.append(
+            BaseCase.objects.filter(
+                SearchVectorExact(
+                    SearchVector("search_document", config=SEARCH_CONFIG),
+                    SearchQuery(search, config=SEARCH_CONFIG),
+                )
+            )
+        )
+    matching_case_ids, *other_matching_case_ids = [
+        cases.order_by().values("id") for cases in matching_cases
+    ]
+    return Q(id__in=matching_case_ids.union(*other_matching_case_ids))
+
+
 def filter_cases(form: CaseSearchForm) -> QuerySet[BaseCase]:
-    """Return a queryset of Cases filtered by the values in CaseSearchForm"""
+    """Return a queryset of Cases filtered by the values in CaseSearchForm."""
     filters: dict[str, Any] = {}
     search_query: Q = Q()
     sort_by: str = Sort.NEWEST
@@ -71,20 +240,8 @@ def filter_cases(form: CaseSearchForm) -> QuerySet[BaseCase]:
         if form.cleaned_data.get("case_number"):
             search_query = Q(case_number=form.cleaned_data["case_number"])
         elif form.cleaned_data.get("case_search"):
-            search: str = form.cleaned_data["case_search"]
-            search_query: Q = (
-                Q(organisation_name__icontains=search)
-                | Q(home_page_url__icontains=search)
-                | Q(psb_location__icontains=search)
-                | Q(sector__name__icontains=search)
-                | Q(parental_organisation_name__icontains=search)
-                | Q(website_name__icontains=search)
-                | Q(subcategory__name__icontains=search)
-                | Q(case_identifier__endswith=search.upper())
-                | Q(case_identifier__endswith=f"{search}A".upper())
-                | Q(mobilecase__app_name__icontains=search)
-                | Q(mobilecase__android_app_url__icontains=search)
-                | Q(mobilecase__ios_app_url__icontains=search)
+            search_query: Q = build_case_search_query(
+                search=form.cleaned_data["case_search"]
             )
 
     if str(filters.get("status", "")) == SimplifiedCase.Status.READY_TO_QA:
@@ -110,15 +267,175 @@ def filter_cases(form: CaseSearchForm) -> QuerySet[BaseCase]:
             .order_by("position_unassigned_first", "-id")
             .select_related("auditor", "reviewer")
         )
+    order_by: list[str] = [sort_by] if sort_by == "id" else [sort_by, "id"]
     return (
         BaseCase.objects.filter(search_query, **filters)
-        .order_by(sort_by)
+        .order_by(*order_by)
         .select_related("auditor", "reviewer")
     )
 
 
+def normalise_case_search_parameters(cleaned_data: dict[str, Any]) -> dict[str, str]:
+    """Return non-empty case search values as strings in a consistent form"""
+    parameters: dict[str, str] = {}
+    for field_name in SAVED_SEARCH_FIELD_NAMES:
+        value: Any = cleaned_data.get(field_name)
+        if value is None or value == "":
+            continue
+        if isinstance(value, models.Model):
+            value = value.pk
+        elif isinstance(value, date):
+            value = value.isoformat()
+        parameters[field_name] = str(value).strip()
+    return parameters
+
+
+def hash_case_search_parameters(parameters: dict[str, str]) -> str:
+    """Return hash identifying a normalised set of case search values"""
+    return hashlib.sha256(
+        json.dumps(parameters, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def get_case_search_form(parameters: dict[str, str]) -> CaseSearchForm:
+    """Return validated case search form populated from normalised search values"""
+    data: dict[str, str] = {}
+    for field_name, value in parameters.items():
+        if field_name in SAVED_SEARCH_DATE_FIELD_NAMES:
+            search_date: date = date.fromisoformat(value)
+            data[f"{field_name}_0"] = str(search_date.day)
+            data[f"{field_name}_1"] = str(search_date.month)
+            data[f"{field_name}_2"] = str(search_date.year)
+        else:
+            data[field_name] = value
+    form: CaseSearchForm = CaseSearchForm(data)
+    form.is_valid()
+    return form
+
+
+def get_saved_search_form(saved_search: SavedSearch) -> CaseSearchForm:
+    """Return validated case search form populated from saved search"""
+    return get_case_search_form(parameters=saved_search.parameters)
+
+
+def get_saved_search_case_ids(saved_search: SavedSearch) -> list[int]:
+    """
+    Return ids of cases matching saved search, running the search if not cached.
+
+    The cached ids give the number of cases found and the searches a saved
+    case matched. Pages of results are still found by the search itself.
+    """
+    if (
+        saved_search.case_ids is None
+        or saved_search.cached is None
+        or saved_search.cached < timezone.now() - SAVED_SEARCH_CACHE_TIMEOUT
+    ):
+        saved_search.case_ids = list(
+            filter_cases(
+                form=get_saved_search_form(saved_search=saved_search)
+            ).values_list("id", flat=True)
+        )
+        saved_search.cached = timezone.now()
+        saved_search.save(update_fields=["case_ids", "cached"])
+    return saved_search.case_ids
+
+
+def get_case_search_count(
+    form: CaseSearchForm, cases: QuerySet[BaseCase]
+) -> tuple[int, bool]:
+    """
+    Return number of cases found by search and whether it is approximate,
+    caching the result for the normalised search values.
+
+    Cached counts are not discarded when cases are saved, as the default
+    cache is local to each process, so a count can be up to
+    CASE_SEARCH_COUNT_CACHE_TIMEOUT seconds out of date.
+    """
+    if form.errors:
+        return get_approximate_count(queryset=cases)
+    parameters: dict[str, str] = normalise_case_search_parameters(
+        cleaned_data=getattr(form, "cleaned_data", {})
+    )
+    cache_key: str = (
+        f"case-search-count:{hash_case_search_parameters(parameters=parameters)}"
+    )
+    cached_count: tuple[int, bool] | None = cache.get(cache_key)
+    if cached_count is not None:
+        return cached_count
+    count: tuple[int, bool] = get_approximate_count(queryset=cases)
+    cache.set(cache_key, count, timeout=CASE_SEARCH_COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def invalidate_saved_search_results(base_case: BaseCase) -> None:
+    """
+    Clear cached results of the saved searches which a saved case matched when
+    they were cached or matches now, finding which searches it now matches in
+    a single query
+    """
+    saved_searches: list[SavedSearch] = list(
+        SavedSearch.objects.filter(cached__isnull=False).only(
+            "id", "parameters", "case_ids"
+        )
+    )
+    if not saved_searches:
+        return
+    matches: dict[str, bool] = (
+        BaseCase.objects.filter(id=base_case.id)
+        .values(
+            **{
+                f"saved_search_{saved_search.id}": Exists(
+                    filter_cases(
+                        form=SavedSearchValues(cleaned_data=saved_search.parameters)
+                    ).filter(id=OuterRef("id"))
+                )
+                for saved_search in saved_searches
+            }
+        )
+        .first()
+    ) or {}
+    saved_search_ids: list[int] = [
+        saved_search.id
+        for saved_search in saved_searches
+        if base_case.id in (saved_search.case_ids or [])
+        or matches.get(f"saved_search_{saved_search.id}")
+    ]
+    if saved_search_ids:
+        SavedSearch.objects.filter(id__in=saved_search_ids).update(
+            case_ids=None, cached=None
+        )
+
+
+def prefetch_concrete_cases(base_cases: list[BaseCase]) -> list[BaseCase]:
+    """
+    Fetch the simplified, detailed and mobile cases for a list of cases with
+    one query per testing type so that get_case() does not query each row.
+    """
+    case_ids_by_test_type: dict[str, list[int]] = {}
+    for base_case in base_cases:
+        case_ids_by_test_type.setdefault(base_case.test_type, []).append(base_case.id)
+
+    for test_type, case_ids in case_ids_by_test_type.items():
+        concrete_case_model: type[BaseCase] | None = CONCRETE_CASE_MODELS.get(test_type)
+        if concrete_case_model is None:
+            continue
+        concrete_cases: dict[int, BaseCase] = concrete_case_model.objects.in_bulk(
+            case_ids
+        )
+        related_case = BaseCase._meta.get_field(concrete_case_model._meta.model_name)
+        for base_case in base_cases:
+            if base_case.id in concrete_cases and base_case.test_type == test_type:
+                related_case.set_cached_value(base_case, concrete_cases[base_case.id])
+    return base_cases
+
+
 def find_duplicate_cases(url: str, organisation_name: str = "") -> QuerySet[BaseCase]:
-    """Look for cases with matching domain or organisation name"""
+    """
+    Look for cases with matching domain or organisation name.
+
+    On Postgres the domain is matched using its B-tree index and the organisation
+    name using the trigram index on UPPER(organisation_name).
+    """
     domain: str = extract_domain_from_url(url)
     if organisation_name:
         return BaseCase.objects.filter(
@@ -127,6 +444,166 @@ def find_duplicate_cases(url: str, organisation_name: str = "") -> QuerySet[Base
     return BaseCase.objects.filter(domain=domain)
 
 
+def find_cases_containing_search_terms(
+    search_terms: list[str], cases: QuerySet[BaseCase]
+) -> dict[str, list[BaseCase]]:
+    """
+    Find the cases with home page URLs containing each of a list of lowercase
+    search terms. Search terms are matched together, in batches, using the
+    trigram index on home page URL. Empty search terms match no cases.
+    """
+    matching_cases: dict[str, list[BaseCase]] = {
+        search_term: [] for search_term in search_terms
+    }
+    sorted_search_terms: list[str] = sorted(
+        search_term for search_term in matching_cases if search_term
+    )
+    for start in range(0, len(sorted_search_terms), BULK_URL_SEARCH_BATCH_SIZE):
+        batch: list[str] = sorted_search_terms[
+            start : start + BULK_URL_SEARCH_BATCH_SIZE
+        ]
+        url_query: Q = Q()
+        for search_term in batch:
+            url_query |= Q(home_page_url__icontains=search_term)
+        for base_case in cases.filter(url_query).order_by("id"):
+            home_page_url: str = base_case.home_page_url.lower()
+            for search_term in batch:
+                if search_term in home_page_url:
+                    matching_cases[search_term].append(base_case)
+    return matching_cases
+
+
+def get_bulk_url_search_term(url: str) -> str:
+    """Return the unique part of the domain of a URL, or the URL if there is none"""
+    sanitised_domain: str = sanitise_domain(extract_domain_from_url(url))
+    return sanitised_domain if sanitised_domain else url
+
+
+def find_cases_matching_urls(
+    urls: list[str], cases: QuerySet[BaseCase], all_matching_cases: bool = True
+) -> dict[str, list[BaseCase]]:
+    """
+    Find the cases matching the lowercase search term of each URL, ignoring
+    blank URLs.
+
+    Unless all matching cases are needed, cases with exactly the same domain
+    as a URL are found first using the index on domain. They match only if
+    their home page URL still contains the search term, so the result is the
+    same as substring matching, which is used for the remaining search terms.
+    """
+    search_terms: set[str] = set()
+    search_terms_by_domain: dict[str, set[str]] = {}
+    for url in urls:
+        if not url.strip():
+            continue
+        search_term: str = get_bulk_url_search_term(url)
+        search_terms.add(search_term.lower())
+        if search_term != url:
+            search_terms_by_domain.setdefault(
+                extract_domain_from_url(url).lower(), set()
+            ).add(search_term.lower())
+
+    matching_cases: dict[str, list[BaseCase]] = {
+        search_term: [] for search_term in search_terms
+    }
+    if not all_matching_cases:
+        for base_case in cases.filter(domain__in=search_terms_by_domain):
+            home_page_url: str = base_case.home_page_url.lower()
+            for search_term in search_terms_by_domain.get(base_case.domain, set()):
+                if search_term in home_page_url:
+                    matching_cases[search_term].append(base_case)
+
+    matching_cases.update(
+        find_cases_containing_search_terms(
+            search_terms=[
+                search_term
+                for search_term, found_cases in matching_cases.items()
+                if not found_cases
+            ],
+            cases=cases,
+        )
+    )
+    return matching_cases
+
+
+def bulk_url_search(urls: list[str]) -> list[dict[str, Any]]:
+    """
+    Look for cases matching each of a list of URLs, ignoring blank lines.
+
+    Each URL is reduced to the unique part of its domain, which is searched for
+    in the home page URLs of cases.
+    """
+    matching_cases: dict[str, list[BaseCase]] = find_cases_matching_urls(
+        urls=urls,
+        cases=BaseCase.objects.only("domain", "home_page_url"),
+        all_matching_cases=False,
+    )
+    bulk_search_results: list[dict[str, Any]] = []
+    for url in urls:
+        if not url.strip():
+            continue
+        search_term: str = get_bulk_url_search_term(url)
+        bulk_search_results.append(
+            {
+                "search_term": search_term,
+                "found_flag": bool(matching_cases[search_term.lower()]),
+                "url": url,
+            }
+        )
+    return bulk_search_results
+
+
+def bulk_url_search_csv_generator(urls: list[str]) -> Generator[str, None, None]:
+    """
+    Generate the content of a CSV of all the cases matching each URL, looking
+    up the URLs a batch at a time and leaving out blank URLs
+    """
+
+    class DummyFile:
+        def write(self, value_to_write):
+            return value_to_write
+
+    writer: Any = csv.writer(DummyFile())
+    yield writer.writerow(BULK_URL_SEARCH_CSV_COLUMN_HEADERS)
+
+    for start in range(0, len(urls), BULK_URL_SEARCH_BATCH_SIZE):
+        batch: list[str] = [
+            url
+            for url in urls[start : start + BULK_URL_SEARCH_BATCH_SIZE]
+            if url.strip()
+        ]
+        matching_cases: dict[str, list[BaseCase]] = find_cases_matching_urls(
+            urls=batch,
+            cases=BaseCase.objects.select_related("auditor").only(
+                "case_identifier",
+                "status",
+                "domain",
+                "home_page_url",
+                "auditor__first_name",
+                "auditor__last_name",
+            ),
+        )
+        output: str = ""
+        for url in batch:
+            search_term: str = get_bulk_url_search_term(url)
+            cases: list[BaseCase] = matching_cases[search_term.lower()]
+            output += writer.writerow(
+                [
+                    url,
+                    search_term,
+                    "Yes" if cases else "No",
+                    len(cases),
+                    "; ".join(base_case.case_identifier for base_case in cases),
+                    "; ".join(base_case.get_status_display() for base_case in cases),
+                    "; ".join(
+                        base_case.auditor.get_full_name() if base_case.auditor else ""
+                        for base_case in cases
+                    ),
+                ]
+            )
+        yield output
+
+
 class S3ReadWriteFile(S3Wrapper):
     def write_case_file_to_s3(
         self,
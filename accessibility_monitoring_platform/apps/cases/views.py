@@ -2,6 +2,7 @@
 Views for cases app
 """
 
+import urllib
 from typing import Any
 
 from django import forms
@@ -9,29 +10,56 @@ from django.contrib.auth.models import User
 from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.db.models.query import QuerySet
-from django.http import FileResponse, HttpRequest, HttpResponse, HttpResponseRedirect
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.views.generic.detail import DetailView
-from django.views.generic.edit import FormView, UpdateView
+from django.views.generic.edit import CreateView, FormView, UpdateView
 from django.views.generic.list import ListView
 
 from ..common.utils import (
+    KEYSET_AFTER_PARAM,
+    KEYSET_BEFORE_PARAM,
+    KeysetPage,
     check_dict_for_truthy_values,
     get_dict_without_page_items,
     get_url_parameters_for_pagination,
+    paginate_queryset_by_keyset,
     replace_search_key_with_case_search,
 )
 from ..common.views import HideCaseNavigationMixin
+from .export_jobs import export_job_output_generator, request_export_job
 from .forms import (
     CaseFileDeleteForm,
     CaseFileUpdateForm,
     CaseFileUploadForm,
     CaseSearchForm,
+    ExportJobCreateForm,
+    SavedSearchCreateForm,
 )
-from .models import BaseCase, CaseFile
+from .lookup_utils import case_lookup_index
+from .models import BaseCase, CaseFile, ExportJob, SavedSearch
 from .record_event import record_create_event
-from .utils import S3ReadWriteFile, filter_cases
+from .utils import (
+    S3ReadWriteFile,
+    filter_cases,
+    get_case_search_count,
+    get_saved_search_case_ids,
+    get_saved_search_form,
+    hash_case_search_parameters,
+    normalise_case_search_parameters,
+    prefetch_concrete_cases,
+)
+
+SAVED_SEARCH_PARAM: str = "saved_search"
+RECENT_EXPORT_JOBS_LIMIT: int = 5
 
 AUDITOR_SEARCH_FIELDS: list[str] = [
     "auditor",
@@ -99,12 +127,21 @@ class CaseListView(ListView):
 
     model: type[BaseCase] = BaseCase
     context_object_name: str = "base_cases"
-    paginate_by: int = 20
+    page_size: int = 20
     template_name: str = "cases/basecase_list.html"
 
     def get(self, request, *args, **kwargs):
         """Populate filter form"""
-        if self.request.GET:
+        self.saved_search: SavedSearch | None = None
+        saved_search_id: str = self.request.GET.get(SAVED_SEARCH_PARAM, "")
+        if saved_search_id.isdigit():
+            self.saved_search = get_object_or_404(
+                SavedSearch, id=saved_search_id, user=self.request.user
+            )
+            self.form: CaseSearchForm = get_saved_search_form(
+                saved_search=self.saved_search
+            )
+        elif self.request.GET:
             self.form: CaseSearchForm = CaseSearchForm(
                 replace_search_key_with_case_search(self.request.GET)
             )
@@ -117,13 +154,32 @@ class CaseListView(ListView):
         """Add filters to queryset"""
         if self.form.errors:
             return BaseCase.objects.none()
-
         return filter_cases(self.form)
 
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         """Add field values into context"""
         context: dict[str, Any] = super().get_context_data(**kwargs)
 
+        keyset_page: KeysetPage = paginate_queryset_by_keyset(
+            queryset=self.object_list,
+            page_size=self.page_size,
+            after=self.request.GET.get(KEYSET_AFTER_PARAM, ""),
+            before=self.request.GET.get(KEYSET_BEFORE_PARAM, ""),
+        )
+        if self.saved_search is not None and not self.form.errors:
+            number_of_cases: int = len(
+                get_saved_search_case_ids(saved_search=self.saved_search)
+            )
+            count_is_approximate: bool = False
+        else:
+            number_of_cases, count_is_approximate = get_case_search_count(
+                form=self.form, cases=self.object_list
+            )
+        context["keyset_page"] = keyset_page
+        context["base_cases"] = prefetch_concrete_cases(keyset_page.object_list)
+        context["number_of_cases"] = number_of_cases
+        context["count_is_approximate"] = count_is_approximate
+
         filter_fields: dict[str, str] = get_dict_without_page_items(
             self.request.GET.items()
         )
@@ -147,9 +203,98 @@ class CaseListView(ListView):
         context["url_parameters"] = get_url_parameters_for_pagination(
             request=self.request
         )
+        context["search_url_parameters"] = (
+            urllib.parse.urlencode(self.form.data)
+            if self.saved_search is not None
+            else context["url_parameters"]
+        )
+        context["saved_search"] = self.saved_search
+        context["saved_searches"] = SavedSearch.objects.filter(user=self.request.user)
+        context["saved_search_form"] = SavedSearchCreateForm()
+        context["export_job_form"] = ExportJobCreateForm()
+        context["export_jobs"] = ExportJob.objects.filter(
+            requested_by=self.request.user
+        )[:RECENT_EXPORT_JOBS_LIMIT]
         return context
 
 
+class SavedSearchCreateView(CreateView):
+    """
+    Save the case search in the URL parameters for the current user
+    """
+
+    model: type[SavedSearch] = SavedSearch
+    form_class: type[SavedSearchCreateForm] = SavedSearchCreateForm
+    http_method_names: list[str] = ["post"]
+
+    def form_valid(self, form: SavedSearchCreateForm) -> HttpResponseRedirect:
+        """Store normalised search parameters, replacing any identical search"""
+        case_search_form: CaseSearchForm = CaseSearchForm(
+            replace_search_key_with_case_search(self.request.GET)
+        )
+        case_search_form.is_valid()
+        parameters: dict[str, str] = normalise_case_search_parameters(
+            cleaned_data=case_search_form.cleaned_data
+        )
+        self.object, _ = SavedSearch.objects.update_or_create(
+            user=self.request.user,
+            parameters_hash=hash_case_search_parameters(parameters=parameters),
+            defaults={
+                "name": form.cleaned_data["name"] or "Saved search",
+                "parameters": parameters,
+            },
+        )
+        return HttpResponseRedirect(self.object.get_absolute_url())
+
+
+class ExportJobCreateView(CreateView):
+    """
+    Queue export of the case search in the URL parameters, or show the
+    existing job for an identical export
+    """
+
+    model: type[ExportJob] = ExportJob
+    form_class: type[ExportJobCreateForm] = ExportJobCreateForm
+    http_method_names: list[str] = ["post"]
+
+    def form_valid(self, form: ExportJobCreateForm) -> HttpResponseRedirect:
+        """Find or create export job for search"""
+        case_search_form: CaseSearchForm = CaseSearchForm(
+            replace_search_key_with_case_search(self.request.GET)
+        )
+        case_search_form.is_valid()
+        self.object = request_export_job(
+            export_type=form.cleaned_data["type"],
+            case_search_form=case_search_form,
+            user=self.request.user,
+        )
+        return HttpResponseRedirect(self.object.get_absolute_url())
+
+
+class ExportJobDetailView(DetailView):
+    """
+    View progress of export job
+    """
+
+    model: type[ExportJob] = ExportJob
+    context_object_name: str = "export_job"
+
+
+def export_job_download(
+    request: HttpRequest, pk: int
+) -> StreamingHttpResponse | HttpResponseRedirect:
+    """Download CSV written by export job"""
+    export_job: ExportJob = get_object_or_404(ExportJob, id=pk)
+    if export_job.status != ExportJob.Status.COMPLETE:
+        return HttpResponseRedirect(export_job.get_absolute_url())
+    response = StreamingHttpResponse(
+        export_job_output_generator(export_job=export_job),
+        content_type="text/csv",
+    )
+    response["Content-Disposition"] = f"attachment; filename={export_job.filename}"
+    return response
+
+
 class CaseFileListView(HideCaseNavigationMixin, DetailView):
     """
     View of Documents for a case
@@ -218,3 +363,15 @@ def case_file_download(request: HttpRequest, pk: int) -> FileResponse | HttpResp
     if isinstance(file_to_download, str):
         return HttpResponse(file_to_download)
     return FileResponse(ContentFile(file_to_download, case_file.name))
+
+
+def case_lookup(request: HttpRequest) -> JsonResponse:
+    """Return cases whose identifier, organisation name or domain start with q"""
+    return JsonResponse(
+        {
+            "results": [
+                entry.as_dict()
+                for entry in case_lookup_index.search(prefix=request.GET.get("q", ""))
+            ]
+        }
+    )
@@ -3,10 +3,14 @@ Admin for common app
 """
 
 import csv
+from typing import Any, Generator
 
-from django.contrib import admin
-from django.http import HttpResponse
+from django.contrib import admin, messages
+from django.db.models import Field, QuerySet
+from django.db.models.options import Options
+from django.http import HttpRequest, StreamingHttpResponse
 
+from ..cases.csv_export import csv_streaming_response
 from .models import (
     ChangeToPlatform,
     EmailTemplate,
@@ -20,25 +24,74 @@ from .models import (
     UserCacheUniqueHash,
 )
 
+ADMIN_CSV_EXPORT_CHUNK_SIZE: int = 2000
+ADMIN_CSV_EXPORT_APP_PREFIX: str = "accessibility_monitoring_platform.apps."
 
-class ExportCsvMixin:
-    """Mixin which adds csv export django admin action"""
 
-    def export_as_csv(self, request, queryset):  # pylint: disable=unused-argument
-        meta = self.model._meta  # pylint: disable=protected-access
-        field_names = [field.name for field in meta.fields]
+def admin_csv_output_generator(
+    queryset: QuerySet, fields: list[Field]
+) -> Generator[str, None, None]:
+    """
+    Generate CSV of the field values of each object in queryset, reading the
+    values a chunk of rows at a time rather than loading every object
+    """
 
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f"attachment; filename={meta}.csv"
-        writer = csv.writer(response)
+    class DummyFile:
+        def write(self, value_to_write):
+            return value_to_write
+
+    writer: Any = csv.writer(DummyFile())
+    output: str = writer.writerow([field.attname for field in fields])
+    for counter, row in enumerate(
+        queryset.values_list(*[field.attname for field in fields]).iterator(
+            chunk_size=ADMIN_CSV_EXPORT_CHUNK_SIZE
+        ),
+        start=1,
+    ):
+        output += writer.writerow(row)
+        if counter % ADMIN_CSV_EXPORT_CHUNK_SIZE == 0:
+            yield output
+            output = ""
+    if output:
+        yield output
+
+
+@admin.action(description="Export selected as CSV", permissions=["change"])
+def export_as_csv(
+    modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet
+) -> StreamingHttpResponse | None:
+    """
+    Admin action available on every model to download the selected objects.
+
+    Only models of the platform's own apps are exported so that users,
+    sessions and one-time password devices cannot be downloaded.
+    """
+    meta: Options = modeladmin.model._meta  # pylint: disable=protected-access
+    if not meta.app_config.name.startswith(ADMIN_CSV_EXPORT_APP_PREFIX):
+        modeladmin.message_user(
+            request,
+            f"Export of {meta.verbose_name_plural} is not allowed",
+            messages.ERROR,
+        )
+        return None
+    return csv_streaming_response(
+        output_generator=admin_csv_output_generator(
+            queryset=queryset, fields=list(meta.concrete_fields)
+        ),
+        filename=f"{meta}.csv",
+    )
 
-        writer.writerow(field_names)
-        for obj in queryset:
-            writer.writerow([getattr(obj, field) for field in field_names])
 
-        return response
+class ExportCsvDisabledMixin:
+    """Remove the CSV export action from an admin of sensitive data"""
 
-    export_as_csv.short_description = "Export Selected"
+    def get_actions(self, request: HttpRequest) -> dict[str, Any]:
+        actions: dict[str, Any] = super().get_actions(request)
+        actions.pop("export_as_csv", None)
+        return actions
+
+
+admin.site.add_action(export_as_csv)
 
 
 class EmailTemplateAdmin(admin.ModelAdmin):
@@ -72,7 +125,7 @@ class EmailTemplateAdmin(admin.ModelAdmin):
     show_facets = admin.ShowFacets.ALWAYS
 
 
-class IssueReportAdmin(admin.ModelAdmin, ExportCsvMixin):
+class IssueReportAdmin(admin.ModelAdmin):
     """Django admin configuration for IssueReport model"""
 
     readonly_fields = [
@@ -117,8 +170,6 @@ class IssueReportAdmin(admin.ModelAdmin, ExportCsvMixin):
     )
     show_facets = admin.ShowFacets.ALWAYS
 
-    actions = ["export_as_csv"]
-
     def has_delete_permission(
         self, request, obj=None
     ):  # pylint: disable=unused-argument
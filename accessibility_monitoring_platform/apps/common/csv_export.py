@@ -1,9 +1,11 @@
 """Utility functions for CSV exports"""
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, Literal
 
+from ..audits.models import StatementAudit, WcagAudit
 from ..detailed.models import Contact as DetailedContact
 from ..detailed.models import DetailedCase
 from ..reports.models import Report
@@ -16,6 +18,15 @@ TWELVE_WEEK_WCAG_AUDIT: str = "WcagAudit TwelveWeek"
 INITIAL_STATEMENT_AUDIT: str = "StatementAudit Initial"
 TWELVE_WEEK_STATEMENT_AUDIT: str = "StatementAudit TwelveWeek"
 
+SOURCE_CLASSKEY_MODELS: dict[str, type] = {
+    INITIAL_WCAG_AUDIT: WcagAudit,
+    TWELVE_WEEK_WCAG_AUDIT: WcagAudit,
+    INITIAL_STATEMENT_AUDIT: StatementAudit,
+    TWELVE_WEEK_STATEMENT_AUDIT: StatementAudit,
+}
+
+ColumnExtractor = Callable[[Any], Any]
+
 
 ExportableClassKeys = Literal[
     INITIAL_WCAG_AUDIT,
@@ -83,3 +94,131 @@ def format_model_field(
         return getattr(source_instance, get_display_name)()
     else:
         return value
+
+
+def format_date_value(value: Any) -> Any:
+    """Format dates and datetimes for export, returning other values unchanged"""
+    if isinstance(value, date):
+        return value.strftime("%d/%m/%Y")
+    return value
+
+
+def build_enforcement_body_extractor(column: CSVColumn) -> ColumnExtractor:
+    """Return function which formats the enforcement body in upper case"""
+    source_attr: str = column.source_attr
+
+    def extract_enforcement_body(source_instance: Any) -> Any:
+        if source_instance is None:
+            return ""
+        value: Any = getattr(source_instance, source_attr, "")
+        if isinstance(value, date):
+            return format_date_value(value)
+        return value.upper()
+
+    return extract_enforcement_body
+
+
+def build_model_field_extractor(column: CSVColumn) -> ColumnExtractor:
+    """
+    Return function which formats the value with format_model_field, for
+    columns whose source model is not known in advance
+    """
+    return lambda source_instance: format_model_field(
+        source_instance=source_instance, column=column
+    )
+
+
+def build_display_extractor(column: CSVColumn) -> ColumnExtractor:
+    """Return function which formats the value using its choice label"""
+    source_attr: str = column.source_attr
+    get_display_name: str = f"get_{source_attr}_display"
+
+    def extract_display(source_instance: Any) -> Any:
+        if source_instance is None:
+            return ""
+        value: Any = getattr(source_instance, source_attr, "")
+        if isinstance(value, date):
+            return format_date_value(value)
+        return getattr(source_instance, get_display_name)()
+
+    return extract_display
+
+
+def build_value_extractor(column: CSVColumn) -> ColumnExtractor:
+    """Return function which formats the value, formatting any date"""
+    source_attr: str = column.source_attr
+
+    def extract_value(source_instance: Any) -> Any:
+        if source_instance is None:
+            return ""
+        return format_date_value(getattr(source_instance, source_attr, ""))
+
+    return extract_value
+
+
+COLUMN_EXTRACTOR_BUILDERS: dict[str, Callable[[CSVColumn], ColumnExtractor]] = {
+    "enforcement_body": build_enforcement_body_extractor,
+    "model_field": build_model_field_extractor,
+    "display": build_display_extractor,
+    "value": build_value_extractor,
+}
+
+
+def get_column_formatter_name(column: CSVColumn) -> str:
+    """Return name of the formatter used for the column's values"""
+    if column.source_attr == "enforcement_body":
+        return "enforcement_body"
+    source_class: type | None = (
+        column.source_classkey
+        if isinstance(column.source_classkey, type)
+        else SOURCE_CLASSKEY_MODELS.get(column.source_classkey)
+    )
+    if source_class is None:
+        return "model_field"
+    if hasattr(source_class, f"get_{column.source_attr}_display"):
+        return "display"
+    return "value"
+
+
+def compile_column_extractor(column: CSVColumn) -> ColumnExtractor:
+    """
+    Return function which formats the column's value from a source instance
+    in the same way as format_model_field, with the formatter chosen once for
+    the column rather than for every cell.
+    """
+    return COLUMN_EXTRACTOR_BUILDERS[get_column_formatter_name(column)](column)
+
+
+CompiledColumns = tuple[tuple[ExportableClassKeys, ColumnExtractor], ...]
+_compiled_columns: dict[int, tuple[list[CSVColumn], CompiledColumns]] = {}
+
+
+def get_column_extractors(column_definitions: list[CSVColumn]) -> CompiledColumns:
+    """
+    Return source class key and extractor for each column definition,
+    compiling each list of definitions once
+    """
+    compiled: tuple[list[CSVColumn], CompiledColumns] | None = _compiled_columns.get(
+        id(column_definitions)
+    )
+    if compiled is None or compiled[0] is not column_definitions:
+        compiled = (
+            column_definitions,
+            tuple(
+                (column.source_classkey, compile_column_extractor(column))
+                for column in column_definitions
+            ),
+        )
+        _compiled_columns[id(column_definitions)] = compiled
+    return compiled[1]
+
+
+def build_csv_row(
+    source_instances: dict[ExportableClassKeys, Any],
+    column_definitions: list[CSVColumn],
+) -> list[Any]:
+    """Return formatted values of columns for a row of the export"""
+    return [
+        extract(source_instances.get(source_classkey))
+        for source_classkey, extract in get_column_extractors(column_definitions)
+    ]
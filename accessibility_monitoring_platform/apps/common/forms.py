@@ -2,6 +2,7 @@
 Common widgets and form fields
 """
 
+import csv
 import logging
 from collections.abc import Iterable, Mapping
 from datetime import date, datetime
@@ -10,6 +11,7 @@ from zoneinfo import ZoneInfo
 
 from django import forms
 from django.contrib.auth.models import User
+from django.core.files.uploadedfile import UploadedFile
 
 from .models import (
     AUDITOR_GROUP_NAME,
@@ -512,6 +514,28 @@ FooterLinkOneExtraFormset: Any = forms.modelformset_factory(
 
 class BulkURLSearchForm(forms.Form):
     urls = AMPTextField(label="URLs")
+    urls_file = forms.FileField(
+        label="Or upload a CSV or text file of URLs to download the results",
+        help_text="The URLs are read from the first column",
+        required=False,
+        widget=forms.FileInput(attrs={"class": "govuk-file-upload"}),
+    )
+
+    def clean_urls(self) -> list[str]:
+        """Return the URLs entered one per line, leaving out blank lines"""
+        return [
+            url.strip() for url in self.cleaned_data["urls"].splitlines() if url.strip()
+        ]
+
+    def clean_urls_file(self) -> list[str]:
+        """Return the URLs in the first column of the uploaded file"""
+        urls_file: UploadedFile | None = self.cleaned_data.get("urls_file")
+        if urls_file is None:
+            return []
+        lines: list[str] = (
+            urls_file.read().decode("utf-8-sig", errors="replace").splitlines()
+        )
+        return [row[0].strip() for row in csv.reader(lines) if row and row[0].strip()]
 
 
 class ImportCSVForm(forms.Form):
@@ -29,7 +29,7 @@ from ..audits.models import (
     WcagPageInitial,
     WcagPageRetest,
 )
-from ..cases.models import BaseCase, CaseFile
+from ..cases.models import BaseCase, CaseFile, ExportJob
 from ..comments.models import Comment
 from ..detailed.forms import (
     DetailedCaseCloseUpdateForm,
@@ -2611,6 +2611,12 @@ SITE_MAP: list[PlatformPageGroup] = (
                     url_kwarg_key="pk",
                     instance_class=Task,
                 ),
+                PlatformPage(
+                    name="Background export",
+                    url_name="cases:export-job-detail",
+                    url_kwarg_key="pk",
+                    instance_class=ExportJob,
+                ),
                 PlatformPage(name="Privacy notice", url_name="common:privacy-notice"),
             ],
         ),
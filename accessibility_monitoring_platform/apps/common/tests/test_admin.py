@@ -4,12 +4,17 @@ Test - common admin actions
 
 import csv
 import io
+from unittest.mock import patch
 
-from django.contrib.auth.models import User
-from django.http import HttpResponse
+import pytest
+from django.contrib import admin
+from django.contrib.auth.models import Group, Permission, User
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.urls import reverse
 
-from ..models import IssueReport
+from ...simplified.models import SimplifiedCase
+from ..admin import admin_csv_output_generator
+from ..models import EventHistory, IssueReport
 
 ISSUE_REPORT_GOAL_DESCRIPTION_1: str = "Issue One"
 ISSUE_REPORT_GOAL_DESCRIPTION_2: str = "Issue Two"
@@ -31,7 +36,7 @@ def test_issue_report_export_as_csv(admin_client):
         issue_description=ISSUE_REPORT_ISSUE_DESCRIPTION_2,
     )
 
-    response: HttpResponse = admin_client.post(
+    response: StreamingHttpResponse = admin_client.post(
         reverse("admin:common_issuereport_changelist"),
         {
             "action": "export_as_csv",
@@ -40,8 +45,13 @@ def test_issue_report_export_as_csv(admin_client):
     )
 
     assert response.status_code == 200
+    assert response.headers["Content-Type"] == "text/csv"
+    assert (
+        response.headers["Content-Disposition"]
+        == "attachment; filename=common.issuereport.csv"
+    )
 
-    content = response.content.decode("utf-8")
+    content = b"".join(response.streaming_content).decode("utf-8")
     csv_reader = csv.reader(io.StringIO(content))
     rows = list(csv_reader)
 
@@ -53,7 +63,7 @@ def test_issue_report_export_as_csv(admin_client):
         "page_title",
         "goal_description",
         "issue_description",
-        "created_by",
+        "created_by_id",
         "created",
         "complete",
         "trello_ticket",
@@ -63,3 +73,125 @@ def test_issue_report_export_as_csv(admin_client):
     assert rows[2][4] == ISSUE_REPORT_GOAL_DESCRIPTION_1
     assert rows[1][5] == ISSUE_REPORT_ISSUE_DESCRIPTION_2
     assert rows[2][5] == ISSUE_REPORT_ISSUE_DESCRIPTION_1
+    assert rows[1][6] == str(user.id)
+
+
+def test_export_as_csv_available_on_every_admin():
+    """Test CSV export action is available on every registered model"""
+    for model_admin in admin.site._registry.values():
+        assert "export_as_csv" in [
+            name for _, name, _ in model_admin._get_base_actions()
+        ]
+
+
+def test_export_as_csv_not_available_on_user_admin(admin_client):
+    """Test CSV export action is removed from the user admin"""
+    response: HttpResponse = admin_client.get(reverse("admin:auth_user_changelist"))
+
+    assert response.status_code == 200
+    assert "export_as_csv" not in [
+        name for name, _ in response.context["action_form"].fields["action"].choices
+    ]
+
+
+@pytest.mark.django_db
+def test_export_as_csv_requires_change_permission(rf):
+    """Test CSV export action is only offered to users who can change the model"""
+    model_admin: admin.ModelAdmin = admin.site._registry[IssueReport]
+    request: HttpRequest = rf.get("/")
+    request.user = User.objects.create(username="viewer", is_staff=True)
+    request.user.user_permissions.add(
+        Permission.objects.get(codename="view_issuereport")
+    )
+
+    assert "export_as_csv" not in model_admin.get_actions(request)
+
+    request.user.user_permissions.add(
+        Permission.objects.get(codename="change_issuereport")
+    )
+    request.user = User.objects.get(id=request.user.id)
+
+    assert "export_as_csv" in model_admin.get_actions(request)
+
+
+def test_export_as_csv_refuses_models_outside_platform(admin_client):
+    """Test CSV export of models of other apps is refused"""
+    group: Group = Group.objects.create(name="Group")
+
+    response: HttpResponse = admin_client.post(
+        reverse("admin:auth_group_changelist"),
+        {"action": "export_as_csv", "_selected_action": [group.id]},
+        follow=True,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] != "text/csv"
+    assert "Export of groups is not allowed" in [
+        str(message) for message in response.context["messages"]
+    ]
+
+
+@pytest.mark.parametrize(
+    "changelist_url_name",
+    [
+        "admin:simplified_simplifiedcase_changelist",
+        "admin:common_eventhistory_changelist",
+    ],
+)
+def test_export_as_csv_large_tables(changelist_url_name, admin_client):
+    """Test action streams export of simplified cases and event history"""
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        organisation_name="Org Name"
+    )
+    event_history: EventHistory = EventHistory.objects.create(
+        created_by=User.objects.create(), parent=simplified_case
+    )
+    selected_id: int = (
+        simplified_case.id
+        if changelist_url_name.startswith("admin:simplified")
+        else event_history.id
+    )
+
+    response: StreamingHttpResponse = admin_client.post(
+        reverse(changelist_url_name),
+        {"action": "export_as_csv", "_selected_action": [selected_id]},
+    )
+
+    assert response.status_code == 200
+
+    rows: list[list[str]] = list(
+        csv.reader(io.StringIO(b"".join(response.streaming_content).decode("utf-8")))
+    )
+
+    assert len(rows) == 2
+    assert rows[0][0] == "id"
+    assert rows[1][0] == str(selected_id)
+
+
+@pytest.mark.django_db
+def test_admin_csv_output_generator_yields_chunks():
+    """Test CSV is generated one chunk of rows at a time"""
+    user: User = User.objects.create()
+    issue_reports: list[IssueReport] = [
+        IssueReport.objects.create(created_by=user, issue_description=issue_description)
+        for issue_description in ["One", "Two", "Three"]
+    ]
+
+    with patch(
+        "accessibility_monitoring_platform.apps.common.admin.ADMIN_CSV_EXPORT_CHUNK_SIZE",
+        2,
+    ):
+        chunks: list[str] = list(
+            admin_csv_output_generator(
+                queryset=IssueReport.objects.order_by("id"),
+                fields=[
+                    IssueReport._meta.get_field("id"),
+                    IssueReport._meta.get_field("issue_description"),
+                ],
+            )
+        )
+
+    assert len(chunks) == 2
+    assert chunks[0].splitlines()[0] == "id,issue_description"
+    assert chunks[0].splitlines()[2].endswith(",Two")
+    assert chunks[1].splitlines() == [f"{issue_reports[2].id},Three"]
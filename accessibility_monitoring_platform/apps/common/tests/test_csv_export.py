@@ -4,8 +4,18 @@ from datetime import date
 
 import pytest
 
+from ...audits.models import WcagAudit
 from ...simplified.models import SimplifiedCase
-from ..csv_export import CSVColumn, EqualityBodyCSVColumn, format_model_field
+from ..csv_export import (
+    INITIAL_WCAG_AUDIT,
+    CSVColumn,
+    EqualityBodyCSVColumn,
+    build_csv_row,
+    compile_column_extractor,
+    format_model_field,
+    get_column_extractors,
+    get_column_formatter_name,
+)
 
 
 def test_format_model_field_with_no_data():
@@ -71,6 +81,7 @@ def test_format_model_field(column, case_value, expected_formatted_value):
     assert expected_formatted_value == format_model_field(
         source_instance=simplified_case, column=column
     )
+    assert expected_formatted_value == compile_column_extractor(column)(simplified_case)
 
 
 def test_required_data_missing():
@@ -92,3 +103,94 @@ def test_required_data_missing():
     equality_body_csv_column.formatted_data = "formatted string"
 
     assert equality_body_csv_column.required_data_missing is False
+
+
+@pytest.mark.parametrize(
+    "source_classkey",
+    [SimplifiedCase, "Unknown class key"],
+)
+def test_compile_column_extractor_with_no_data(source_classkey):
+    """Test compiled extractor returns empty string if no model instance"""
+    column: CSVColumn = CSVColumn(
+        column_header="A", source_classkey=source_classkey, source_attr="test_type"
+    )
+
+    assert compile_column_extractor(column)(None) == ""
+
+
+def test_compile_column_extractor_for_audit_class_key():
+    """Test display formatter is chosen for audit class keys"""
+    column: CSVColumn = CSVColumn(
+        column_header="Website compliance",
+        source_classkey=INITIAL_WCAG_AUDIT,
+        source_attr="compliance_state",
+    )
+    wcag_audit: WcagAudit = WcagAudit(
+        compliance_state=WcagAudit.WebsiteCompliance.UNKNOWN
+    )
+
+    assert compile_column_extractor(column)(wcag_audit) == format_model_field(
+        source_instance=wcag_audit, column=column
+    )
+
+
+@pytest.mark.parametrize(
+    "source_classkey, source_attr, expected_formatter_name",
+    [
+        (SimplifiedCase, "enforcement_body", "enforcement_body"),
+        ("Unknown class key", "test_type", "model_field"),
+        (SimplifiedCase, "test_type", "display"),
+        (INITIAL_WCAG_AUDIT, "compliance_state", "display"),
+        (SimplifiedCase, "report_sent_date", "value"),
+    ],
+)
+def test_get_column_formatter_name(
+    source_classkey, source_attr, expected_formatter_name
+):
+    """Test formatter is chosen from the column's source class and attribute"""
+    column: CSVColumn = CSVColumn(
+        column_header="A", source_classkey=source_classkey, source_attr=source_attr
+    )
+
+    assert get_column_formatter_name(column) == expected_formatter_name
+
+
+def test_get_column_extractors_compiles_once():
+    """Test column definitions are compiled once"""
+    column_definitions: list[CSVColumn] = [
+        CSVColumn(
+            column_header="A", source_classkey=SimplifiedCase, source_attr="test_type"
+        )
+    ]
+
+    assert get_column_extractors(column_definitions) is get_column_extractors(
+        column_definitions
+    )
+
+
+def test_build_csv_row():
+    """Test row is built from source instances of each column"""
+    simplified_case: SimplifiedCase = SimplifiedCase(
+        organisation_name="Org", test_type="simplified"
+    )
+    column_definitions: list[CSVColumn] = [
+        CSVColumn(
+            column_header="A", source_classkey=SimplifiedCase, source_attr="test_type"
+        ),
+        CSVColumn(
+            column_header="B",
+            source_classkey=SimplifiedCase,
+            source_attr="organisation_name",
+        ),
+        CSVColumn(
+            column_header="C",
+            source_classkey=INITIAL_WCAG_AUDIT,
+            source_attr="compliance_state",
+        ),
+    ]
+
+    assert build_csv_row(
+        source_instances={SimplifiedCase: simplified_case},
+        column_definitions=column_definitions,
+    ) == ["Simplified", "Org", ""]
+    assert [column.formatted_data for column in column_definitions] == ["", "", ""]
@@ -26,6 +26,7 @@ from ...simplified.models import Contact, SimplifiedCase
 from ..mark_deleted_util import get_id_from_button_name, mark_object_as_deleted
 from ..models import ChangeToPlatform, EventHistory, Platform
 from ..utils import (
+    KeysetPage,
     SessionExpiry,
     add_12_weeks_to_date,
     amp_format_date,
@@ -34,14 +35,18 @@ from ..utils import (
     amp_format_datetime_short_month,
     amp_format_time,
     build_filters,
+    build_keyset_filter,
     calculate_percentage,
     check_dict_for_truthy_values,
     checks_if_2fa_is_enabled,
     convert_date_to_datetime,
+    decode_keyset_cursor,
     diff_model_fields,
+    encode_keyset_cursor,
     extract_domain_from_url,
     format_outstanding_issues,
     format_statement_check_overview,
+    get_approximate_count,
     get_days_ago_timestamp,
     get_detailed_mobile_email_template_context,
     get_dict_without_page_items,
@@ -50,6 +55,7 @@ from ..utils import (
     get_recent_changes_to_platform,
     get_url_parameters_for_pagination,
     list_to_dictionary_of_lists,
+    paginate_queryset_by_keyset,
     record_common_model_create_event,
     record_common_model_update_event,
     replace_search_key_with_case_search,
@@ -544,10 +550,11 @@ def test_format_statement_check_overview(
         ([("page", "1")], {}),
         ([("a", "b")], {"a": "b"}),
         ([("page", "1"), ("a", "b")], {"a": "b"}),
+        ([("after", "abc"), ("before", "def"), ("a", "b")], {"a": "b"}),
     ],
 )
 def test_get_dict_without_page_items(items, expected_result):
-    """Test tuples beginning with 'page' are removed"""
+    """Test tuples beginning with pagination parameters are removed"""
     assert get_dict_without_page_items(items) == expected_result
 
 
@@ -558,6 +565,7 @@ def test_get_dict_without_page_items(items, expected_result):
         ("?a=b", "a=b"),
         ("?page=1&a=b", "a=b"),
         ("?page=2&statement_check_search=website", "statement_check_search=website"),
+        ("?after=abc&a=b", "a=b"),
     ],
 )
 def test_get_url_parameters_for_pagination(get_parameters, expected_result, rf):
@@ -566,6 +574,140 @@ def test_get_url_parameters_for_pagination(get_parameters, expected_result, rf):
     assert get_url_parameters_for_pagination(request=request) == expected_result
 
 
+def test_keyset_cursor_round_trip():
+    """Test keyset cursor encodes and decodes sort values"""
+    cursor: str = encode_keyset_cursor(["Org name", 1, 42])
+
+    assert decode_keyset_cursor(cursor, number_of_values=3) == ["Org name", 1, 42]
+
+
+@pytest.mark.parametrize(
+    "cursor, number_of_values",
+    [
+        ("not-base64!", 1),
+        (encode_keyset_cursor([1, 2]), 1),
+        ("e30=", 1),
+    ],
+)
+def test_decode_keyset_cursor_invalid(cursor, number_of_values):
+    """Test invalid keyset cursors decode to None"""
+    assert decode_keyset_cursor(cursor, number_of_values=number_of_values) is None
+
+
+def test_build_keyset_filter():
+    """Test keyset filter compares each sort column in turn"""
+    keyset_filter = build_keyset_filter(
+        ordering=[("name", False), ("id", True)], values=["b", 5]
+    )
+
+    assert str(keyset_filter) == (
+        "(OR: ('name__gt', 'b'), (AND: ('id__lt', 5), ('name', 'b')))"
+    )
+
+
+def test_build_keyset_filter_reverse():
+    """Test reversed keyset filter matches preceding rows"""
+    keyset_filter = build_keyset_filter(
+        ordering=[("name", False), ("id", True)], values=["b", 5], reverse=True
+    )
+
+    assert str(keyset_filter) == (
+        "(OR: ('name__lt', 'b'), (AND: ('id__gt', 5), ('name', 'b')))"
+    )
+
+
+@pytest.mark.django_db
+def test_paginate_queryset_by_keyset():
+    """Test paging forwards and backwards through a queryset by keyset"""
+    for name in ["c", "a", "b", "a", "c"]:
+        User.objects.create(username=f"{name}{User.objects.count()}", first_name=name)
+    queryset: QuerySet[User] = User.objects.order_by("first_name", "id")
+    expected_ids: list[int] = list(queryset.values_list("id", flat=True))
+
+    first_page: KeysetPage = paginate_queryset_by_keyset(queryset, page_size=2)
+
+    assert [user.id for user in first_page.object_list] == expected_ids[:2]
+    assert first_page.has_next is True
+    assert first_page.has_previous is False
+
+    second_page: KeysetPage = paginate_queryset_by_keyset(
+        queryset, page_size=2, after=first_page.next_cursor
+    )
+
+    assert [user.id for user in second_page.object_list] == expected_ids[2:4]
+    assert second_page.has_next is True
+    assert second_page.has_previous is True
+
+    last_page: KeysetPage = paginate_queryset_by_keyset(
+        queryset, page_size=2, after=second_page.next_cursor
+    )
+
+    assert [user.id for user in last_page.object_list] == expected_ids[4:]
+    assert last_page.has_next is False
+
+    previous_page: KeysetPage = paginate_queryset_by_keyset(
+        queryset, page_size=2, before=last_page.previous_cursor
+    )
+
+    assert [user.id for user in previous_page.object_list] == expected_ids[2:4]
+    assert previous_page.has_previous is True
+    assert previous_page.has_next is True
+
+
+@pytest.mark.django_db
+def test_paginate_queryset_by_keyset_invalid_cursor():
+    """Test invalid cursor returns first page"""
+    User.objects.create(username="a")
+    queryset: QuerySet[User] = User.objects.order_by("id")
+
+    keyset_page: KeysetPage = paginate_queryset_by_keyset(
+        queryset, page_size=2, after="invalid"
+    )
+
+    assert len(keyset_page.object_list) == 1
+
+
+def test_paginate_queryset_by_keyset_requires_id_ordering():
+    """Test keyset pagination rejects orderings which are not unique"""
+    with pytest.raises(ValueError):
+        paginate_queryset_by_keyset(User.objects.order_by("first_name"), page_size=2)
+
+
+@pytest.mark.django_db
+def test_get_approximate_count():
+    """Test exact count is returned by databases without planner estimates"""
+    User.objects.create(username="a")
+
+    assert get_approximate_count(User.objects.all()) == (1, False)
+    assert get_approximate_count(User.objects.none()) == (0, False)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "plan_rows, threshold, expected_result",
+    [
+        (50000, 10000, (50000, True)),
+        (10, 10000, (1, False)),
+    ],
+)
+def test_get_approximate_count_postgresql(plan_rows, threshold, expected_result):
+    """Test planner estimate is used on PostgreSQL for large result sets"""
+    User.objects.create(username="a")
+    queryset: QuerySet[User] = User.objects.all()
+
+    with patch("accessibility_monitoring_platform.apps.common.utils.connections") as (
+        mock_connections
+    ):
+        mock_connection = mock_connections.__getitem__.return_value
+        mock_connection.vendor = "postgresql"
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = [[{"Plan": {"Plan Rows": plan_rows}}]]
+
+        assert get_approximate_count(queryset, threshold=threshold) == (expected_result)
+
+    assert mock_cursor.execute.call_args.args[0].startswith("EXPLAIN (FORMAT JSON) ")
+
+
 def test_get_days_ago_timestamp():
     """Test timestamp for a number of days ago is calculated"""
     with patch("accessibility_monitoring_platform.apps.common.utils.date") as mock_date:
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db.models.query import QuerySet
 from django.http import HttpResponse
 from django.urls import reverse
@@ -212,6 +213,64 @@ def test_bulk_url_search_works(admin_client):
     )
 
 
+def test_bulk_url_search_ignores_blank_lines(admin_client):
+    """Test blank lines entered are not searched for"""
+    SimplifiedCase.objects.create(home_page_url=f"https://{FOUND_DOMAIN}.com")
+
+    response: HttpResponse = admin_client.post(
+        reverse("common:bulk-url-search"),
+        {"urls": f"https://{NOT_FOUND_DOMAIN}.com\n\n  \n", "submit": "Search"},
+    )
+
+    assert response.status_code == 200
+    assert [result["url"] for result in response.context["bulk_search_results"]] == [
+        f"https://{NOT_FOUND_DOMAIN}.com"
+    ]
+
+
+def test_bulk_url_search_file_upload_downloads_csv(admin_client):
+    """Test uploading a file of URLs downloads the results as CSV"""
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(
+        home_page_url=f"https://{FOUND_DOMAIN}.com"
+    )
+
+    response: HttpResponse = admin_client.post(
+        reverse("common:bulk-url-search"),
+        {
+            "urls": "",
+            "urls_file": SimpleUploadedFile(
+                "urls.csv",
+                f"https://{NOT_FOUND_DOMAIN}.com,x\nhttps://{FOUND_DOMAIN}.com\n".encode(),
+            ),
+            "submit": "Search",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/csv"
+    assert (
+        response["Content-Disposition"]
+        == "attachment; filename=bulk_url_search_results.csv"
+    )
+    assert b"".join(response.streaming_content).decode().splitlines() == [
+        "URL,Search term,Found,Number of cases,Case identifiers,Statuses,Auditors",
+        f"https://{NOT_FOUND_DOMAIN}.com,{NOT_FOUND_DOMAIN},No,0,,,",
+        f"https://{FOUND_DOMAIN}.com,{FOUND_DOMAIN},Yes,1,"
+        f"{simplified_case.case_identifier},Unassigned case,",
+    ]
+
+
+def test_bulk_url_search_download_button(admin_client):
+    """Test URLs entered can be downloaded as CSV"""
+    response: HttpResponse = admin_client.post(
+        reverse("common:bulk-url-search"),
+        {"urls": f"https://{FOUND_DOMAIN}.com", "download": "Download results as CSV"},
+    )
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/csv"
+
+
 @pytest.mark.parametrize(
     "subject,message",
     [
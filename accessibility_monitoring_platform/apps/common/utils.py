@@ -1,10 +1,13 @@
 """Common utility functions"""
 
+import base64
+import binascii
 import copy
 import json
 import re
 import urllib
 from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from datetime import timezone as datetime_timezone
 from typing import Any, Match
@@ -13,8 +16,9 @@ from zoneinfo import ZoneInfo
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from django.db import models
-from django.db.models import QuerySet
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models
+from django.db.models import Q, QuerySet
 from django.http import HttpRequest
 from django.http.request import QueryDict
 from django.utils import timezone
@@ -25,6 +29,10 @@ from .models import ChangeToPlatform, EventHistory, Platform
 SESSION_EXPIRY_WARNING_WINDOW: timedelta = timedelta(hours=12)
 ONE_WEEK_IN_DAYS: int = 7
 TWELVE_WEEKS_IN_DAYS: int = 12 * ONE_WEEK_IN_DAYS
+KEYSET_AFTER_PARAM: str = "after"
+KEYSET_BEFORE_PARAM: str = "before"
+PAGINATION_PARAMS: tuple[str, ...] = ("page", KEYSET_AFTER_PARAM, KEYSET_BEFORE_PARAM)
+APPROXIMATE_COUNT_THRESHOLD: int = 10000
 
 
 class SessionExpiry:
@@ -272,15 +280,159 @@ def format_statement_check_overview(
 
 
 def get_dict_without_page_items(items: Iterable[tuple[str, str]]) -> dict[str, str]:
-    """Remove tuples beginning with 'page' from iterable"""
-    return {key: value for (key, value) in items if key != "page"}
+    """Remove tuples beginning with a pagination parameter from iterable"""
+    return {key: value for (key, value) in items if key not in PAGINATION_PARAMS}
 
 
 def get_url_parameters_for_pagination(request: HttpRequest):
-    """Get URL parameters from GET removing existing 'page' parameter"""
+    """Get URL parameters from GET removing existing pagination parameters"""
     return urllib.parse.urlencode(get_dict_without_page_items(request.GET.items()))
 
 
+@dataclass
+class KeysetPage:
+    """A page of results fetched by keyset (cursor) pagination"""
+
+    object_list: list[Any] = field(default_factory=list)
+    has_next: bool = False
+    has_previous: bool = False
+    next_cursor: str = ""
+    previous_cursor: str = ""
+
+
+def encode_keyset_cursor(values: list[Any]) -> str:
+    """Encode sort values of a row as an opaque URL-safe cursor"""
+    return base64.urlsafe_b64encode(
+        json.dumps(values, cls=DjangoJSONEncoder).encode("utf-8")
+    ).decode("ascii")
+
+
+def decode_keyset_cursor(cursor: str, number_of_values: int) -> list[Any] | None:
+    """Decode cursor into sort values, returning None if it is not valid"""
+    try:
+        values: Any = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+    if not isinstance(values, list) or len(values) != number_of_values:
+        return None
+    return values
+
+
+def get_keyset_ordering(queryset: QuerySet) -> list[tuple[str, bool]]:
+    """
+    Return ordering of queryset as (field name, descending) tuples.
+
+    The ordering must end with id so that every row has a unique position.
+    """
+    ordering: list[tuple[str, bool]] = []
+    for order_by in queryset.query.order_by:
+        if not isinstance(order_by, str):
+            raise ValueError("Keyset pagination requires field name ordering")
+        ordering.append((order_by.lstrip("-"), order_by.startswith("-")))
+    if not ordering or ordering[-1][0] not in ("id", "pk"):
+        raise ValueError("Keyset pagination requires ordering to end with id")
+    return ordering
+
+
+def build_keyset_filter(
+    ordering: list[tuple[str, bool]], values: list[Any], reverse: bool = False
+) -> Q:
+    """
+    Build filter matching rows positioned after (or, if reverse, before) the
+    row with the values passed in the order specified.
+    """
+    keyset_filter: Q = Q()
+    for position, (field_name, descending) in enumerate(ordering):
+        lookup: str = "lt" if descending != reverse else "gt"
+        row_filter: Q = Q(**{f"{field_name}__{lookup}": values[position]})
+        for previous_position, (previous_field_name, _) in enumerate(
+            ordering[:position]
+        ):
+            row_filter &= Q(**{previous_field_name: values[previous_position]})
+        keyset_filter |= row_filter
+    return keyset_filter
+
+
+def paginate_queryset_by_keyset(
+    queryset: QuerySet, page_size: int, after: str = "", before: str = ""
+) -> KeysetPage:
+    """
+    Return page of ordered queryset following the after cursor or preceding
+    the before cursor using keyset filtering rather than OFFSET so the cost
+    of fetching a page does not grow with its depth.
+    """
+    ordering: list[tuple[str, bool]] = get_keyset_ordering(queryset)
+    field_names: list[str] = [field_name for field_name, _ in ordering]
+    after_values: list[Any] | None = (
+        decode_keyset_cursor(after, len(ordering)) if after else None
+    )
+    before_values: list[Any] | None = (
+        decode_keyset_cursor(before, len(ordering)) if before and not after else None
+    )
+
+    if before_values is not None:
+        reversed_order_by: list[str] = [
+            field_name if descending else f"-{field_name}"
+            for field_name, descending in ordering
+        ]
+        rows: list[Any] = list(
+            queryset.filter(
+                build_keyset_filter(ordering, before_values, reverse=True)
+            ).order_by(*reversed_order_by)[: page_size + 1]
+        )
+        has_previous: bool = len(rows) > page_size
+        object_list: list[Any] = rows[:page_size][::-1]
+        has_next: bool = True
+    else:
+        if after_values is not None:
+            queryset = queryset.filter(build_keyset_filter(ordering, after_values))
+        rows: list[Any] = list(queryset[: page_size + 1])
+        has_next: bool = len(rows) > page_size
+        object_list: list[Any] = rows[:page_size]
+        has_previous: bool = after_values is not None
+
+    if not object_list:
+        return KeysetPage()
+
+    def row_cursor(row: Any) -> str:
+        return encode_keyset_cursor(
+            [getattr(row, field_name) for field_name in field_names]
+        )
+
+    return KeysetPage(
+        object_list=object_list,
+        has_next=has_next,
+        has_previous=has_previous,
+        next_cursor=row_cursor(object_list[-1]) if has_next else "",
+        previous_cursor=row_cursor(object_list[0]) if has_previous else "",
+    )
+
+
+def get_approximate_count(
+    queryset: QuerySet, threshold: int = APPROXIMATE_COUNT_THRESHOLD
+) -> tuple[int, bool]:
+    """
+    Return number of rows in queryset and whether that number is approximate.
+
+    On PostgreSQL the planner's row estimate is used when it exceeds the
+    threshold to avoid counting every row of a large result set.
+    """
+    if queryset.query.is_empty():
+        return 0, False
+    connection = connections[queryset.db]
+    if connection.vendor == "postgresql":
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan: Any = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate: int = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate > threshold:
+            return estimate, True
+    return queryset.count(), False
+
+
 def get_first_of_this_month_last_year() -> datetime:
     """Calculate and return the first of this month last year"""
     now: datetime = timezone.now()
@@ -9,13 +9,18 @@ from django.conf import settings
 from django.contrib import messages
 from django.core.mail import EmailMessage
 from django.db.models.query import QuerySet
-from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
 from django.urls import reverse_lazy
 from django.views.generic import TemplateView
 from django.views.generic.edit import FormView, UpdateView
 from django.views.generic.list import ListView
 
-from ..cases.models import BaseCase
+from ..cases.utils import bulk_url_search, bulk_url_search_csv_generator
 from ..common.forms import FrequentlyUsedLinksFilterForm
 from ..common.sitemap import PlatformPage, Sitemap
 from .forms import (
@@ -41,11 +46,9 @@ from .metrics import (
 from .models import ChangeToPlatform, FooterLink, FrequentlyUsedLink, Platform
 from .platform_template_view import PlatformTemplateView
 from .utils import (
-    extract_domain_from_url,
     get_platform_settings,
     record_common_model_create_event,
     record_common_model_update_event,
-    sanitise_domain,
 )
 
 logger = logging.getLogger(__name__)
@@ -364,35 +367,27 @@ class BulkURLSearchView(FormView):
 
     def post(
         self, request: HttpRequest, *args: tuple[str], **kwargs: dict[str, Any]
-    ) -> HttpResponseRedirect:
-        """Process contents of valid form"""
+    ) -> HttpResponse | StreamingHttpResponse:
+        """
+        Process contents of valid form. Results of searches for uploaded files
+        are downloaded as CSV.
+        """
         context: dict[str, Any] = self.get_context_data()
         form = context["form"]
         if form.is_valid():
-            urls: list[str] = form.cleaned_data["urls"].splitlines()
-            bulk_search_results: list[dict] = []
-            for url in urls:
-                domain: str = extract_domain_from_url(url)
-                sanitised_domain: str = sanitise_domain(domain)
-
-                if sanitised_domain:
-                    base_cases: QuerySet[BaseCase] = BaseCase.objects.filter(
-                        home_page_url__icontains=sanitised_domain
-                    )
-                    search_term: str = sanitised_domain
-                else:
-                    base_cases: QuerySet[BaseCase] = BaseCase.objects.filter(
-                        home_page_url__icontains=url
-                    )
-                    search_term: str = url
-
-                bulk_search_results.append(
-                    {
-                        "search_term": search_term,
-                        "found_flag": base_cases.count() > 0,
-                        "url": url,
-                    }
+            urls: list[str] = form.cleaned_data["urls"]
+            if form.cleaned_data["urls_file"] or "download" in request.POST:
+                response: StreamingHttpResponse = StreamingHttpResponse(
+                    bulk_url_search_csv_generator(
+                        urls=urls + form.cleaned_data["urls_file"]
+                    ),
+                    content_type="text/csv",
+                )
+                response["Content-Disposition"] = (
+                    "attachment; filename=bulk_url_search_results.csv"
                 )
+                return response
+            bulk_search_results: list[dict] = bulk_url_search(urls=urls)
             return self.render_to_response(
                 self.get_context_data(bulk_search_results=bulk_search_results)
             )
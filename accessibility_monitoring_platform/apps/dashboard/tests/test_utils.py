@@ -3,12 +3,19 @@
 from dataclasses import dataclass
 from datetime import date
 
+import pytest
 from django.contrib.auth.models import User
+from django.db.models import Q
 
+from ...cases.models import CASE_STATUSES, TestType
 from ...detailed.models import DetailedCase
+from ...mobile.models import MobileCase
 from ...simplified.models import SimplifiedCase
 from ..utils import (
+    STATUS_PARAMETRES,
+    count_cases_by_status,
     get_all_cases_in_qa,
+    get_dashboard_statuses,
     group_cases_by_status,
     group_detailed_or_mobile_cases_by_status,
     return_cases_requiring_user_review,
@@ -408,6 +415,64 @@ def test_group_detailed_cases_by_status():
     ]
 
 
+@pytest.mark.parametrize(
+    "test_type, expected_statuses",
+    [
+        (
+            TestType.SIMPLIFIED,
+            [status for _, status, _ in STATUS_PARAMETRES],
+        ),
+        (
+            TestType.DETAILED,
+            [
+                status.value
+                for status in CASE_STATUSES
+                if TestType.DETAILED in status.test_types
+            ],
+        ),
+        (
+            TestType.MOBILE,
+            [
+                status.value
+                for status in CASE_STATUSES
+                if TestType.MOBILE in status.test_types
+            ],
+        ),
+    ],
+)
+def test_get_dashboard_statuses(test_type, expected_statuses):
+    """Test statuses shown on dashboard for each type of case"""
+    assert get_dashboard_statuses(test_type=test_type) == expected_statuses
+
+
+@pytest.mark.django_db
+def test_count_cases_by_status(django_assert_num_queries):
+    """
+    Test cases matching filter are counted by status and cases in QA are
+    counted in one query
+    """
+    user: User = User.objects.create()
+    DetailedCase.objects.create(auditor=user)
+    DetailedCase.objects.create(auditor=user, status=DetailedCase.Status.BLOCKED)
+    DetailedCase.objects.create(auditor=user, status=DetailedCase.Status.READY_TO_QA)
+    DetailedCase.objects.create(status=DetailedCase.Status.READY_TO_QA)
+    MobileCase.objects.create(auditor=user, status=MobileCase.Status.READY_TO_QA)
+
+    with django_assert_num_queries(1):
+        status_counts, qa_count = count_cases_by_status(
+            cases=DetailedCase.objects.all(),
+            cases_filter=Q(auditor=user),
+            statuses=get_dashboard_statuses(test_type=TestType.DETAILED),
+        )
+
+    assert qa_count == 2
+    assert status_counts[DetailedCase.Status.UNASSIGNED] == 1
+    assert status_counts[DetailedCase.Status.BLOCKED] == 1
+    assert status_counts[DetailedCase.Status.READY_TO_QA] == 1
+    assert status_counts[DetailedCase.Status.IN_REPORT_CORES] == 0
+    assert sum(status_counts.values()) == 3
+
+
 def test_get_all_cases_in_qa():
     """Test cases in qa are sorted and returned"""
     assert get_all_cases_in_qa(all_cases=MOCK_CASES) == EXPECTED_MOCK_CASES_IN_QA  # type: ignore
@@ -6,7 +6,9 @@ from datetime import date, datetime, timedelta
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
 from django.http import HttpResponse
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from pytest_django.asserts import assertContains, assertNotContains
 
@@ -14,6 +16,7 @@ from ...audits.models import AuditOverview, StatementAudit, WcagAudit
 from ...audits.tests.create_test_data import create_case_and_compliance
 from ...common.models import Boolean, ChangeToPlatform
 from ...detailed.models import DetailedCase
+from ...mobile.models import MobileCase
 from ...notifications.models import Task
 from ...simplified.models import SimplifiedCase
 
@@ -472,3 +475,38 @@ def test_dashboard_shows_detailed_cases_in_qa(admin_client):
     assert response.status_code == 200
 
     assertContains(response, detailed_case.organisation_name)
+
+
+@pytest.mark.parametrize(
+    "case_model, type_param",
+    [(DetailedCase, "detailed"), (MobileCase, "mobile")],
+)
+def test_dashboard_only_fetches_cases_when_there_are_some_to_show(
+    case_model, type_param, admin_client
+):
+    """
+    Tests dashboard counts cases by status and in QA with one query and only
+    fetches cases when there are some to show
+    """
+    dashboard_url: str = f'{reverse("dashboard:home")}?type={type_param}'
+    case_table_sql: str = f'FROM "{case_model._meta.db_table}"'
+    count_sql: str = f'SELECT COUNT("{case_model._meta.db_table}"'
+
+    with CaptureQueriesContext(connection) as context:
+        response: HttpResponse = admin_client.get(dashboard_url)
+
+    assert response.status_code == 200
+    assertContains(response, "QA cases (0)")
+    assert len([query for query in context if case_table_sql in query["sql"]]) == 1
+
+    case_model.objects.create(
+        organisation_name="Organisation in QA", status=case_model.Status.READY_TO_QA
+    )
+
+    with CaptureQueriesContext(connection) as context:
+        response: HttpResponse = admin_client.get(f"{dashboard_url}&filter=qa-filter")
+
+    assert response.status_code == 200
+    assertContains(response, "QA Cases (1)")
+    assertContains(response, "Organisation in QA")
+    assert len([query for query in context if count_sql in query["sql"]]) == 1
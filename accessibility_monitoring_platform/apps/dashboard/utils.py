@@ -3,6 +3,7 @@ Utility functions used in dashboard
 """
 
 from django.contrib.auth.models import User
+from django.db.models import Count, Q
 from django.db.models.query import QuerySet
 
 from ..cases.models import CASE_STATUSES, TestType
@@ -89,6 +90,42 @@ STATUS_PARAMETRES: list[tuple[str, str, str]] = [  # final dict key, status, and
 ]
 
 
+QA_STATUSES: list[str] = [
+    SimplifiedCase.Status.QA_IN_PROGRESS,
+    SimplifiedCase.Status.READY_TO_QA,
+]
+
+
+def get_dashboard_statuses(test_type: TestType) -> list[str]:
+    """Return the statuses shown on the dashboard for a type of case"""
+    if test_type == TestType.SIMPLIFIED:
+        return [status for _, status, _ in STATUS_PARAMETRES]
+    return [status.value for status in CASE_STATUSES if test_type in status.test_types]
+
+
+def count_cases_by_status(
+    cases: QuerySet[SimplifiedCase | DetailedCase | MobileCase],
+    cases_filter: Q,
+    statuses: list[str],
+) -> tuple[dict[str, int], int]:
+    """
+    Count the cases matching the filter in each status and all the cases in QA
+    using a single conditional aggregate query
+    """
+    status_aggregates: dict[str, Count] = {
+        f"status_{index}": Count("id", filter=cases_filter & Q(status=status))
+        for index, status in enumerate(statuses)
+    }
+    counts: dict[str, int] = cases.aggregate(
+        qa_count=Count("id", filter=Q(status__in=QA_STATUSES)),
+        **status_aggregates,
+    )
+    status_counts: dict[str, int] = {
+        status: counts[f"status_{index}"] for index, status in enumerate(statuses)
+    }
+    return status_counts, counts["qa_count"]
+
+
 def group_cases_by_status(
     simplified_cases: list[SimplifiedCase],
 ) -> dict[str, list[SimplifiedCase]]:
@@ -17,9 +17,15 @@ from ..cases.models import TestType
 from ..common.utils import checks_if_2fa_is_enabled, get_recent_changes_to_platform
 from ..detailed.models import DetailedCase
 from ..mobile.models import MobileCase
-from ..notifications.utils import build_task_list, get_task_type_counts
+from ..notifications.utils import get_task_feed_type_counts
 from ..simplified.models import SimplifiedCase
-from .utils import group_cases_by_status, group_detailed_or_mobile_cases_by_status
+from .utils import (
+    QA_STATUSES,
+    count_cases_by_status,
+    get_dashboard_statuses,
+    group_cases_by_status,
+    group_detailed_or_mobile_cases_by_status,
+)
 
 
 class DashboardView(TemplateView):
@@ -57,64 +63,64 @@ class DashboardView(TemplateView):
                 "auditor", "reviewer"
             )
 
-        qa_cases: QuerySet[SimplifiedCase | DetailedCase | MobileCase] = cases.filter(
-            status__in=[
-                SimplifiedCase.Status.QA_IN_PROGRESS,
-                SimplifiedCase.Status.READY_TO_QA,
-            ]
-        )
-
         if not filter_param:  # Your cases
             if test_type == TestType.SIMPLIFIED:
-                cases: QuerySet[SimplifiedCase] = cases.filter(
-                    Q(auditor=user) | Q(status=SimplifiedCase.Status.UNASSIGNED)
+                cases_filter: Q = Q(auditor=user) | Q(
+                    status=SimplifiedCase.Status.UNASSIGNED
                 )
             elif test_type == TestType.DETAILED:
-                cases: QuerySet[DetailedCase] = cases.filter(
-                    Q(auditor=user)
-                    | Q(
-                        status__in=[
-                            SimplifiedCase.Status.UNASSIGNED,
-                            DetailedCase.Status.PSB_INFO_REQ,
-                            DetailedCase.Status.PSB_INFO_CHASING,
-                            DetailedCase.Status.PSB_INFO_REQ_ACK,
-                            DetailedCase.Status.PSB_INFO_RECEIVED,
-                        ]
-                    )
+                cases_filter: Q = Q(auditor=user) | Q(
+                    status__in=[
+                        SimplifiedCase.Status.UNASSIGNED,
+                        DetailedCase.Status.PSB_INFO_REQ,
+                        DetailedCase.Status.PSB_INFO_CHASING,
+                        DetailedCase.Status.PSB_INFO_REQ_ACK,
+                        DetailedCase.Status.PSB_INFO_RECEIVED,
+                    ]
                 )
             else:  # Mobile cases
-                cases: QuerySet[MobileCase] = cases.filter(
-                    Q(auditor=user)
-                    | Q(
-                        status__in=[
-                            SimplifiedCase.Status.UNASSIGNED,
-                            MobileCase.Status.PSB_INFO_REQ,
-                            MobileCase.Status.PSB_INFO_CHASING,
-                            MobileCase.Status.PSB_INFO_REQ_ACK,
-                            MobileCase.Status.PSB_INFO_RECEIVED,
-                        ]
-                    )
+                cases_filter: Q = Q(auditor=user) | Q(
+                    status__in=[
+                        SimplifiedCase.Status.UNASSIGNED,
+                        MobileCase.Status.PSB_INFO_REQ,
+                        MobileCase.Status.PSB_INFO_CHASING,
+                        MobileCase.Status.PSB_INFO_REQ_ACK,
+                        MobileCase.Status.PSB_INFO_RECEIVED,
+                    ]
                 )
         elif filter_param == "qa-filter":
-            cases: QuerySet[SimplifiedCase | DetailedCase | MobileCase] = qa_cases
+            cases_filter: Q = Q(status__in=QA_STATUSES)
+        else:
+            cases_filter: Q = Q()
+
+        status_counts, qa_count = count_cases_by_status(
+            cases=cases,
+            cases_filter=cases_filter,
+            statuses=get_dashboard_statuses(test_type=test_type),
+        )
+        statuses_with_cases: list[str] = [
+            status for status, count in status_counts.items() if count > 0
+        ]
 
         cases_by_status: dict[
             str, list[SimplifiedCase] | dict[str, list[DetailedCase] | str]
         ] = {}
-        if cases and test_type == TestType.SIMPLIFIED:
-            cases_by_status: dict[str, list[SimplifiedCase]] = group_cases_by_status(
-                simplified_cases=cases
-            )
-        elif cases and test_type == TestType.DETAILED:
-            cases_by_status: dict[
-                str, dict[str, list[DetailedCase | MobileCase] | str]
-            ] = group_detailed_or_mobile_cases_by_status(cases=cases)
-        elif cases and test_type == TestType.MOBILE:
-            cases_by_status: dict[
-                str, dict[str, list[DetailedCase | MobileCase] | str]
-            ] = group_detailed_or_mobile_cases_by_status(
-                cases=cases, test_type=TestType.MOBILE
+        if statuses_with_cases:
+            cases: QuerySet[SimplifiedCase | DetailedCase | MobileCase] = (
+                cases.filter(cases_filter)
+                .filter(status__in=statuses_with_cases)
+                .order_by("id")
             )
+            if test_type == TestType.SIMPLIFIED:
+                cases_by_status: dict[str, list[SimplifiedCase]] = (
+                    group_cases_by_status(simplified_cases=cases)
+                )
+            else:
+                cases_by_status: dict[
+                    str, dict[str, list[DetailedCase | MobileCase] | str]
+                ] = group_detailed_or_mobile_cases_by_status(
+                    cases=cases, test_type=test_type
+                )
 
         context.update(
             {
@@ -124,10 +130,8 @@ class DashboardView(TemplateView):
                 "today": date.today(),
                 "mfa_disabled": not checks_if_2fa_is_enabled(user=user),
                 "recent_changes_to_platform": get_recent_changes_to_platform(),
-                "task_type_counts": get_task_type_counts(
-                    tasks=build_task_list(user=self.request.user)
-                ),
-                "qa_count": qa_cases.count(),
+                "task_type_counts": get_task_feed_type_counts(user=self.request.user),
+                "qa_count": qa_count,
             }
         )
         return context
@@ -13,7 +13,7 @@ from django.db import models
 from django.db.models import QuerySet
 from django.http import StreamingHttpResponse
 
-from ..cases.csv_export import csv_output_generator
+from ..cases.csv_export import csv_output_generator, csv_streaming_response
 from ..cases.models import BaseCase
 from ..cases.utils import CaseDetailPage, CaseDetailSection
 from ..common.form_extract_utils import (
@@ -85,36 +85,38 @@ def add_to_detailed_case_history(
 
 
 def download_detailed_cases(
-    detailed_cases: QuerySet[BaseCase], filename: str = "detailed_cases.csv"
+    detailed_cases: QuerySet[BaseCase],
+    filename: str = "detailed_cases.csv",
+    compress: bool = False,
 ) -> StreamingHttpResponse:
     """Given a DetailedCase queryset, download the data in csv format"""
 
-    response = StreamingHttpResponse(
-        csv_output_generator(
+    return csv_streaming_response(
+        output_generator=csv_output_generator(
             cases=detailed_cases,
             columns_for_export=DETAILED_CASE_COLUMNS_FOR_EXPORT,
         ),
-        content_type="text/csv",
+        filename=filename,
+        compress=compress,
     )
-    response["Content-Disposition"] = f"attachment; filename={filename}"
-    return response
 
 
 def download_detailed_feedback_survey_cases(
-    cases: QuerySet[BaseCase], filename: str = "detailed_feedback_survey_cases.csv"
+    cases: QuerySet[BaseCase],
+    filename: str = "detailed_feedback_survey_cases.csv",
+    compress: bool = False,
 ) -> StreamingHttpResponse:
     """
     Given a DetailedCase queryset, download the feedback survey data in csv format
     """
-    response = StreamingHttpResponse(
-        csv_output_generator(
+    return csv_streaming_response(
+        output_generator=csv_output_generator(
             cases=cases,
             columns_for_export=DETAILED_FEEDBACK_SURVEY_COLUMNS_FOR_EXPORT,
         ),
-        content_type="text/csv",
+        filename=filename,
+        compress=compress,
     )
-    response["Content-Disposition"] = f"attachment; filename={filename}"
-    return response
 
 
 def get_detailed_case_detail_sections(
@@ -169,16 +171,16 @@ def get_detailed_case_detail_sections(
 def download_detailed_equality_body_cases(
     cases: QuerySet[DetailedCase],
     filename: str = "detailed_equality_body_cases.csv",
+    compress: bool = False,
 ) -> StreamingHttpResponse:
     """
     Given a DetailedCase queryset, download the feedback survey data in csv format
     """
-    response = StreamingHttpResponse(
-        csv_output_generator(
+    return csv_streaming_response(
+        output_generator=csv_output_generator(
             cases=cases,
             columns_for_export=DETAILED_EQUALITY_BODY_COLUMNS_FOR_EXPORT,
         ),
-        content_type="text/csv",
+        filename=filename,
+        compress=compress,
     )
-    response["Content-Disposition"] = f"attachment; filename={filename}"
-    return response
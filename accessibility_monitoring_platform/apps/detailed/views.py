@@ -15,7 +15,10 @@ from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView, UpdateView
 from django.views.generic.list import ListView
 
-from ..cases.csv_export import populate_equality_body_columns
+from ..cases.csv_export import (
+    is_compressed_export_requested,
+    populate_equality_body_columns,
+)
 from ..cases.forms import CaseSearchForm
 from ..cases.models import BaseCase, TestType
 from ..cases.utils import filter_cases, find_duplicate_cases
@@ -36,7 +39,7 @@ from ..common.views import (
     ShowGoBackJSWidgetMixin,
 )
 from ..notifications.models import Task
-from ..notifications.utils import mark_tasks_as_read
+from ..notifications.utils import mark_case_tasks_as_read
 from .csv_export import (
     DETAILED_EQUALITY_BODY_CORRESPONDENCE_COLUMNS_FOR_EXPORT,
     DETAILED_EQUALITY_BODY_METADATA_COLUMNS_FOR_EXPORT,
@@ -767,11 +770,10 @@ class DetailedCaseHistoryDetailView(DetailView):
 def mark_qa_comments_as_read(request: HttpRequest, pk: int) -> HttpResponseRedirect:
     """Mark QA comment reminders as read for the current user"""
     detailed_case: DetailedCase = DetailedCase.objects.get(id=pk)
-    mark_tasks_as_read(
-        user=request.user, base_case=detailed_case, type=Task.Type.QA_COMMENT
-    )
-    mark_tasks_as_read(
-        user=request.user, base_case=detailed_case, type=Task.Type.REPORT_APPROVED
+    mark_case_tasks_as_read(
+        user=request.user,
+        base_case=detailed_case,
+        types=[Task.Type.QA_COMMENT, Task.Type.REPORT_APPROVED],
     )
     messages.success(request, f"{detailed_case} comments marked as read")
     return redirect(
@@ -788,7 +790,10 @@ def export_detailed_cases(request: HttpRequest) -> StreamingHttpResponse:
         replace_search_key_with_case_search(request.GET)
     )
     case_search_form.is_valid()
-    return download_detailed_cases(detailed_cases=filter_cases(form=case_search_form))
+    return download_detailed_cases(
+        detailed_cases=filter_cases(form=case_search_form),
+        compress=is_compressed_export_requested(request),
+    )
 
 
 def export_feedback_survey_cases(request: HttpRequest) -> StreamingHttpResponse:
@@ -798,7 +803,8 @@ def export_feedback_survey_cases(request: HttpRequest) -> StreamingHttpResponse:
     case_search_form: CaseSearchForm = CaseSearchForm(search_parameters)
     case_search_form.is_valid()
     return download_detailed_feedback_survey_cases(
-        cases=filter_cases(form=case_search_form)
+        cases=filter_cases(form=case_search_form),
+        compress=is_compressed_export_requested(request),
     )
 
 
@@ -809,7 +815,8 @@ def export_equality_body_cases(request: HttpRequest) -> StreamingHttpResponse:
     case_search_form: CaseSearchForm = CaseSearchForm(search_parameters)
     case_search_form.is_valid()
     return download_detailed_equality_body_cases(
-        cases=filter_cases(form=case_search_form)
+        cases=filter_cases(form=case_search_form),
+        compress=is_compressed_export_requested(request),
     )
 
 
@@ -2,7 +2,7 @@
 
 from django.contrib import admin
 
-from .models import Export, ExportCase
+from .models import Export, ExportCase, ExportCaseSnapshot
 
 
 class ExportAdmin(admin.ModelAdmin):
@@ -40,5 +40,23 @@ class ExportCaseAdmin(admin.ModelAdmin):
     show_facets = admin.ShowFacets.ALWAYS
 
 
+class ExportCaseSnapshotAdmin(admin.ModelAdmin):
+    """Django admin configuration for ExportCaseSnapshot model"""
+
+    readonly_fields = ["updated"]
+    search_fields = [
+        "simplified_case__organisation_name",
+        "simplified_case__case_number",
+    ]
+    list_display = [
+        "simplified_case",
+        "column_group",
+        "export",
+        "updated",
+    ]
+    list_filter = ["column_group"]
+
+
 admin.site.register(Export, ExportAdmin)
 admin.site.register(ExportCase, ExportCaseAdmin)
+admin.site.register(ExportCaseSnapshot, ExportCaseSnapshotAdmin)
@@ -0,0 +1,205 @@
+"""
+Track the equality body columns of exported cases so that exports contain
+only the cases which have changed since they were last exported
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import batched
+from typing import Any, Generator, Iterable
+
+from django.core.cache import cache
+from django.db.models import Max
+
+from ..cases.csv_export import (
+    DOWNLOAD_CASES_CHUNK_SIZE,
+    get_equality_body_row,
+    load_export_cases,
+)
+from ..common.csv_export import EqualityBodyCSVColumn
+from ..simplified.csv_export import (
+    SIMPLIFIED_EQUALITY_BODY_CORRESPONDENCE_COLUMNS_FOR_EXPORT,
+    SIMPLIFIED_EQUALITY_BODY_METADATA_COLUMNS_FOR_EXPORT,
+    SIMPLIFIED_EQUALITY_BODY_REPORT_COLUMNS_FOR_EXPORT,
+    SIMPLIFIED_EQUALITY_BODY_TEST_SUMMARY_COLUMNS_FOR_EXPORT,
+)
+from ..simplified.models import SimplifiedCase
+from .models import Export, ExportCaseSnapshot
+
+EQUALITY_BODY_COLUMN_GROUPS: dict[str, list[EqualityBodyCSVColumn]] = {
+    ExportCaseSnapshot.ColumnGroup.METADATA: SIMPLIFIED_EQUALITY_BODY_METADATA_COLUMNS_FOR_EXPORT,
+    ExportCaseSnapshot.ColumnGroup.REPORT: SIMPLIFIED_EQUALITY_BODY_REPORT_COLUMNS_FOR_EXPORT,
+    ExportCaseSnapshot.ColumnGroup.CORRESPONDENCE: SIMPLIFIED_EQUALITY_BODY_CORRESPONDENCE_COLUMNS_FOR_EXPORT,
+    ExportCaseSnapshot.ColumnGroup.TEST_SUMMARY: SIMPLIFIED_EQUALITY_BODY_TEST_SUMMARY_COLUMNS_FOR_EXPORT,
+}
+EXPORT_CHANGE_SUMMARY_CACHE_TIMEOUT: int = 5 * 60
+
+
+@dataclass
+class EqualityBodyCaseChange:
+    """Equality body row of a case and how it differs from when last exported"""
+
+    simplified_case: SimplifiedCase
+    row: list[Any]
+    snapshot_hashes: dict[str, str]
+    changed_column_groups: list[str]
+    is_new: bool
+
+    @property
+    def is_changed(self) -> bool:
+        return self.is_new or bool(self.changed_column_groups)
+
+
+@dataclass
+class EqualityBodyChangeSummary:
+    """Number of cases which are new, changed or unchanged since last exported"""
+
+    new_cases: int = 0
+    changed_cases: int = 0
+    unchanged_cases: int = 0
+    changed_column_groups: dict[str, int] = field(default_factory=dict)
+
+    def add(self, case_change: EqualityBodyCaseChange) -> None:
+        if case_change.is_new:
+            self.new_cases += 1
+        elif case_change.changed_column_groups:
+            self.changed_cases += 1
+            for column_group in case_change.changed_column_groups:
+                label: str = ExportCaseSnapshot.ColumnGroup(column_group).label
+                self.changed_column_groups[label] = (
+                    self.changed_column_groups.get(label, 0) + 1
+                )
+        else:
+            self.unchanged_cases += 1
+
+
+def hash_csv_values(values: list[Any]) -> str:
+    """Return hash of formatted CSV values"""
+    return hashlib.sha256(json.dumps(values, default=str).encode("utf-8")).hexdigest()
+
+
+def get_column_group_hashes(row: list[Any]) -> dict[str, str]:
+    """Split equality body row into its groups of columns and hash each one"""
+    snapshot_hashes: dict[str, str] = {}
+    start: int = 0
+    for column_group, column_definitions in EQUALITY_BODY_COLUMN_GROUPS.items():
+        end: int = start + len(column_definitions)
+        snapshot_hashes[column_group] = hash_csv_values(row[start:end])
+        start = end
+    return snapshot_hashes
+
+
+def get_equality_body_case_changes(
+    cases: Iterable[SimplifiedCase], chunk_size: int = DOWNLOAD_CASES_CHUNK_SIZE
+) -> Generator[EqualityBodyCaseChange, None, None]:
+    """
+    Build the equality body row of each case and compare the hash of each of
+    its groups of columns with the hash recorded when it was last exported,
+    fetching the recorded hashes once per chunk of cases
+    """
+    for chunk in batched(
+        load_export_cases(cases=cases, chunk_size=chunk_size), chunk_size
+    ):
+        simplified_cases: list[SimplifiedCase] = list(chunk)
+        previous_hashes: dict[int, dict[str, str]] = {}
+        for snapshot in ExportCaseSnapshot.objects.filter(
+            simplified_case__in=simplified_cases
+        ).only("simplified_case", "column_group", "snapshot_hash"):
+            previous_hashes.setdefault(snapshot.simplified_case_id, {})[
+                snapshot.column_group
+            ] = snapshot.snapshot_hash
+        for simplified_case in simplified_cases:
+            row: list[Any] = get_equality_body_row(case=simplified_case)
+            snapshot_hashes: dict[str, str] = get_column_group_hashes(row=row)
+            case_previous_hashes: dict[str, str] | None = previous_hashes.get(
+                simplified_case.id
+            )
+            yield EqualityBodyCaseChange(
+                simplified_case=simplified_case,
+                row=row,
+                snapshot_hashes=snapshot_hashes,
+                changed_column_groups=(
+                    []
+                    if case_previous_hashes is None
+                    else [
+                        column_group
+                        for column_group, snapshot_hash in snapshot_hashes.items()
+                        if case_previous_hashes.get(column_group) != snapshot_hash
+                    ]
+                ),
+                is_new=case_previous_hashes is None,
+            )
+
+
+def get_equality_body_change_summary(
+    cases: Iterable[SimplifiedCase],
+) -> EqualityBodyChangeSummary:
+    """Count cases which are new, changed or unchanged since last exported"""
+    change_summary: EqualityBodyChangeSummary = EqualityBodyChangeSummary()
+    for case_change in get_equality_body_case_changes(cases=cases):
+        change_summary.add(case_change=case_change)
+    return change_summary
+
+
+def get_export_change_summary(export: Export) -> EqualityBodyChangeSummary:
+    """
+    Return summary of changes to the ready cases of an export since they were
+    last exported, computing it again only when the ready cases or the
+    recorded snapshots change or the cached summary expires
+    """
+    ready_cases: list[SimplifiedCase] = export.ready_cases
+    latest_snapshot_update: datetime | None = ExportCaseSnapshot.objects.aggregate(
+        latest_update=Max("updated")
+    )["latest_update"]
+    cache_key_hash: str = hash_csv_values(
+        [
+            [simplified_case.id for simplified_case in ready_cases],
+            latest_snapshot_update,
+        ]
+    )
+    return cache.get_or_set(
+        f"export-change-summary:{export.id}:{cache_key_hash}",
+        lambda: get_equality_body_change_summary(cases=ready_cases),
+        timeout=EXPORT_CHANGE_SUMMARY_CACHE_TIMEOUT,
+    )
+
+
+def record_equality_body_snapshots(
+    export: Export, cases: Iterable[SimplifiedCase]
+) -> EqualityBodyChangeSummary:
+    """
+    Record hashes of the equality body columns of the cases which are new or
+    changed so that the next export of changes leaves them out, and mark them
+    as changed in this export
+    """
+    change_summary: EqualityBodyChangeSummary = EqualityBodyChangeSummary()
+    for chunk in batched(
+        get_equality_body_case_changes(cases=cases), DOWNLOAD_CASES_CHUNK_SIZE
+    ):
+        snapshots: list[ExportCaseSnapshot] = []
+        changed_case_ids: list[int] = []
+        for case_change in chunk:
+            change_summary.add(case_change=case_change)
+            if case_change.is_changed:
+                changed_case_ids.append(case_change.simplified_case.id)
+                snapshots += [
+                    ExportCaseSnapshot(
+                        simplified_case=case_change.simplified_case,
+                        column_group=column_group,
+                        snapshot_hash=snapshot_hash,
+                        export=export,
+                    )
+                    for column_group, snapshot_hash in case_change.snapshot_hashes.items()
+                ]
+        ExportCaseSnapshot.objects.bulk_create(
+            snapshots,
+            update_conflicts=True,
+            unique_fields=["simplified_case", "column_group"],
+            update_fields=["snapshot_hash", "export", "updated"],
+        )
+        export.exportcase_set.filter(simplified_case_id__in=changed_case_ids).update(
+            changed=True
+        )
+    return change_summary
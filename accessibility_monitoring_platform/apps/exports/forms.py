@@ -46,6 +46,14 @@ class ExportConfirmForm(forms.ModelForm):
     """
 
     cutoff_date = forms.DateField(widget=forms.HiddenInput())
+    changed_cases_only = forms.BooleanField(
+        required=False,
+        widget=AMPBooleanCheckboxWidget(
+            attrs={
+                "label": "Only download the ready cases which are new or have changed since last exported"
+            }
+        ),
+    )
 
     class Meta:
         model = Export
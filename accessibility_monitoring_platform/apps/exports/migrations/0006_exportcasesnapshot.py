@@ -0,0 +1,65 @@
+# Generated by Django 6.0.7 on 2026-10-19 05:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exports", "0005_alter_export_enforcement_body"),
+        ("simplified", "0013_search_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExportCaseSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "column_group",
+                    models.CharField(
+                        choices=[
+                            ("metadata", "Case metadata"),
+                            ("report", "Report"),
+                            ("correspondence", "Correspondence"),
+                            ("test-summary", "Test summary"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("snapshot_hash", models.CharField(max_length=64)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                (
+                    "export",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT, to="exports.export"
+                    ),
+                ),
+                (
+                    "simplified_case",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="simplified.simplifiedcase",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["id"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("simplified_case", "column_group"),
+                        name="unique_export_case_snapshot",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.7 on 2026-10-19 07:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exports", "0006_exportcasesnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exportcase",
+            name="changed",
+            field=models.BooleanField(default=False),
+        ),
+    ]
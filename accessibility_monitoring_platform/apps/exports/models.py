@@ -1,7 +1,10 @@
 """Models for comment and comment history"""
 
+from functools import cached_property
+
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models import QuerySet
 
 from ..common.utils import amp_format_date
 from ..simplified.models import SimplifiedCase
@@ -41,40 +44,67 @@ class Export(models.Model):
         new_export: bool = not self.id
         super().save(*args, **kwargs)
         if new_export:
-            for simplified_case in get_exportable_cases(
-                cutoff_date=self.cutoff_date, enforcement_body=self.enforcement_body
-            ):
-                ExportCase.objects.create(
-                    export=self,
-                    simplified_case=simplified_case,
-                )
+            ExportCase.objects.bulk_create(
+                [
+                    ExportCase(export=self, simplified_case_id=simplified_case_id)
+                    for simplified_case_id in get_exportable_cases(
+                        cutoff_date=self.cutoff_date,
+                        enforcement_body=self.enforcement_body,
+                    ).values_list("id", flat=True)
+                ]
+            )
+
+    @property
+    def export_cases(self) -> QuerySet["ExportCase"]:
+        return self.exportcase_set.select_related(
+            "simplified_case", "simplified_case__auditor"
+        )
 
     @property
     def all_cases(self) -> list[SimplifiedCase]:
-        return [
-            export_case.simplified_case for export_case in self.exportcase_set.all()
-        ]
+        return [export_case.simplified_case for export_case in self.export_cases]
 
     @property
     def ready_cases(self):
         return [
             export_case.simplified_case
-            for export_case in self.exportcase_set.filter(
-                status=ExportCase.Status.READY
-            )
+            for export_case in self.export_cases.filter(status=ExportCase.Status.READY)
         ]
 
+    @property
+    def changed_cases(self) -> QuerySet[SimplifiedCase]:
+        """Cases which were new or had changed when this export was confirmed"""
+        return SimplifiedCase.objects.filter(
+            exportcase__export=self, exportcase__changed=True
+        ).order_by("id")
+
+    @cached_property
+    def cases_count_by_status(self) -> dict[str, int]:
+        """
+        Return number of cases of each export status using one grouped query,
+        run once per export instance
+        """
+        cases_count_by_status: dict[str, int] = {
+            status: 0 for status in ExportCase.Status.values
+        }
+        cases_count_by_status.update(
+            self.exportcase_set.order_by()
+            .values_list("status")
+            .annotate(count=models.Count("id"))
+        )
+        return cases_count_by_status
+
     @property
     def ready_cases_count(self):
-        return self.exportcase_set.filter(status=ExportCase.Status.READY).count()
+        return self.cases_count_by_status[ExportCase.Status.READY]
 
     @property
     def excluded_cases_count(self):
-        return self.exportcase_set.filter(status=ExportCase.Status.EXCLUDED).count()
+        return self.cases_count_by_status[ExportCase.Status.EXCLUDED]
 
     @property
     def unready_cases_count(self):
-        return self.exportcase_set.filter(status=ExportCase.Status.UNREADY).count()
+        return self.cases_count_by_status[ExportCase.Status.UNREADY]
 
 
 class ExportCase(models.Model):
@@ -93,9 +123,43 @@ class ExportCase(models.Model):
         null=True,
     )
     status = models.CharField(max_length=20, choices=Status, default=Status.UNREADY)
+    changed = models.BooleanField(default=False)
 
     class Meta:
         ordering: list[str] = ["id"]
 
     def __str__(self) -> str:
         return f"{self.export}: {self.simplified_case}"
+
+
+class ExportCaseSnapshot(models.Model):
+    """
+    Model recording hash of the equality body columns of a case when they
+    were last exported, one per group of columns. Which cases each export
+    sent is recorded on ExportCase.changed, as these are replaced by later
+    exports.
+    """
+
+    class ColumnGroup(models.TextChoices):
+        METADATA = "metadata", "Case metadata"
+        REPORT = "report", "Report"
+        CORRESPONDENCE = "correspondence", "Correspondence"
+        TEST_SUMMARY = "test-summary", "Test summary"
+
+    simplified_case = models.ForeignKey(SimplifiedCase, on_delete=models.CASCADE)
+    column_group = models.CharField(max_length=20, choices=ColumnGroup)
+    snapshot_hash = models.CharField(max_length=64)
+    export = models.ForeignKey(Export, on_delete=models.PROTECT)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering: list[str] = ["id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["simplified_case", "column_group"],
+                name="unique_export_case_snapshot",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.simplified_case} {self.get_column_group_display()}: {self.snapshot_hash}"
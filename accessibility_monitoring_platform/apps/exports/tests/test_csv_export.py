@@ -0,0 +1,179 @@
+"""
+Test export of equality body cases changed since last exported
+"""
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+
+from ...simplified.csv_export import SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT
+from ...simplified.models import SimplifiedCase
+from ..csv_export import (
+    EQUALITY_BODY_COLUMN_GROUPS,
+    EqualityBodyCaseChange,
+    EqualityBodyChangeSummary,
+    get_column_group_hashes,
+    get_equality_body_case_changes,
+    get_equality_body_change_summary,
+    get_export_change_summary,
+    record_equality_body_snapshots,
+)
+from ..models import Export, ExportCase, ExportCaseSnapshot
+from .test_forms import CUTOFF_DATE
+
+
+def create_export() -> Export:
+    exporter, _ = User.objects.get_or_create(username="exporter")
+    return Export.objects.create(cutoff_date=CUTOFF_DATE, exporter=exporter)
+
+
+def create_simplified_cases() -> list[SimplifiedCase]:
+    return [
+        SimplifiedCase.objects.create(organisation_name=organisation_name)
+        for organisation_name in ["Org A", "Org B"]
+    ]
+
+
+def test_column_groups_make_up_equality_body_columns():
+    """Test equality body columns are the column groups in order"""
+    assert [
+        column
+        for column_definitions in EQUALITY_BODY_COLUMN_GROUPS.values()
+        for column in column_definitions
+    ] == SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT
+
+
+def test_get_column_group_hashes():
+    """Test a change to a value only changes the hash of its column group"""
+    row: list[str] = ["" for _ in SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT]
+    snapshot_hashes: dict[str, str] = get_column_group_hashes(row=row)
+
+    assert list(snapshot_hashes) == list(EQUALITY_BODY_COLUMN_GROUPS)
+
+    row[-1] = "Changed"
+    changed_snapshot_hashes: dict[str, str] = get_column_group_hashes(row=row)
+
+    assert [
+        column_group
+        for column_group in snapshot_hashes
+        if snapshot_hashes[column_group] != changed_snapshot_hashes[column_group]
+    ] == [ExportCaseSnapshot.ColumnGroup.TEST_SUMMARY]
+
+
+@pytest.mark.django_db
+def test_get_equality_body_case_changes():
+    """Test cases are new, changed or unchanged since last exported"""
+    simplified_case_a, simplified_case_b = create_simplified_cases()
+
+    case_changes: list[EqualityBodyCaseChange] = list(
+        get_equality_body_case_changes(cases=[simplified_case_a, simplified_case_b])
+    )
+
+    assert [case_change.is_new for case_change in case_changes] == [True, True]
+
+    record_equality_body_snapshots(
+        export=create_export(), cases=[simplified_case_a, simplified_case_b]
+    )
+    simplified_case_b.recommendation_notes = "Changed notes"
+    simplified_case_b.save()
+
+    case_change_a, case_change_b = get_equality_body_case_changes(
+        cases=[simplified_case_a, simplified_case_b]
+    )
+
+    assert case_change_a.is_new is False
+    assert case_change_a.is_changed is False
+    assert case_change_b.is_new is False
+    assert case_change_b.is_changed is True
+    assert case_change_b.changed_column_groups == [
+        ExportCaseSnapshot.ColumnGroup.REPORT
+    ]
+
+
+@pytest.mark.django_db
+def test_get_equality_body_change_summary():
+    """Test summary counts new, changed and unchanged cases"""
+    simplified_case_a, simplified_case_b = create_simplified_cases()
+    record_equality_body_snapshots(
+        export=create_export(), cases=[simplified_case_a, simplified_case_b]
+    )
+    simplified_case_b.recommendation_notes = "Changed notes"
+    simplified_case_b.save()
+    simplified_case_c: SimplifiedCase = SimplifiedCase.objects.create()
+
+    assert get_equality_body_change_summary(
+        cases=[simplified_case_a, simplified_case_b, simplified_case_c]
+    ) == EqualityBodyChangeSummary(
+        new_cases=1,
+        changed_cases=1,
+        unchanged_cases=1,
+        changed_column_groups={"Report": 1},
+    )
+
+
+@pytest.mark.django_db
+def test_get_export_change_summary_cached(django_assert_max_num_queries):
+    """
+    Test summary of changes to the ready cases of an export is cached until
+    snapshots are recorded
+    """
+    cache.clear()
+    export: Export = create_export()
+    for simplified_case in create_simplified_cases():
+        ExportCase.objects.create(
+            export=export,
+            simplified_case=simplified_case,
+            status=ExportCase.Status.READY,
+        )
+
+    assert get_export_change_summary(export=export) == EqualityBodyChangeSummary(
+        new_cases=2
+    )
+
+    with django_assert_max_num_queries(2):
+        assert get_export_change_summary(export=export) == EqualityBodyChangeSummary(
+            new_cases=2
+        )
+
+    record_equality_body_snapshots(export=export, cases=export.ready_cases)
+
+    assert get_export_change_summary(export=export) == EqualityBodyChangeSummary(
+        unchanged_cases=2
+    )
+
+
+@pytest.mark.django_db
+def test_record_equality_body_snapshots_updates_existing_snapshots():
+    """Test recording snapshots again replaces those of changed cases"""
+    simplified_case_a, simplified_case_b = create_simplified_cases()
+    first_export: Export = create_export()
+    record_equality_body_snapshots(
+        export=first_export, cases=[simplified_case_a, simplified_case_b]
+    )
+
+    assert ExportCaseSnapshot.objects.count() == 2 * len(EQUALITY_BODY_COLUMN_GROUPS)
+
+    simplified_case_b.recommendation_notes = "Changed notes"
+    simplified_case_b.save()
+    second_export: Export = create_export()
+
+    change_summary: EqualityBodyChangeSummary = record_equality_body_snapshots(
+        export=second_export, cases=[simplified_case_a, simplified_case_b]
+    )
+
+    assert change_summary.changed_cases == 1
+    assert change_summary.unchanged_cases == 1
+    assert ExportCaseSnapshot.objects.count() == 2 * len(EQUALITY_BODY_COLUMN_GROUPS)
+    assert set(
+        ExportCaseSnapshot.objects.filter(simplified_case=simplified_case_a)
+        .values_list("export", flat=True)
+        .distinct()
+    ) == {first_export.id}
+    assert set(
+        ExportCaseSnapshot.objects.filter(simplified_case=simplified_case_b)
+        .values_list("export", flat=True)
+        .distinct()
+    ) == {second_export.id}
+    assert get_equality_body_change_summary(
+        cases=[simplified_case_a, simplified_case_b]
+    ) == EqualityBodyChangeSummary(unchanged_cases=2)
@@ -110,6 +110,40 @@ def test_export_save_excludes_complete_no_send():
     assert ExportCase.objects.all().count() == 1  # No new ExportCase created
 
 
+def create_qualifying_case() -> SimplifiedCase:
+    """Create case to be included in export"""
+    return SimplifiedCase.objects.create(
+        compliance_email_sent_date=COMPLIANCE_EMAIL_SENT_DATE,
+        status=SimplifiedCase.Status.CASE_CLOSED_WAITING_TO_SEND,
+    )
+
+
+def count_export_create_queries(django_assert_max_num_queries, user: User) -> int:
+    """Create export and return the number of queries run"""
+    with django_assert_max_num_queries(10) as captured:
+        Export.objects.create(cutoff_date=CUTOFF_DATE, exporter=user)
+    return len(captured.captured_queries)
+
+
+@pytest.mark.django_db
+def test_export_save_queries_do_not_grow_with_cases(django_assert_max_num_queries):
+    """Tests Export.save() creates all ExportCases in a fixed number of queries"""
+    user: User = User.objects.create()
+    create_qualifying_case()
+    number_of_queries: int = count_export_create_queries(
+        django_assert_max_num_queries, user=user
+    )
+
+    for _ in range(5):
+        create_qualifying_case()
+
+    assert (
+        count_export_create_queries(django_assert_max_num_queries, user=user)
+        == number_of_queries
+    )
+    assert ExportCase.objects.count() == 7
+
+
 @pytest.mark.django_db
 def test_export_all_cases():
     """Tests Export.all_cases returns expected list of cases"""
@@ -132,6 +166,32 @@ def test_export_ready_cases():
     assert export.ready_cases == [simplified_case]
 
 
+@pytest.mark.django_db
+def test_export_cases_count_by_status(django_assert_num_queries):
+    """Tests Export.cases_count_by_status counts cases of each status"""
+    export, simplified_case = create_cases_and_export()
+    create_qualifying_case()
+    create_qualifying_case()
+    export: Export = Export.objects.create(
+        cutoff_date=CUTOFF_DATE, exporter=export.exporter
+    )
+    export.exportcase_set.filter(simplified_case=simplified_case).update(
+        status=ExportCase.Status.EXCLUDED
+    )
+
+    with django_assert_num_queries(1):
+        assert export.cases_count_by_status == {
+            ExportCase.Status.UNREADY: 2,
+            ExportCase.Status.READY: 0,
+            ExportCase.Status.EXCLUDED: 1,
+        }
+
+    with django_assert_num_queries(0):
+        assert export.ready_cases_count == 0
+        assert export.excluded_cases_count == 1
+        assert export.unready_cases_count == 2
+
+
 @pytest.mark.django_db
 def test_export_ready_cases_count():
     """Tests Export.ready_cases_count returns expected number"""
@@ -142,6 +202,7 @@ def test_export_ready_cases_count():
     export_case: ExportCase = export.exportcase_set.get(simplified_case=simplified_case)
     export_case.status = ExportCase.Status.READY
     export_case.save()
+    export = Export.objects.get(id=export.id)
 
     assert export.ready_cases_count == 1
 
@@ -156,6 +217,7 @@ def test_export_excluded_cases_count():
     export_case: ExportCase = export.exportcase_set.get(simplified_case=simplified_case)
     export_case.status = ExportCase.Status.EXCLUDED
     export_case.save()
+    export = Export.objects.get(id=export.id)
 
     assert export.excluded_cases_count == 1
 
@@ -170,6 +232,7 @@ def test_export_unready_cases_count():
     export_case: ExportCase = export.exportcase_set.get(simplified_case=simplified_case)
     export_case.status = ExportCase.Status.READY
     export_case.save()
+    export = Export.objects.get(id=export.id)
 
     assert export.unready_cases_count == 0
 
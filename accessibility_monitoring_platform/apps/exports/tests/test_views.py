@@ -6,8 +6,11 @@ from datetime import date
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
 from django.db.models.query import QuerySet
 from django.http import HttpResponse, StreamingHttpResponse
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from pytest_django.asserts import assertContains, assertNotContains
 
@@ -16,7 +19,8 @@ from ...audits.tests.create_test_data import (
 )
 from ...common.models import EventHistory
 from ...simplified.models import CaseStatus, SimplifiedCase, SimplifiedEventHistory
-from ..models import Export, ExportCase
+from ..csv_export import record_equality_body_snapshots
+from ..models import Export, ExportCase, ExportCaseSnapshot
 from .test_forms import CUTOFF_DATE, create_exportable_case
 
 ORGANISATION_NAME: str = "Org Name"
@@ -94,6 +98,33 @@ def test_non_specific_export_page_loads(path_name, expected_content, admin_clien
     assertContains(response, "ECNI")
 
 
+def count_export_detail_queries(admin_client, export: Export) -> int:
+    """Load export detail page and return the number of queries run"""
+    with CaptureQueriesContext(connection) as captured:
+        response: HttpResponse = admin_client.get(
+            reverse("exports:export-detail", kwargs={"pk": export.id})
+        )
+    assert response.status_code == 200
+    return len(captured.captured_queries)
+
+
+def test_export_detail_queries_do_not_grow_with_cases(admin_client):
+    """Test number of queries for export detail page does not depend on its cases"""
+    export: Export = create_cases_and_export()
+    count_export_detail_queries(admin_client, export=export)
+    number_of_queries: int = count_export_detail_queries(admin_client, export=export)
+
+    for _ in range(3):
+        ExportCase.objects.create(
+            export=export,
+            simplified_case=SimplifiedCase.objects.create(
+                auditor=User.objects.create(username=f"auditor{_}")
+            ),
+        )
+
+    assert count_export_detail_queries(admin_client, export=export) == number_of_queries
+
+
 @pytest.mark.parametrize(
     "path_name, expected_content",
     [
@@ -268,6 +299,84 @@ def test_ready_export_csv_returned(admin_client):
     assert ORGANISATION_NAME in csv_response
 
 
+def test_changed_ready_export_csv_returned(admin_client):
+    """
+    Test that changed ready cases csv contains only the ready cases which
+    were new or had changed when the export was confirmed, even after a later
+    export records them again
+    """
+    first_export: Export = create_cases_and_export()
+    first_export.exportcase_set.update(status=ExportCase.Status.READY)
+    record_equality_body_snapshots(export=first_export, cases=first_export.ready_cases)
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.get(
+        organisation_name=ORGANISATION_NAME
+    )
+    simplified_case.recommendation_notes = "Changed notes"
+    simplified_case.save()
+    second_export: Export = Export.objects.create(
+        cutoff_date=CUTOFF_DATE, exporter=first_export.exporter
+    )
+    record_equality_body_snapshots(
+        export=second_export,
+        cases=SimplifiedCase.objects.filter(
+            id__in=[case.id for case in first_export.ready_cases]
+        ),
+    )
+
+    response: StreamingHttpResponse = admin_client.get(
+        reverse("exports:export-changed-ready-cases", kwargs={"pk": first_export.id})
+    )
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "text/csv"
+    assert (
+        response.headers["Content-Disposition"]
+        == f"attachment; filename=EHRC_changed_cases_{CUTOFF_DATE}.csv"
+    )
+
+    csv_response: str = get_csv_streaming_content(response=response)
+
+    assert EXPORT_CSV_COLUMNS in csv_response
+    assert f",{ORGANISATION_NAME}," in csv_response
+    assert "Other Org Name" in csv_response
+
+    csv_response: str = get_csv_streaming_content(
+        response=admin_client.get(
+            reverse(
+                "exports:export-changed-ready-cases", kwargs={"pk": second_export.id}
+            )
+        )
+    )
+
+    assert f",{ORGANISATION_NAME}," in csv_response
+    assert "Changed notes" in csv_response
+    assert "Other Org Name" not in csv_response
+
+
+def test_confirm_export_shows_changes_since_last_export(admin_client):
+    """Test confirm export page summarises changes since last export"""
+    cache.clear()
+    export: Export = create_cases_and_export()
+    export.exportcase_set.update(status=ExportCase.Status.READY)
+    record_equality_body_snapshots(export=export, cases=export.ready_cases)
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.get(
+        organisation_name=ORGANISATION_NAME
+    )
+    simplified_case.recommendation_notes = "Changed notes"
+    simplified_case.save()
+
+    response: HttpResponse = admin_client.get(
+        reverse("exports:export-confirm-export", kwargs={"pk": export.id})
+    )
+
+    assert response.status_code == 200
+
+    assertContains(response, "0 ready cases have not been exported before")
+    assertContains(response, "1 ready case has changed since last exported")
+    assertContains(response, "Report changed in 1 case")
+    assertContains(response, "1 ready case is unchanged")
+
+
 def test_create_export(admin_client, admin_user):
     """Test that export can be created"""
     create_exportable_case()
@@ -344,6 +453,70 @@ def test_confirm_export(admin_client):
     assert len(simplified_event_history) == 1
     assert simplified_event_history[0].parent == simplified_case
     assert simplified_event_history[0].event_type == "model_update"
+    assert set(
+        ExportCaseSnapshot.objects.values_list("simplified_case", flat=True)
+    ) == {simplified_case.id}
+
+    csv_response: str = get_csv_streaming_content(
+        response=admin_client.get(response.url)
+    )
+
+    assert simplified_case.case_identifier in csv_response
+    assert len(csv_response.splitlines()) == 2
+
+
+def test_confirm_export_changed_cases_only(admin_client):
+    """
+    Test that confirming an export and choosing to download only the new and
+    changed cases redirects to the changed cases CSV
+    """
+    export: Export = create_cases_and_export()
+    export.exportcase_set.update(status=ExportCase.Status.READY)
+    record_equality_body_snapshots(export=export, cases=export.ready_cases)
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.get(
+        organisation_name=ORGANISATION_NAME
+    )
+    simplified_case.recommendation_notes = "Changed notes"
+    simplified_case.save()
+    second_export: Export = Export.objects.create(
+        cutoff_date=CUTOFF_DATE, exporter=export.exporter
+    )
+    second_export.exportcase_set.update(status=ExportCase.Status.READY)
+
+    response: HttpResponse = admin_client.post(
+        reverse("exports:export-confirm-export", kwargs={"pk": second_export.id}),
+        {
+            "cutoff_date": "2024-03-21",
+            "changed_cases_only": "on",
+            "submit": "Export and update all ready cases",
+        },
+    )
+
+    assert response.status_code == 302
+    assert response.url == reverse(
+        "exports:export-changed-ready-cases", kwargs={"pk": second_export.id}
+    )
+    assert list(
+        second_export.exportcase_set.filter(changed=True).values_list(
+            "simplified_case", flat=True
+        )
+    ) == [simplified_case.id]
+
+
+def test_exported_export_detail_shows_changed_cases_download(admin_client):
+    """Test detail of confirmed export links to new and changed ready cases CSV"""
+    export: Export = create_cases_and_export()
+    url: str = reverse("exports:export-detail", kwargs={"pk": export.id})
+    changed_cases_url: str = reverse(
+        "exports:export-changed-ready-cases", kwargs={"pk": export.id}
+    )
+
+    assertNotContains(admin_client.get(url), changed_cases_url)
+
+    export.status = Export.Status.EXPORTED
+    export.save()
+
+    assertContains(admin_client.get(url), changed_cases_url)
 
 
 def test_confirm_delete_export(admin_client):
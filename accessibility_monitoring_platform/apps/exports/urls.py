@@ -14,6 +14,7 @@ from .views import (
     ExportDetailView,
     ExportListView,
     export_all_cases,
+    export_changed_ready_cases,
     export_ready_cases,
     mark_all_export_cases_as_ready,
     mark_export_case_as_excluded,
@@ -78,6 +79,11 @@ urlpatterns: list[URLPattern] = [
         login_required(export_ready_cases),
         name="export-ready-cases",
     ),
+    path(
+        "<int:pk>/export-changed-ready-cases/",
+        login_required(export_changed_ready_cases),
+        name="export-changed-ready-cases",
+    ),
     path(
         "<int:export_id>/cases/<int:pk>/export-as-email/",
         login_required(ExportCaseAsEmailDetailView.as_view()),
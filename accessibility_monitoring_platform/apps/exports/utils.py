@@ -5,7 +5,7 @@ from datetime import date
 from django.db.models import QuerySet
 from django.http import StreamingHttpResponse
 
-from ..cases.csv_export import csv_output_generator
+from ..cases.csv_export import csv_output_generator, csv_streaming_response
 from ..simplified.csv_export import SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT
 from ..simplified.models import SimplifiedCase
 
@@ -28,15 +28,15 @@ def get_exportable_cases(
 def download_equality_body_simplified_cases(
     cases: QuerySet[SimplifiedCase],
     filename: str = "enforcement_body_cases.csv",
+    compress: bool = False,
 ) -> StreamingHttpResponse:
     """Given a Case queryset, download the data in csv format for equality body"""
-    response = StreamingHttpResponse(
-        csv_output_generator(
+    return csv_streaming_response(
+        output_generator=csv_output_generator(
             cases=cases,
             columns_for_export=SIMPLIFIED_EQUALITY_BODY_COLUMNS_FOR_EXPORT,
             equality_body_csv=True,
         ),
-        content_type="text/csv",
+        filename=filename,
+        compress=compress,
     )
-    response["Content-Disposition"] = f"attachment; filename={filename}"
-    return response
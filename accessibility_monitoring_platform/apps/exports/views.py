@@ -6,6 +6,7 @@ from datetime import date
 from typing import Any
 
 from django.contrib.auth.models import User
+from django.db.models import Count
 from django.db.models.query import QuerySet
 from django.forms.models import ModelForm
 from django.http import HttpRequest, HttpResponseRedirect, StreamingHttpResponse
@@ -15,7 +16,10 @@ from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView, UpdateView
 from django.views.generic.list import ListView
 
-from ..cases.csv_export import populate_equality_body_columns
+from ..cases.csv_export import (
+    is_compressed_export_requested,
+    populate_equality_body_columns,
+)
 from ..common.utils import (
     record_common_model_create_event,
     record_common_model_update_event,
@@ -23,6 +27,7 @@ from ..common.utils import (
 from ..common.views import HideCaseNavigationMixin
 from ..simplified.models import SimplifiedCase
 from ..simplified.utils import record_simplified_model_update_event
+from .csv_export import get_export_change_summary, record_equality_body_snapshots
 from .forms import ExportConfirmForm, ExportCreateForm, ExportDeleteForm
 from .models import Export, ExportCase
 from .utils import download_equality_body_simplified_cases
@@ -57,8 +62,12 @@ class ExportListView(EnforcementBodyMixin, ListView):
     template_name: str = "exports/export_list.html"
 
     def get_queryset(self) -> QuerySet[Export]:
-        return Export.objects.filter(
-            is_deleted=False, enforcement_body=self.enforcement_body
+        return (
+            Export.objects.filter(
+                is_deleted=False, enforcement_body=self.enforcement_body
+            )
+            .select_related("exporter")
+            .annotate(number_of_cases=Count("exportcase"))
         )
 
 
@@ -103,6 +112,12 @@ class ExportDetailView(DetailView):
     model: type[Export] = Export
     context_object_name: str = "export"
 
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        """Add export cases and their cases into context"""
+        context: dict[str, Any] = super().get_context_data(**kwargs)
+        context["export_cases"] = list(self.object.export_cases)
+        return context
+
 
 class ExportCaseAsEmailDetailView(HideCaseNavigationMixin, DetailView):
     """
@@ -124,7 +139,8 @@ class ExportCaseAsEmailDetailView(HideCaseNavigationMixin, DetailView):
 class ConfirmExportUpdateView(UpdateView):
     """
     View to update each case to say it was sent to equality body.
-    Redirect to export ready cases.
+    Redirect to export of the ready cases or, if requested, only those which
+    were new or changed.
     """
 
     model: type[Export] = Export
@@ -132,6 +148,12 @@ class ConfirmExportUpdateView(UpdateView):
     context_object_name: str = "export"
     template_name: str = "exports/export_confirm_export.html"
 
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        """Add summary of changes since ready cases were last exported"""
+        context: dict[str, Any] = super().get_context_data(**kwargs)
+        context["change_summary"] = get_export_change_summary(export=self.object)
+        return context
+
     def form_valid(self, form: ModelForm) -> HttpResponseRedirect:
         """Bulk update ready export cases; Redirect to export"""
         export: Export = self.object
@@ -144,10 +166,15 @@ class ConfirmExportUpdateView(UpdateView):
             )
             simplified_case.save()
             simplified_case.update_case_status()
+        record_equality_body_snapshots(export=export, cases=export.ready_cases)
         export.status = Export.Status.EXPORTED
         export.export_date = today
         record_common_model_update_event(user=user, model_object=export)
         export.save()
+        if form.cleaned_data.get("changed_cases_only"):
+            return HttpResponseRedirect(
+                reverse("exports:export-changed-ready-cases", kwargs={"pk": export.id})
+            )
         return HttpResponseRedirect(
             reverse("exports:export-ready-cases", kwargs={"pk": export.id})
         )
@@ -187,6 +214,7 @@ def export_all_cases(request: HttpRequest, pk: int) -> StreamingHttpResponse:
     return download_equality_body_simplified_cases(
         cases=export.all_cases,
         filename=f"DRAFT_{export.enforcement_body.upper()}_cases_{export.cutoff_date}.csv",
+        compress=is_compressed_export_requested(request),
     )
 
 
@@ -196,6 +224,20 @@ def export_ready_cases(request: HttpRequest, pk: int) -> StreamingHttpResponse:
     return download_equality_body_simplified_cases(
         cases=export.ready_cases,
         filename=f"{export.enforcement_body.upper()}_cases_{export.cutoff_date}.csv",
+        compress=is_compressed_export_requested(request),
+    )
+
+
+def export_changed_ready_cases(request: HttpRequest, pk: int) -> StreamingHttpResponse:
+    """
+    View to export the ready cases which were new or changed when the export
+    was confirmed
+    """
+    export: Export = get_object_or_404(Export, pk=pk)
+    return download_equality_body_simplified_cases(
+        cases=export.changed_cases,
+        filename=f"{export.enforcement_body.upper()}_changed_cases_{export.cutoff_date}.csv",
+        compress=is_compressed_export_requested(request),
     )
 
 
@@ -204,9 +246,7 @@ def mark_all_export_cases_as_ready(
 ) -> HttpResponseRedirect:
     """Mark all the cases in an export as ready"""
     export: Export = get_object_or_404(Export, id=pk)
-    for export_case in export.exportcase_set.all():
-        export_case.status = ExportCase.Status.READY
-        export_case.save()
+    export.exportcase_set.update(status=ExportCase.Status.READY)
     return redirect(reverse("exports:export-detail", kwargs={"pk": export.id}))
 
 
@@ -8,7 +8,7 @@ from typing import Any, Generator
 from django.db.models.query import QuerySet
 from django.urls import reverse
 
-from ..cases.csv_export import DOWNLOAD_CASES_CHUNK_SIZE
+from ..cases.csv_export import DOWNLOAD_CASES_CHUNK_SIZE, load_export_cases
 from ..common.csv_export import CSVColumn, EqualityBodyCSVColumn, format_model_field
 from .models import IOS_ANDROID_SEPARATOR, MobileCase, MobileContact
 
@@ -887,6 +887,7 @@ def populate_mobile_equality_body_columns(
 
 def csv_mobile_equality_body_output_generator(
     mobile_cases: QuerySet[MobileCase],
+    include_header: bool = True,
 ) -> Generator[str, None, None]:
     """
     Generate a series of strings containing the mobile equality body export data for
@@ -902,11 +903,13 @@ def csv_mobile_equality_body_output_generator(
         column.column_header for column in MOBILE_EQUALITY_BODY_COLUMNS_FOR_EXPORT
     ]
 
-    output: str = writer.writerow(column_row)
+    output: str = writer.writerow(column_row) if include_header else ""
 
-    for counter, mobile_case in enumerate(mobile_cases):
+    for counter, mobile_case in enumerate(
+        load_export_cases(cases=mobile_cases, chunk_size=DOWNLOAD_CASES_CHUNK_SIZE)
+    ):
         case_columns: list[EqualityBodyCSVColumn | MobileEqualityBodyCSVColumn] = (
-            populate_mobile_equality_body_columns(mobile_case=mobile_case.get_case())
+            populate_mobile_equality_body_columns(mobile_case=mobile_case)
         )
         row = [column.formatted_data for column in case_columns]
         output += writer.writerow(row)
@@ -13,7 +13,7 @@ from django.db import models
 from django.db.models import QuerySet
 from django.http import StreamingHttpResponse
 
-from ..cases.csv_export import csv_output_generator
+from ..cases.csv_export import csv_output_generator, csv_streaming_response
 from ..cases.models import BaseCase
 from ..cases.utils import CaseDetailPage, CaseDetailSection
 from ..common.form_extract_utils import (
@@ -85,36 +85,38 @@ def add_to_mobile_case_history(
 
 
 def download_mobile_cases(
-    mobile_cases: QuerySet[BaseCase], filename: str = "mobile_cases.csv"
+    mobile_cases: QuerySet[BaseCase],
+    filename: str = "mobile_cases.csv",
+    compress: bool = False,
 ) -> StreamingHttpResponse:
     """Given a MobileCase queryset, download the data in csv format"""
 
-    response = StreamingHttpResponse(
-        csv_output_generator(
+    return csv_streaming_response(
+        output_generator=csv_output_generator(
             cases=mobile_cases,
             columns_for_export=MOBILE_CASE_COLUMNS_FOR_EXPORT,
         ),
-        content_type="text/csv",
+        filename=filename,
+        compress=compress,
     )
-    response["Content-Disposition"] = f"attachment; filename={filename}"
-    return response
 
 
 def download_mobile_feedback_survey_cases(
-    cases: QuerySet[BaseCase], filename: str = "mobile_feedback_survey_cases.csv"
+    cases: QuerySet[BaseCase],
+    filename: str = "mobile_feedback_survey_cases.csv",
+    compress: bool = False,
 ) -> StreamingHttpResponse:
     """
     Given a MobileCase queryset, download the feedback survey data in csv format
     """
-    response = StreamingHttpResponse(
-        csv_output_generator(
+    return csv_streaming_response(
+        output_generator=csv_output_generator(
             cases=cases,
             columns_for_export=MOBILE_FEEDBACK_SURVEY_COLUMNS_FOR_EXPORT,
         ),
-        content_type="text/csv",
+        filename=filename,
+        compress=compress,
     )
-    response["Content-Disposition"] = f"attachment; filename={filename}"
-    return response
 
 
 def get_mobile_case_detail_sections(
@@ -169,15 +171,15 @@ def get_mobile_case_detail_sections(
 def download_mobile_equality_body_cases(
     mobile_cases: QuerySet[MobileCase],
     filename: str = "mobile_equality_body_cases.csv",
+    compress: bool = False,
 ) -> StreamingHttpResponse:
     """
     Given a MobileCase queryset, download the feedback survey data in csv format
     """
-    response = StreamingHttpResponse(
-        csv_mobile_equality_body_output_generator(
+    return csv_streaming_response(
+        output_generator=csv_mobile_equality_body_output_generator(
             mobile_cases=mobile_cases,
         ),
-        content_type="text/csv",
+        filename=filename,
+        compress=compress,
     )
-    response["Content-Disposition"] = f"attachment; filename={filename}"
-    return response
@@ -15,6 +15,7 @@ from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView, UpdateView
 from django.views.generic.list import ListView
 
+from ..cases.csv_export import is_compressed_export_requested
 from ..cases.forms import CaseSearchForm
 from ..cases.models import BaseCase, TestType
 from ..cases.utils import filter_cases, find_duplicate_cases
@@ -35,7 +36,7 @@ from ..common.views import (
     ShowGoBackJSWidgetMixin,
 )
 from ..notifications.models import Task
-from ..notifications.utils import mark_tasks_as_read
+from ..notifications.utils import mark_case_tasks_as_read
 from .csv_export import (
     MOBILE_EQUALITY_BODY_CORRESPONDENCE_COLUMNS_FOR_EXPORT,
     MOBILE_EQUALITY_BODY_METADATA_COLUMNS_FOR_EXPORT,
@@ -831,11 +832,10 @@ class MobileCaseHistoryDetailView(DetailView):
 def mark_qa_comments_as_read(request: HttpRequest, pk: int) -> HttpResponseRedirect:
     """Mark QA comment reminders as read for the current user"""
     mobile_case: MobileCase = MobileCase.objects.get(id=pk)
-    mark_tasks_as_read(
-        user=request.user, base_case=mobile_case, type=Task.Type.QA_COMMENT
-    )
-    mark_tasks_as_read(
-        user=request.user, base_case=mobile_case, type=Task.Type.REPORT_APPROVED
+    mark_case_tasks_as_read(
+        user=request.user,
+        base_case=mobile_case,
+        types=[Task.Type.QA_COMMENT, Task.Type.REPORT_APPROVED],
     )
     messages.success(request, f"{mobile_case} comments marked as read")
     return redirect(reverse("mobile:edit-qa-comments", kwargs={"pk": mobile_case.id}))
@@ -850,7 +850,10 @@ def export_mobile_cases(request: HttpRequest) -> StreamingHttpResponse:
         replace_search_key_with_case_search(request.GET)
     )
     case_search_form.is_valid()
-    return download_mobile_cases(mobile_cases=filter_cases(form=case_search_form))
+    return download_mobile_cases(
+        mobile_cases=filter_cases(form=case_search_form),
+        compress=is_compressed_export_requested(request),
+    )
 
 
 def export_feedback_survey_cases(request: HttpRequest) -> StreamingHttpResponse:
@@ -860,7 +863,8 @@ def export_feedback_survey_cases(request: HttpRequest) -> StreamingHttpResponse:
     case_search_form: CaseSearchForm = CaseSearchForm(search_parameters)
     case_search_form.is_valid()
     return download_mobile_feedback_survey_cases(
-        cases=filter_cases(form=case_search_form)
+        cases=filter_cases(form=case_search_form),
+        compress=is_compressed_export_requested(request),
     )
 
 
@@ -871,7 +875,8 @@ def export_equality_body_cases(request: HttpRequest) -> StreamingHttpResponse:
     case_search_form: CaseSearchForm = CaseSearchForm(search_parameters)
     case_search_form.is_valid()
     return download_mobile_equality_body_cases(
-        mobile_cases=filter_cases(form=case_search_form)
+        mobile_cases=filter_cases(form=case_search_form),
+        compress=is_compressed_export_requested(request),
     )
 
 
@@ -4,7 +4,7 @@ Admin for notifications
 
 from django.contrib import admin
 
-from .models import NotificationSetting, Task
+from .models import NotificationEmail, NotificationSetting, Task
 
 
 class NotificationSettingAdmin(admin.ModelAdmin):
@@ -46,5 +46,26 @@ class TaskAdmin(admin.ModelAdmin):
     show_facets = admin.ShowFacets.ALWAYS
 
 
+class NotificationEmailAdmin(admin.ModelAdmin):
+    """Django admin configuration for NotificationEmail model"""
+
+    search_fields = [
+        "to_email",
+        "subject",
+    ]
+    list_display = [
+        "id",
+        "created",
+        "to_email",
+        "subject",
+        "status",
+        "attempts",
+        "sent",
+    ]
+    list_filter = ["status"]
+    readonly_fields = ["task", "created", "sent"]
+
+
+admin.site.register(NotificationEmail, NotificationEmailAdmin)
 admin.site.register(NotificationSetting, NotificationSettingAdmin)
 admin.site.register(Task, TaskAdmin)
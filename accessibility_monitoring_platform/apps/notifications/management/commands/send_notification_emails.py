@@ -0,0 +1,45 @@
+"""Command to send the queued notification emails"""
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...utils import NOTIFICATION_EMAIL_BATCH_SIZE, send_notification_emails
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Send the queued notification emails"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=NOTIFICATION_EMAIL_BATCH_SIZE,
+            help="Number of emails to load from the outbox at a time",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=int,
+            default=None,
+            help="Keep running, checking the outbox every this many seconds",
+        )
+
+    def handle(self, *args, **options):  # pylint: disable=unused-argument
+        while True:
+            try:
+                sent_count: int = send_notification_emails(
+                    batch_size=options["batch_size"]
+                )
+                self.stdout.write(f"Sent {sent_count} notification emails")
+            except Exception:  # pylint: disable=broad-exception-caught
+                if options["poll_interval"] is None:
+                    raise
+                logger.exception("Sending notification emails failed")
+                close_old_connections()
+            if options["poll_interval"] is None:
+                break
+            time.sleep(options["poll_interval"])
@@ -0,0 +1,39 @@
+"""Command to email each user a digest of their reminders and overdue cases"""
+
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ...utils import send_reminder_digests
+
+DAY_OF_WEEK_MONDAY: int = 0
+DEFAULT_DRY_RUN_OUTPUT_DIR: str = "reminder_digests"
+
+
+class Command(BaseCommand):
+    help = "Email each user a digest of their reminders and overdue cases"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Write the rendered emails to files instead of sending them",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default=DEFAULT_DRY_RUN_OUTPUT_DIR,
+            help="Directory to write rendered emails to in a dry run",
+        )
+
+    def handle(self, *args, **options):  # pylint: disable=unused-argument
+        if options["dry_run"]:
+            output_dir: Path = Path(options["output_dir"])
+            digests_count: int = send_reminder_digests(output_dir=output_dir)
+            self.stdout.write(f"Wrote {digests_count} reminder digests to {output_dir}")
+        elif (
+            os.getenv("COPILOT_ENVIRONMENT_NAME") == "prodenv"
+            and timezone.now().weekday() == DAY_OF_WEEK_MONDAY
+        ):
+            send_reminder_digests()
@@ -132,3 +132,29 @@ class NotificationSetting(models.Model):
 
     def __str__(self) -> str:
         return f"{self.user} - email_notifications_enabled is {self.email_notifications_enabled}"
+
+
+class NotificationEmail(models.Model):
+    """Django model for notification emails waiting to be sent"""
+
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        SENT = "sent"
+        FAILED = "failed"
+
+    task = models.ForeignKey(Task, on_delete=models.PROTECT, null=True, blank=True)
+    to_email = models.EmailField()
+    subject = models.TextField(default="")
+    body = models.TextField(default="")
+    status = models.CharField(max_length=20, choices=Status, default=Status.PENDING)
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(default="", blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    sent = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering: list[str] = ["id"]
+        indexes = [models.Index(fields=["status", "id"])]
+
+    def __str__(self) -> str:
+        return f"{self.to_email} - {self.subject} ({self.get_status_display()})"
@@ -0,0 +1,73 @@
+"""
+Test for send_notification_emails command which drains the notification email outbox.
+"""
+
+from io import StringIO
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.management import call_command
+
+from ..models import NotificationEmail
+
+TIME_SLEEP_PATH: str = (
+    "accessibility_monitoring_platform.apps.notifications.management.commands."
+    "send_notification_emails.time.sleep"
+)
+SEND_NOTIFICATION_EMAILS_PATH: str = (
+    "accessibility_monitoring_platform.apps.notifications.management.commands."
+    "send_notification_emails.send_notification_emails"
+)
+
+
+@pytest.mark.django_db
+def test_send_notification_emails_sends_queued_emails(mailoutbox):
+    """Test send_notification_emails sends the pending emails once"""
+    NotificationEmail.objects.create(
+        to_email="user@example.com", subject="Subject", body="Body"
+    )
+    stdout: StringIO = StringIO()
+
+    call_command("send_notification_emails", "--batch-size", "1", stdout=stdout)
+
+    assert len(mailoutbox) == 1
+    assert mailoutbox[0].to == ["user@example.com"]
+    assert stdout.getvalue() == "Sent 1 notification emails\n"
+    assert NotificationEmail.objects.get().status == NotificationEmail.Status.SENT
+
+
+@pytest.mark.django_db
+def test_send_notification_emails_polls_outbox(mailoutbox):
+    """Test send_notification_emails keeps checking the outbox when polling"""
+    NotificationEmail.objects.create(
+        to_email="user@example.com", subject="Subject", body="Body"
+    )
+    mock_sleep: Mock = Mock(side_effect=[None, KeyboardInterrupt])
+
+    with patch(TIME_SLEEP_PATH, mock_sleep):
+        with pytest.raises(KeyboardInterrupt):
+            call_command("send_notification_emails", "--poll-interval", "30")
+
+    assert len(mailoutbox) == 1
+    assert mock_sleep.call_count == 2
+    mock_sleep.assert_called_with(30)
+
+
+@pytest.mark.django_db
+def test_send_notification_emails_keeps_polling_after_error(caplog):
+    """Test send_notification_emails logs a failed check of the outbox and carries on"""
+    stdout: StringIO = StringIO()
+    mock_sleep: Mock = Mock(side_effect=[None, KeyboardInterrupt])
+
+    with (
+        patch(
+            SEND_NOTIFICATION_EMAILS_PATH, side_effect=[ValueError("Outbox error"), 1]
+        ),
+        patch(TIME_SLEEP_PATH, mock_sleep),
+        pytest.raises(KeyboardInterrupt),
+    ):
+        call_command("send_notification_emails", "--poll-interval", "30", stdout=stdout)
+
+    assert "Sending notification emails failed" in caplog.text
+    assert "Outbox error" in caplog.text
+    assert stdout.getvalue() == "Sent 1 notification emails\n"
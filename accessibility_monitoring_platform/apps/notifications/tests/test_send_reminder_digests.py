@@ -0,0 +1,61 @@
+"""
+Test for send_reminder_digests command which should only email the users on a Monday.
+"""
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.management import call_command
+
+MONDAY: datetime = datetime(2025, 11, 10, 2, 0, 0, tzinfo=timezone.utc)
+TUESDAY: datetime = datetime(2025, 11, 11, 2, 0, 0, tzinfo=timezone.utc)
+SUNDAY: datetime = datetime(2025, 11, 16, 2, 0, 0, tzinfo=timezone.utc)
+SEND_REMINDER_DIGESTS_PATH: str = (
+    "accessibility_monitoring_platform.apps.notifications.management.commands."
+    "send_reminder_digests.send_reminder_digests"
+)
+
+
+@pytest.mark.parametrize(
+    "call_time, expected_to_call",
+    [
+        (MONDAY, True),
+        (TUESDAY, False),
+        (SUNDAY, False),
+    ],
+)
+@pytest.mark.django_db
+def test_send_reminder_digests_only_called_monday(call_time, expected_to_call):
+    """Test send_reminder_digests only sends the digests on a Monday"""
+    os.environ["COPILOT_ENVIRONMENT_NAME"] = "prodenv"
+    mock_send_reminder_digests: Mock = Mock()
+    with patch(
+        "django.utils.timezone.now",
+        Mock(return_value=call_time),
+    ):
+        with patch(SEND_REMINDER_DIGESTS_PATH, mock_send_reminder_digests):
+            call_command("send_reminder_digests")
+
+    if expected_to_call is True:
+        mock_send_reminder_digests.assert_called_once_with()
+    else:
+        mock_send_reminder_digests.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_send_reminder_digests_dry_run(tmp_path):
+    """Test send_reminder_digests dry run writes digests on any day"""
+    mock_send_reminder_digests: Mock = Mock(return_value=3)
+    with patch(
+        "django.utils.timezone.now",
+        Mock(return_value=TUESDAY),
+    ):
+        with patch(SEND_REMINDER_DIGESTS_PATH, mock_send_reminder_digests):
+            call_command(
+                "send_reminder_digests", "--dry-run", "--output-dir", str(tmp_path)
+            )
+
+    mock_send_reminder_digests.assert_called_once_with(output_dir=Path(tmp_path))
@@ -1,10 +1,14 @@
 """Tests - test for notifications template tags"""
 
 from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from django.contrib.auth.models import Group, User
 from django.contrib.contenttypes.models import ContentType
+from django.core.mail import EmailMessage
+from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.urls import reverse
 
@@ -17,6 +21,8 @@ from ...audits.tests.create_test_data import (
 from ...cases.models import BaseCase
 from ...common.models import Boolean, Link
 from ...detailed.models import DetailedCase, DetailedEventHistory
+from ...mobile.models import EventHistory as MobileEventHistory
+from ...mobile.models import MobileCase
 from ...simplified.models import (
     EqualityBodyCorrespondence,
     SimplifiedCase,
@@ -26,20 +32,27 @@ from ...simplified.views import (
     calculate_report_followup_dates,
     calculate_twelve_week_chaser_dates,
 )
-from ..models import NotificationSetting, Task
+from ..models import NotificationEmail, NotificationSetting, Task
 from ..utils import (
+    NOTIFICATION_EMAIL_MAX_ATTEMPTS,
     add_task,
-    build_task_list,
+    build_reminder_digest_emails,
+    build_reminder_digests,
+    build_task_feed,
     email_all_specialists_all_detailed_reminders_due,
     exclude_cases_with_pending_reminders,
     get_number_of_tasks,
     get_overdue_cases,
-    get_post_case_tasks,
+    get_task_feed_tasks,
+    get_task_feed_type_counts,
     get_task_type_counts,
     get_tasks_by_type_count,
+    mark_case_tasks_as_read,
     mark_tasks_as_read,
     record_case_model_create_event,
     record_case_model_update_event,
+    send_notification_emails,
+    send_reminder_digests,
 )
 
 TODAY = date.today()
@@ -74,6 +87,13 @@ def create_case(user: User) -> SimplifiedCase:
     return simplified_case
 
 
+def get_feed_tasks(user: User, **kwargs) -> list[Task]:
+    """Return the tasks of a user in the task feed, as the task list shows them"""
+    return get_task_feed_tasks(
+        task_feed_rows=list(build_task_feed(user=user, **kwargs))
+    )
+
+
 @pytest.mark.django_db
 def test_mark_tasks_as_read_marks_task_as_read(rf):
     """test to check if mark_tasks_as_read function marks tasks as read"""
@@ -82,7 +102,7 @@ def test_mark_tasks_as_read_marks_task_as_read(rf):
         username="mockuser", email="mockuser@mock.com", password="secret"
     )
     request.user = user
-    base_case: BaseCase = BaseCase.objects.create()
+    base_case: SimplifiedCase = SimplifiedCase.objects.create()
 
     task: Task = Task.objects.create(
         date=date.today(), user=user, base_case=base_case, type=Task.Type.QA_COMMENT
@@ -97,6 +117,94 @@ def test_mark_tasks_as_read_marks_task_as_read(rf):
     assert task_from_db.read
 
 
+@pytest.mark.parametrize(
+    "case_model, history_model",
+    [
+        (SimplifiedCase, SimplifiedEventHistory),
+        (DetailedCase, DetailedEventHistory),
+        (MobileCase, MobileEventHistory),
+    ],
+)
+@pytest.mark.django_db
+def test_mark_case_tasks_as_read(case_model, history_model, django_assert_num_queries):
+    """
+    Test mark_case_tasks_as_read marks all matching tasks as read in bulk
+    and records an update event for each one.
+    """
+    user: User = User.objects.create()
+    other_user: User = User.objects.create(username="other")
+    base_case: BaseCase = case_model.objects.create()
+    qa_comment_task: Task = Task.objects.create(
+        date=date.today(), user=user, base_case=base_case, type=Task.Type.QA_COMMENT
+    )
+    report_approved_task: Task = Task.objects.create(
+        date=date.today(),
+        user=user,
+        base_case=base_case,
+        type=Task.Type.REPORT_APPROVED,
+    )
+    reminder_task: Task = Task.objects.create(
+        date=date.today(), user=user, base_case=base_case, type=Task.Type.REMINDER
+    )
+    other_user_task: Task = Task.objects.create(
+        date=date.today(),
+        user=other_user,
+        base_case=base_case,
+        type=Task.Type.QA_COMMENT,
+    )
+    ContentType.objects.get_for_model(Task)
+
+    with django_assert_num_queries(3):
+        assert (
+            mark_case_tasks_as_read(
+                user=user,
+                base_case=base_case,
+                types=[Task.Type.QA_COMMENT, Task.Type.REPORT_APPROVED],
+            )
+            == 2
+        )
+
+    assert Task.objects.get(id=qa_comment_task.id).read is True
+    assert Task.objects.get(id=report_approved_task.id).read is True
+    assert Task.objects.get(id=reminder_task.id).read is False
+    assert Task.objects.get(id=other_user_task.id).read is False
+
+    content_type: ContentType = ContentType.objects.get_for_model(Task)
+    events = history_model.objects.filter(content_type=content_type)
+
+    assert sorted(event.object_id for event in events) == sorted(
+        [qa_comment_task.id, report_approved_task.id]
+    )
+    assert events[0].event_type == history_model.Type.UPDATE
+    assert events[0].variables == [
+        {"name": "read", "old_value": "False", "new_value": "True"}
+    ]
+
+
+@pytest.mark.django_db
+def test_mark_case_tasks_as_read_no_unread_tasks(django_assert_num_queries):
+    """Test mark_case_tasks_as_read does nothing if there are no unread tasks"""
+    user: User = User.objects.create()
+    base_case: SimplifiedCase = SimplifiedCase.objects.create()
+    Task.objects.create(
+        date=date.today(),
+        user=user,
+        base_case=base_case,
+        type=Task.Type.QA_COMMENT,
+        read=True,
+    )
+
+    with django_assert_num_queries(1):
+        assert (
+            mark_case_tasks_as_read(
+                user=user, base_case=base_case, types=[Task.Type.QA_COMMENT]
+            )
+            == 0
+        )
+
+    assert SimplifiedEventHistory.objects.count() == 0
+
+
 @pytest.mark.django_db
 def test_add_task_qa_comment_correct_link_in_email_simplified(mailoutbox, rf):
     """test to check if add_task adds task and sends email for simplified case"""
@@ -119,6 +227,8 @@ def test_add_task_qa_comment_correct_link_in_email_simplified(mailoutbox, rf):
         request=request,
     )
 
+    assert len(mailoutbox) == 0
+    assert send_notification_emails() == 1
     assert len(mailoutbox) == 1
     assert (
         reverse("simplified:edit-qa-comments", kwargs={"pk": base_case.id})
@@ -146,6 +256,8 @@ def test_add_task_qa_comment_correct_link_in_email_detailed(mailoutbox, rf):
         request=request,
     )
 
+    assert len(mailoutbox) == 0
+    assert send_notification_emails() == 1
     assert len(mailoutbox) == 1
     assert (
         reverse("detailed:edit-qa-comments", kwargs={"pk": base_case.id})
@@ -184,7 +296,16 @@ def test_add_task_creates_task_and_sends_email(type, mailoutbox, rf):
     assert task is not None
     assert task.description == "this is a notification"
 
+    assert len(mailoutbox) == 0
+
+    notification_email: NotificationEmail = NotificationEmail.objects.get(task=task)
+
+    assert notification_email.status == NotificationEmail.Status.PENDING
+    assert notification_email.to_email == "mockuser@mock.com"
+
+    assert send_notification_emails() == 1
     assert len(mailoutbox) == 1
+    assert mailoutbox[0].to == ["mockuser@mock.com"]
     assert (
         mailoutbox[0].subject
         == "You have a new notification in the monitoring platform : There is a notification"
@@ -218,6 +339,7 @@ def test_add_task_creates_task_and_sends_no_email(mailoutbox, rf):
     assert task is not None
     assert task.description == "this is a notification"
 
+    assert NotificationEmail.objects.count() == 0
     assert len(mailoutbox) == 0
 
 
@@ -249,6 +371,7 @@ def test_add_task_creates_new_email_notification_model_when_null(mailoutbox, rf)
 
     assert task is not None
     assert task.description == "this is a notification"
+    assert NotificationEmail.objects.count() == 0
     assert len(mailoutbox) == 0
 
     notification_setting: NotificationSetting | None = (
@@ -261,11 +384,122 @@ def test_add_task_creates_new_email_notification_model_when_null(mailoutbox, rf)
 
 
 @pytest.mark.django_db
-def test_get_post_case_tasks():
+def test_add_task_queues_email_without_sending(rf, django_assert_num_queries):
+    """Test add_task only writes to the database"""
+    request: HttpRequest = rf.get("/")
+    user: User = User.objects.create_user(  # type: ignore
+        username="mockuser", email="mockuser@mock.com", password="secret"
+    )
+    request.user = user
+    NotificationSetting.objects.create(user=user)
+    base_case: BaseCase = BaseCase.objects.create()
+
+    with django_assert_num_queries(3):
+        add_task(
+            user=user,
+            base_case=base_case,
+            type=Task.Type.QA_COMMENT,
+            description="this is a notification",
+            email_description="There is a notification",
+            request=request,
+        )
+
+    assert NotificationEmail.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_send_notification_emails_in_batches(mailoutbox, django_assert_num_queries):
+    """Test queued notification emails are sent in batches and marked as sent"""
+    NotificationEmail.objects.bulk_create(
+        [
+            NotificationEmail(
+                to_email=f"user{count}@example.com",
+                subject=f"Subject {count}",
+                body="Body",
+            )
+            for count in range(3)
+        ]
+    )
+    NotificationEmail.objects.create(
+        to_email="sent@example.com", status=NotificationEmail.Status.SENT
+    )
+
+    # Three locked selects and two updates, each batch within a savepoint
+    with django_assert_num_queries(11):
+        assert send_notification_emails(batch_size=2) == 3
+
+    assert [email.to for email in mailoutbox] == [
+        ["user0@example.com"],
+        ["user1@example.com"],
+        ["user2@example.com"],
+    ]
+    assert mailoutbox[0].subject == "Subject 0"
+    assert mailoutbox[0].content_subtype == "html"
+    assert (
+        NotificationEmail.objects.filter(status=NotificationEmail.Status.SENT).count()
+        == 4
+    )
+    assert NotificationEmail.objects.filter(sent__isnull=True).count() == 1
+
+    assert send_notification_emails() == 0
+    assert len(mailoutbox) == 3
+
+
+@pytest.mark.django_db
+def test_send_notification_emails_skips_locked_emails(mailoutbox):
+    """Test emails being sent by another sender are locked and skipped"""
+    NotificationEmail.objects.create(
+        to_email="user@example.com", subject="Subject", body="Body"
+    )
+
+    with patch.object(
+        QuerySet,
+        "select_for_update",
+        autospec=True,
+        side_effect=QuerySet.select_for_update,
+    ) as mock_select_for_update:
+        assert send_notification_emails() == 1
+
+    assert mock_select_for_update.call_args.kwargs == {"skip_locked": True}
+
+
+@pytest.mark.django_db
+@patch.object(
+    EmailMessage, "send", side_effect=ConnectionError("Email service unavailable")
+)
+def test_send_notification_emails_retries_failures(mock_send, mailoutbox):
+    """Test notification emails which fail to send are retried and then given up"""
+    notification_email: NotificationEmail = NotificationEmail.objects.create(
+        to_email="user@example.com", subject="Subject", body="Body"
+    )
+
+    for attempt in range(1, NOTIFICATION_EMAIL_MAX_ATTEMPTS):
+        assert send_notification_emails() == 0
+
+        notification_email.refresh_from_db()
+
+        assert notification_email.attempts == attempt
+        assert notification_email.status == NotificationEmail.Status.PENDING
+        assert notification_email.last_error == "Email service unavailable"
+
+    assert send_notification_emails() == 0
+
+    notification_email.refresh_from_db()
+
+    assert notification_email.attempts == NOTIFICATION_EMAIL_MAX_ATTEMPTS
+    assert notification_email.status == NotificationEmail.Status.FAILED
+
+    assert send_notification_emails() == 0
+    assert mock_send.call_count == NOTIFICATION_EMAIL_MAX_ATTEMPTS
+    assert len(mailoutbox) == 0
+
+
+@pytest.mark.django_db
+def test_task_feed_postcase_tasks():
     """Test returning unresolved correspondence and incomplate retests"""
     user: User = User.objects.create()
 
-    assert len(get_post_case_tasks(user=user)) == 0
+    assert len(get_feed_tasks(user=user, type=Task.Type.POSTCASE)) == 0
 
     simplified_case: SimplifiedCase = (
         create_simplified_case_with_initial_and_12_week_audits()
@@ -276,7 +510,7 @@ def test_get_post_case_tasks():
         EqualityBodyCorrespondence.objects.create(simplified_case=simplified_case)
     )
 
-    post_case_tasks: list[Task] = get_post_case_tasks(user=user)
+    post_case_tasks: list[Task] = get_feed_tasks(user=user, type=Task.Type.POSTCASE)
 
     assert len(post_case_tasks) == 1
 
@@ -299,13 +533,13 @@ def test_get_post_case_tasks():
     equality_body_correspondence.status = EqualityBodyCorrespondence.Status.RESOLVED
     equality_body_correspondence.save()
 
-    assert len(get_post_case_tasks(user=user)) == 0
+    assert len(get_feed_tasks(user=user, type=Task.Type.POSTCASE)) == 0
 
     wcag_audit_retest: WcagAudit = create_equality_body_audits(
         simplified_case=simplified_case
     )
 
-    post_case_tasks: list[Task] = get_post_case_tasks(user=user)
+    post_case_tasks: list[Task] = get_feed_tasks(user=user, type=Task.Type.POSTCASE)
 
     assert len(post_case_tasks) == 1
 
@@ -326,7 +560,7 @@ def test_get_post_case_tasks():
     wcag_audit_retest.compliance_state = WcagAudit.WebsiteCompliance.COMPLIANT
     wcag_audit_retest.save()
 
-    assert len(get_post_case_tasks(user=user)) == 0
+    assert len(get_feed_tasks(user=user, type=Task.Type.POSTCASE)) == 0
 
 
 @pytest.mark.django_db
@@ -721,7 +955,7 @@ def test_pending_reminder_removes_overdue():
     simplified_case.save()
     simplified_case.update_case_status()
 
-    tasks: list[Task] = build_task_list(user=user)
+    tasks: list[Task] = get_feed_tasks(user=user)
 
     assert len(tasks) == 1
 
@@ -732,22 +966,22 @@ def test_pending_reminder_removes_overdue():
         date=date.today() + timedelta(days=1),
     )
 
-    tasks: list[Task] = build_task_list(user=user)
+    tasks: list[Task] = get_feed_tasks(user=user)
 
     assert len(tasks) == 0
 
 
 @pytest.mark.django_db
-def test_build_task_list_empty():
-    """Test build_task_list finds no tasks"""
+def test_task_feed_empty():
+    """Test task feed finds no tasks"""
     user: User = User.objects.create()
 
-    assert build_task_list(user=user) == []
+    assert get_feed_tasks(user=user) == []
 
 
 @pytest.mark.django_db
-def test_build_task_list_qa_comment():
-    """Test build_task_list finds QA comment task"""
+def test_task_feed_qa_comment():
+    """Test task feed finds QA comment task"""
     user: User = User.objects.create()
     base_case: BaseCase = BaseCase.objects.create(auditor=user)
     task: Task = Task.objects.create(
@@ -757,12 +991,12 @@ def test_build_task_list_qa_comment():
         user=user,
     )
 
-    assert build_task_list(user=user) == [task]
+    assert get_feed_tasks(user=user) == [task]
 
 
 @pytest.mark.django_db
-def test_build_task_list_report_approved():
-    """Test build_task_list finds Report approved task"""
+def test_task_feed_report_approved():
+    """Test task feed finds Report approved task"""
     user: User = User.objects.create()
     base_case: BaseCase = BaseCase.objects.create(auditor=user)
     task: Task = Task.objects.create(
@@ -772,13 +1006,13 @@ def test_build_task_list_report_approved():
         user=user,
     )
 
-    assert build_task_list(user=user) == [task]
+    assert get_feed_tasks(user=user) == [task]
 
 
 @pytest.mark.django_db
-def test_build_task_list_reverse_sorts_read():
+def test_task_feed_reverse_sorts_read():
     """
-    Test build_task_list sorts read tasks by newest first
+    Test task feed sorts read tasks by newest first
     """
     user: User = User.objects.create()
     base_case: BaseCase = BaseCase.objects.create(auditor=user)
@@ -797,12 +1031,12 @@ def test_build_task_list_reverse_sorts_read():
         read=True,
     )
 
-    assert build_task_list(user=user, read="true") == [task_2, task_1]
+    assert get_feed_tasks(user=user, read="true") == [task_2, task_1]
 
 
 @pytest.mark.django_db
-def test_build_task_list_reminder():
-    """Test build_task_list finds reminder task"""
+def test_task_feed_reminder():
+    """Test task feed finds reminder task"""
     user: User = User.objects.create()
     base_case: BaseCase = BaseCase.objects.create(auditor=user)
     task: Task = Task.objects.create(
@@ -812,12 +1046,12 @@ def test_build_task_list_reminder():
         user=user,
     )
 
-    assert build_task_list(user=user) == [task]
+    assert get_feed_tasks(user=user) == [task]
 
 
 @pytest.mark.django_db
-def test_build_task_list_overdue():
-    """Test build_task_list finds overdue task"""
+def test_task_feed_overdue():
+    """Test task feed finds overdue task"""
     user: User = User.objects.create()
     simplified_case: SimplifiedCase = create_case(user)
     simplified_case.enable_correspondence_process = True
@@ -825,7 +1059,7 @@ def test_build_task_list_overdue():
     simplified_case.no_contact_one_week_chaser_due_date = YESTERDAY
     simplified_case.save()
 
-    tasks: list[Task] = build_task_list(user=user)
+    tasks: list[Task] = get_feed_tasks(user=user)
 
     assert len(tasks) == 1
 
@@ -835,13 +1069,13 @@ def test_build_task_list_overdue():
 
 
 @pytest.mark.django_db
-def test_build_task_list_postcase():
-    """Test build_task_list finds post case task"""
+def test_task_feed_postcase():
+    """Test task feed finds post case task"""
     user: User = User.objects.create()
     simplified_case: SimplifiedCase = SimplifiedCase.objects.create(auditor=user)
     EqualityBodyCorrespondence.objects.create(simplified_case=simplified_case)
 
-    tasks: list[Task] = build_task_list(user=user)
+    tasks: list[Task] = get_feed_tasks(user=user)
 
     assert len(tasks) == 1
 
@@ -864,7 +1098,7 @@ def test_pending_reminder_removes_postcase():
         audit_round_type=WcagAudit.AuditRoundType.EQUALITY_BODY,
     )
 
-    tasks: list[Task] = build_task_list(user=user)
+    tasks: list[Task] = get_feed_tasks(user=user)
 
     assert len(tasks) == 2
 
@@ -875,11 +1109,134 @@ def test_pending_reminder_removes_postcase():
         date=date.today() + timedelta(days=1),
     )
 
-    tasks: list[Task] = build_task_list(user=user)
+    tasks: list[Task] = get_feed_tasks(user=user)
 
     assert len(tasks) == 0
 
 
+@pytest.mark.django_db
+def test_build_task_feed_overdue_dates_match_next_action_due_date():
+    """Test task feed calculates the same dates as next_action_due_date"""
+    user: User = User.objects.create()
+
+    report_ready_to_send_case: SimplifiedCase = create_case(user)
+    report_ready_to_send_case.enable_correspondence_process = True
+    report_ready_to_send_case.seven_day_no_contact_email_sent_date = ONE_WEEK_AGO
+    report_ready_to_send_case.no_contact_one_week_chaser_due_date = YESTERDAY
+    report_ready_to_send_case.save()
+    report_ready_to_send_case.update_case_status()
+
+    four_week_sent_case: SimplifiedCase = create_case(user)
+    four_week_sent_case.report_sent_date = FIVE_WEEKS_AGO
+    four_week_sent_case = calculate_report_followup_dates(
+        four_week_sent_case, four_week_sent_case.report_sent_date
+    )
+    four_week_sent_case.report_followup_week_1_sent_date = FOUR_WEEKS_AGO
+    four_week_sent_case.report_followup_week_4_sent_date = ONE_WEEK_AGO
+    four_week_sent_case.save()
+    four_week_sent_case.update_case_status()
+
+    twelve_week_chaser_sent_case: SimplifiedCase = create_case(user)
+    twelve_week_chaser_sent_case.report_sent_date = FOURTEEN_WEEKS_AGO
+    twelve_week_chaser_sent_case = calculate_report_followup_dates(
+        twelve_week_chaser_sent_case, twelve_week_chaser_sent_case.report_sent_date
+    )
+    twelve_week_chaser_sent_case.report_acknowledged_date = FOURTEEN_WEEKS_AGO
+    twelve_week_chaser_sent_case.twelve_week_update_requested_date = TWO_WEEKS_AGO
+    twelve_week_chaser_sent_case = calculate_twelve_week_chaser_dates(
+        twelve_week_chaser_sent_case,
+        twelve_week_chaser_sent_case.twelve_week_update_requested_date,
+    )
+    twelve_week_chaser_sent_case.twelve_week_1_week_chaser_sent_date = ONE_WEEK_AGO
+    twelve_week_chaser_sent_case.save()
+    twelve_week_chaser_sent_case.update_case_status()
+
+    task_feed_rows: list[dict] = list(
+        build_task_feed(user=user, type=Task.Type.OVERDUE)
+    )
+
+    assert len(task_feed_rows) == 3
+    assert len(get_overdue_cases(user)) == 3
+
+    for task_feed_row in task_feed_rows:
+        simplified_case: SimplifiedCase = SimplifiedCase.objects.get(
+            id=task_feed_row["id"]
+        )
+        assert task_feed_row["task_date"] == simplified_case.next_action_due_date
+
+
+@pytest.mark.django_db
+def test_task_feed_sorted_across_sources(django_assert_num_queries):
+    """
+    Test task feed merges stored and derived tasks by date, building
+    each source in a single query
+    """
+    user: User = User.objects.create()
+    overdue_case: SimplifiedCase = create_case(user)
+    overdue_case.enable_correspondence_process = True
+    overdue_case.seven_day_no_contact_email_sent_date = TWO_WEEKS_AGO
+    overdue_case.no_contact_one_week_chaser_due_date = ONE_WEEK_AGO
+    overdue_case.save()
+    overdue_case.update_case_status()
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(auditor=user)
+    EqualityBodyCorrespondence.objects.create(simplified_case=simplified_case)
+    older_task: Task = Task.objects.create(
+        type=Task.Type.QA_COMMENT, date=TWO_WEEKS_AGO, user=user, base_case=overdue_case
+    )
+    newer_task: Task = Task.objects.create(
+        type=Task.Type.REPORT_APPROVED,
+        date=YESTERDAY,
+        user=user,
+        base_case=overdue_case,
+    )
+
+    with django_assert_num_queries(5):
+        tasks: list[Task] = get_feed_tasks(user=user)
+
+    assert [(task.type, task.date) for task in tasks] == [
+        (Task.Type.QA_COMMENT, older_task.date),
+        (Task.Type.OVERDUE, ONE_WEEK_AGO),
+        (Task.Type.REPORT_APPROVED, newer_task.date),
+        (Task.Type.POSTCASE, TODAY),
+    ]
+
+
+@pytest.mark.django_db
+def test_get_task_feed_type_counts():
+    """Test counting the types of tasks in the task feed"""
+    user: User = User.objects.create()
+
+    assert get_task_feed_type_counts(user=user) == {
+        "qa_comment": 0,
+        "report_approved": 0,
+        "reminder": 0,
+        "overdue": 0,
+        "postcase": 0,
+    }
+
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(auditor=user)
+    EqualityBodyCorrespondence.objects.create(simplified_case=simplified_case)
+    WcagAudit.objects.create(
+        simplified_case=simplified_case,
+        audit_round_type=WcagAudit.AuditRoundType.EQUALITY_BODY,
+    )
+    for type in [Task.Type.QA_COMMENT, Task.Type.REMINDER, Task.Type.REMINDER]:
+        Task.objects.create(
+            type=type, date=YESTERDAY, user=user, base_case=simplified_case
+        )
+
+    assert get_task_feed_type_counts(user=user) == get_task_type_counts(
+        tasks=get_feed_tasks(user=user)
+    )
+    assert get_task_feed_type_counts(user=user) == {
+        "qa_comment": 1,
+        "report_approved": 0,
+        "reminder": 2,
+        "overdue": 0,
+        "postcase": 2,
+    }
+
+
 @pytest.mark.django_db
 def test_get_number_of_tasks_empty():
     """Test get_number_of_tasks finds no tasks"""
@@ -1104,3 +1461,160 @@ def test_email_all_specialists_all_detailed_reminders_due(mailoutbox):
     assert "Third reminder description" not in mailoutbox[0].body
 
     # print(mailoutbox[0].message())  # Visible when run with pytest -s
+
+
+def create_reminder_digest_data() -> tuple[User, User]:
+    """Create reminders and an overdue case for users with and without emails enabled"""
+    auditor: User = User.objects.create_user(  # type: ignore
+        username="auditor",
+        email="auditor@mock.com",
+        password="secret",
+        first_name="First",
+        last_name="Auditor",
+    )
+    NotificationSetting.objects.create(user=auditor)
+    specialist: User = User.objects.create_user(  # type: ignore
+        username="specialist",
+        email="specialist@mock.com",
+        password="secret",
+        first_name="Second",
+        last_name="Specialist",
+    )
+    NotificationSetting.objects.create(user=specialist)
+    disabled_user: User = User.objects.create_user(  # type: ignore
+        username="disabled", email="disabled@mock.com", password="secret"
+    )
+    NotificationSetting.objects.create(
+        user=disabled_user, email_notifications_enabled=False
+    )
+
+    for case_model, user, description in [
+        (SimplifiedCase, auditor, "Simplified reminder description"),
+        (DetailedCase, specialist, "Detailed reminder description"),
+        (MobileCase, specialist, "Mobile reminder description"),
+        (SimplifiedCase, disabled_user, "Disabled reminder description"),
+    ]:
+        Task.objects.create(
+            type=Task.Type.REMINDER,
+            user=user,
+            base_case=case_model.objects.create(
+                organisation_name=f"{description} organisation"
+            ),
+            description=description,
+            date=date.today(),
+        )
+    Task.objects.create(
+        type=Task.Type.REMINDER,
+        user=auditor,
+        base_case=SimplifiedCase.objects.create(),
+        description="Future reminder description",
+        date=date.today() + timedelta(days=8),
+    )
+
+    overdue_case: SimplifiedCase = create_case(auditor)
+    overdue_case.organisation_name = "Overdue organisation"
+    overdue_case.report_sent_date = ONE_WEEK_AGO
+    overdue_case = calculate_report_followup_dates(
+        overdue_case, overdue_case.report_sent_date
+    )
+    overdue_case.save()
+    overdue_case.update_case_status()
+
+    return auditor, specialist
+
+
+@pytest.mark.django_db
+def test_build_reminder_digests(django_assert_max_num_queries):
+    """
+    Test reminders and overdue cases are grouped by recipient in a constant
+    number of queries
+    """
+    auditor, specialist = create_reminder_digest_data()
+
+    with django_assert_max_num_queries(5):
+        digests = build_reminder_digests()
+
+    assert len(digests) == 2
+
+    auditor_digest, specialist_digest = digests
+
+    assert auditor_digest.recipient == auditor
+    assert [task.description for task in auditor_digest.reminders] == [
+        "Simplified reminder description"
+    ]
+    assert [case.organisation_name for case in auditor_digest.overdue_cases] == [
+        "Overdue organisation"
+    ]
+
+    assert specialist_digest.recipient == specialist
+    assert sorted(task.description for task in specialist_digest.reminders) == [
+        "Detailed reminder description",
+        "Mobile reminder description",
+    ]
+    assert specialist_digest.overdue_cases == []
+
+
+@pytest.mark.django_db
+def test_build_reminder_digests_none_enabled():
+    """Test no reminder digests built when no users have emails enabled"""
+    user: User = User.objects.create()
+    Task.objects.create(
+        type=Task.Type.REMINDER,
+        user=user,
+        base_case=SimplifiedCase.objects.create(),
+        date=date.today(),
+    )
+
+    assert build_reminder_digests() == []
+
+
+@pytest.mark.django_db
+def test_build_reminder_digest_emails():
+    """Test one reminder digest email is rendered per recipient"""
+    create_reminder_digest_data()
+
+    emails = build_reminder_digest_emails(digests=build_reminder_digests())
+
+    assert len(emails) == 2
+
+    auditor_email, specialist_email = emails
+
+    assert auditor_email.to == ["auditor@mock.com"]
+    assert "Hello First Auditor" in auditor_email.body
+    assert "Simplified reminder description" in auditor_email.body
+    assert "Overdue organisation" in auditor_email.body
+    assert "Future reminder description" not in auditor_email.body
+
+    assert specialist_email.to == ["specialist@mock.com"]
+    assert "Detailed reminder description" in specialist_email.body
+    assert "Mobile reminder description" in specialist_email.body
+    assert "Overdue cases" not in specialist_email.body
+
+
+@pytest.mark.django_db
+def test_send_reminder_digests(mailoutbox):
+    """Test reminder digests are emailed to each recipient"""
+    create_reminder_digest_data()
+
+    assert send_reminder_digests() == 2
+
+    assert len(mailoutbox) == 2
+    assert mailoutbox[0].to == ["auditor@mock.com"]
+    assert mailoutbox[1].to == ["specialist@mock.com"]
+
+
+@pytest.mark.django_db
+def test_send_reminder_digests_dry_run(mailoutbox, tmp_path):
+    """Test reminder digests are written to files and not emailed in a dry run"""
+    auditor, specialist = create_reminder_digest_data()
+    output_dir: Path = tmp_path / "digests"
+
+    assert send_reminder_digests(output_dir=output_dir) == 2
+
+    assert len(mailoutbox) == 0
+
+    auditor_digest: str = (output_dir / f"reminder_digest_{auditor.id}.txt").read_text()
+
+    assert auditor_digest.startswith("To: auditor@mock.com\n")
+    assert "Simplified reminder description" in auditor_digest
+    assert (output_dir / f"reminder_digest_{specialist.id}.txt").exists()
@@ -11,6 +11,7 @@ from pytest_django.asserts import assertContains, assertNotContains
 from ...detailed.models import DetailedCase
 from ...simplified.models import SimplifiedCase, SimplifiedEventHistory
 from ..models import Task
+from ..utils import TASK_LIST_PAGE_SIZE
 from ..views import (
     CommentsMarkAsReadView,
     ReminderTaskCreateView,
@@ -66,6 +67,45 @@ def test_task_list(rf):
     assertContains(response, "Tasks (1)")
 
 
+@pytest.mark.django_db
+def test_task_list_paginated(rf):
+    """Test task list page only shows one page of tasks"""
+    user: User = User.objects.create()
+    simplified_case: SimplifiedCase = SimplifiedCase.objects.create(auditor=user)
+    Task.objects.bulk_create(
+        [
+            Task(
+                type=Task.Type.REMINDER,
+                date=TODAY - timedelta(days=count),
+                user=user,
+                base_case=simplified_case,
+                description=f"{DESCRIPTION} {count}",
+            )
+            for count in range(TASK_LIST_PAGE_SIZE + 1)
+        ]
+    )
+
+    request: HttpRequest = rf.get(reverse("notifications:task-list"))
+    request.user = user
+
+    response: HttpResponse = TaskListView.as_view()(request)
+
+    assert response.status_code == 200
+    assertContains(response, f"Tasks ({TASK_LIST_PAGE_SIZE + 1})")
+    assertContains(response, f"{DESCRIPTION} {TASK_LIST_PAGE_SIZE}")
+    assertNotContains(response, f"{DESCRIPTION} 0")
+    assert len(response.context_data["tasks"]) == TASK_LIST_PAGE_SIZE
+
+    request: HttpRequest = rf.get(f"{reverse('notifications:task-list')}?page=2")
+    request.user = user
+
+    response: HttpResponse = TaskListView.as_view()(request)
+
+    assert response.status_code == 200
+    assertContains(response, f"{DESCRIPTION} 0")
+    assert len(response.context_data["tasks"]) == 1
+
+
 @pytest.mark.django_db
 def test_task_list_other_user(rf):
     """Test task list page can show other user's tasks"""
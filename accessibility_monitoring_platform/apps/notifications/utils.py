@@ -1,40 +1,80 @@
 """Add notification function for notification app"""
 
+import json
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from datetime import timezone as datetime_timezone
+from pathlib import Path
 from typing import Any, TypedDict, TypeVar
 
 from django.contrib.auth.models import Group, User
-from django.core.mail import EmailMessage
-from django.db import models
-from django.db.models import Q
+from django.contrib.contenttypes.models import ContentType
+from django.core.mail import EmailMessage, get_connection
+from django.db import models, transaction
+from django.db.models import (
+    Case,
+    Count,
+    DateField,
+    Exists,
+    F,
+    OuterRef,
+    Q,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, TruncDate
 from django.db.models.query import QuerySet
 from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
 from django.template.loader import get_template
 from django.urls import reverse
+from django.utils import timezone
 
 from ..audits.models import WcagAudit
+from ..cases.models import UPDATE_SEPARATOR
+from ..detailed.models import DetailedEventHistory
 from ..detailed.utils import (
     record_detailed_model_create_event,
     record_detailed_model_update_event,
 )
+from ..mobile.models import EventHistory as MobileEventHistory
 from ..simplified.models import (
+    ONE_WEEK_IN_DAYS,
     BaseCase,
     CaseStatus,
     EqualityBodyCorrespondence,
     SimplifiedCase,
+    SimplifiedEventHistory,
 )
 from ..simplified.utils import (
     record_simplified_model_create_event,
     record_simplified_model_update_event,
 )
-from .models import Link, NotificationSetting, Task
+from .models import Link, NotificationEmail, NotificationSetting, Task
 
 TASK_LIST_PARAMS: list[str] = ["type", "read", "deleted", "future"]
 TASK_LIST_READ_TIMEDELTA: timedelta = timedelta(days=7)
+TASK_LIST_PAGE_SIZE: int = 20
+TASK_FEED_SOURCE_TASK: str = "1-task"
+TASK_FEED_SOURCE_OVERDUE: str = "2-overdue"
+TASK_FEED_SOURCE_CORRESPONDENCE: str = "3-correspondence"
+TASK_FEED_SOURCE_RETEST: str = "4-retest"
 
 TCase = TypeVar("TCase", bound=BaseCase)
 
+EVENT_HISTORY_MODELS_BY_TEST_TYPE: dict[str, tuple[type[models.Model], str]] = {
+    BaseCase.TestType.SIMPLIFIED: (SimplifiedEventHistory, "simplified_case_id"),
+    BaseCase.TestType.DETAILED: (DetailedEventHistory, "detailed_case_id"),
+    BaseCase.TestType.MOBILE: (MobileEventHistory, "mobile_case_id"),
+}
+TASK_READ_DIFFERENCE: str = json.dumps({"read": f"False{UPDATE_SEPARATOR}True"})
+REMINDER_DIGEST_TIMEDELTA: timedelta = timedelta(days=7)
+NOTIFICATION_EMAIL_BATCH_SIZE: int = 50
+NOTIFICATION_EMAIL_MAX_ATTEMPTS: int = 5
+NOTIFICATION_FROM_EMAIL: str = (
+    "accessibility-monitoring-platform-contact-form@digital.cabinet-office.gov.uk"
+)
+
 
 class EmailContextType(TypedDict):
     user: User
@@ -44,6 +84,15 @@ class EmailContextType(TypedDict):
     request: HttpRequest
 
 
+@dataclass
+class ReminderDigest:
+    """Reminders and overdue cases to be emailed to one user"""
+
+    recipient: User
+    reminders: list[Task] = field(default_factory=list)
+    overdue_cases: list[SimplifiedCase] = field(default_factory=list)
+
+
 def add_task(
     user: User,
     base_case: BaseCase,
@@ -52,7 +101,10 @@ def add_task(
     email_description: str,
     request: HttpRequest,
 ) -> Task:
-    """Adds notification to database. Also handles email notifications."""
+    """
+    Adds notification to database. Email notifications are queued to be sent by
+    the send_notification_emails command.
+    """
     task: Task = Task.objects.create(
         type=type,
         date=date.today(),
@@ -60,14 +112,9 @@ def add_task(
         user=user,
         description=description,
     )
-    if NotificationSetting.objects.filter(pk=user.id).exists():  # type: ignore
-        email_settings: NotificationSetting = NotificationSetting.objects.get(pk=user.id)  # type: ignore
-    else:
-        email_settings: NotificationSetting = NotificationSetting(
-            user=user,
-            email_notifications_enabled=False,
-        )
-        email_settings.save()
+    email_settings, _ = NotificationSetting.objects.get_or_create(
+        user=user, defaults={"email_notifications_enabled": False}
+    )
 
     if type == Task.Type.QA_COMMENT:
         path: str = reverse(
@@ -88,17 +135,66 @@ def add_task(
         }
         template: str = get_template("notifications/notification_email.txt")
         content: str = template.render(context)  # type: ignore
-        email: EmailMessage = EmailMessage(
+        NotificationEmail.objects.create(
+            task=task,
+            to_email=user.email,
             subject=f"You have a new notification in the monitoring platform : {email_description}",
             body=content,
-            from_email="accessibility-monitoring-platform-contact-form@digital.cabinet-office.gov.uk",
-            to=[user.email],
         )
-        email.content_subtype = "html"
-        email.send()
     return task
 
 
+def send_notification_emails(
+    batch_size: int = NOTIFICATION_EMAIL_BATCH_SIZE,
+) -> int:
+    """
+    Send the queued notification emails in batches over one email connection.
+    Each batch is locked while it is sent so concurrent senders skip it.
+    Failed emails are retried on later runs until they have been attempted
+    NOTIFICATION_EMAIL_MAX_ATTEMPTS times. Returns the number of emails sent.
+    """
+    sent_count: int = 0
+    last_id: int = 0
+    with get_connection() as connection:
+        while True:
+            with transaction.atomic():
+                notification_emails: list[NotificationEmail] = list(
+                    NotificationEmail.objects.select_for_update(skip_locked=True)
+                    .filter(status=NotificationEmail.Status.PENDING, id__gt=last_id)
+                    .order_by("id")[:batch_size]
+                )
+                if not notification_emails:
+                    break
+                last_id = notification_emails[-1].id
+                for notification_email in notification_emails:
+                    email: EmailMessage = EmailMessage(
+                        subject=notification_email.subject,
+                        body=notification_email.body,
+                        from_email=NOTIFICATION_FROM_EMAIL,
+                        to=[notification_email.to_email],
+                        connection=connection,
+                    )
+                    email.content_subtype = "html"
+                    notification_email.attempts += 1
+                    try:
+                        email.send()
+                    except Exception as exception:  # pylint: disable=broad-except
+                        notification_email.last_error = str(exception)
+                        if (
+                            notification_email.attempts
+                            >= NOTIFICATION_EMAIL_MAX_ATTEMPTS
+                        ):
+                            notification_email.status = NotificationEmail.Status.FAILED
+                    else:
+                        notification_email.status = NotificationEmail.Status.SENT
+                        notification_email.sent = timezone.now()
+                        sent_count += 1
+                NotificationEmail.objects.bulk_update(
+                    notification_emails, ["status", "attempts", "last_error", "sent"]
+                )
+    return sent_count
+
+
 def email_all_specialists_all_detailed_reminders_due() -> None:
     """
     Find all reminders for detailed cases which are due in the next week.
@@ -127,35 +223,176 @@ def email_all_specialists_all_detailed_reminders_due() -> None:
     email.send()
 
 
+def build_reminder_digests() -> list[ReminderDigest]:
+    """
+    Group the unread reminders due in the next week, on all types of case, and
+    the overdue simplified cases by the user to be emailed about them. Only users
+    with email notifications enabled are included.
+    """
+    email_enabled_user_ids: set[int] = set(
+        NotificationSetting.objects.filter(
+            email_notifications_enabled=True
+        ).values_list("user_id", flat=True)
+    )
+    if not email_enabled_user_ids:
+        return []
+
+    digests: dict[int, ReminderDigest] = {}
+
+    reminders: QuerySet[Task] = (
+        Task.objects.filter(
+            type=Task.Type.REMINDER,
+            user_id__in=email_enabled_user_ids,
+            read=False,
+            date__lte=date.today() + REMINDER_DIGEST_TIMEDELTA,
+        )
+        .select_related("user", "base_case", "base_case__auditor")
+        .order_by("date")
+    )
+    for reminder in reminders:
+        if reminder.user_id not in digests:
+            digests[reminder.user_id] = ReminderDigest(recipient=reminder.user)
+        digests[reminder.user_id].reminders.append(reminder)
+
+    overdue_cases: list[SimplifiedCase] = [
+        overdue_case
+        for overdue_case in get_overdue_cases(user_request=None)
+        if overdue_case.auditor_id in email_enabled_user_ids
+    ]
+    auditors: dict[int, User] = User.objects.in_bulk(
+        {overdue_case.auditor_id for overdue_case in overdue_cases}
+    )
+    for overdue_case in overdue_cases:
+        if overdue_case.auditor_id not in digests:
+            digests[overdue_case.auditor_id] = ReminderDigest(
+                recipient=auditors[overdue_case.auditor_id]
+            )
+        digests[overdue_case.auditor_id].overdue_cases.append(overdue_case)
+
+    return sorted(digests.values(), key=lambda digest: digest.recipient.id)
+
+
+def build_reminder_digest_emails(digests: list[ReminderDigest]) -> list[EmailMessage]:
+    """Render one reminder digest email per recipient using a single template"""
+    template = get_template("notifications/reminder_digest_email.txt")
+    emails: list[EmailMessage] = []
+    for digest in digests:
+        email: EmailMessage = EmailMessage(
+            subject="Your reminders and overdue cases for the next week",
+            body=template.render(
+                {
+                    "user": digest.recipient,
+                    "reminders": digest.reminders,
+                    "overdue_cases": digest.overdue_cases,
+                }
+            ),
+            from_email=NOTIFICATION_FROM_EMAIL,
+            to=[digest.recipient.email],
+        )
+        email.content_subtype = "html"
+        emails.append(email)
+    return emails
+
+
+def send_reminder_digests(output_dir: Path | None = None) -> int:
+    """
+    Email each user their reminder digest using one email connection. If an
+    output directory is given, write each rendered email there instead of
+    sending it. Return the number of digests.
+    """
+    digests: list[ReminderDigest] = build_reminder_digests()
+    emails: list[EmailMessage] = build_reminder_digest_emails(digests=digests)
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for digest, email in zip(digests, emails):
+            output_path: Path = (
+                output_dir / f"reminder_digest_{digest.recipient.id}.txt"
+            )
+            output_path.write_text(
+                f"To: {', '.join(email.to)}\nSubject: {email.subject}\n\n{email.body}"
+            )
+    elif emails:
+        with get_connection() as connection:
+            connection.send_messages(emails)
+    return len(digests)
+
+
 def mark_tasks_as_read(user: User, base_case: BaseCase, type: Task.Type) -> None:
     """Mark tasks as read"""
-    tasks: QuerySet[Task] = Task.objects.filter(
-        user=user, base_case=base_case, type=type, read=False
+    mark_case_tasks_as_read(user=user, base_case=base_case, types=[type])
+
+
+def mark_case_tasks_as_read(
+    user: User, base_case: BaseCase, types: list[Task.Type]
+) -> int:
+    """
+    Mark the user's unread tasks of the given types on a case as read using a
+    single update and record the matching events using a single insert.
+    Return the number of tasks marked as read.
+    """
+    task_ids: list[int] = list(
+        Task.objects.filter(
+            user=user, base_case=base_case, type__in=types, read=False
+        ).values_list("id", flat=True)
+    )
+    if not task_ids:
+        return 0
+    Task.objects.filter(id__in=task_ids).update(read=True, updated=timezone.now())
+    record_case_tasks_read_events(user=user, task_ids=task_ids, base_case=base_case)
+    return len(task_ids)
+
+
+def record_case_tasks_read_events(
+    user: User, task_ids: list[int], base_case: BaseCase
+) -> None:
+    """Record tasks being marked as read on the correct type of Case"""
+    if base_case.test_type not in EVENT_HISTORY_MODELS_BY_TEST_TYPE:
+        return
+    event_history_model, case_id_field_name = EVENT_HISTORY_MODELS_BY_TEST_TYPE[
+        base_case.test_type
+    ]
+    content_type: ContentType = ContentType.objects.get_for_model(Task)
+    event_history_model.objects.bulk_create(
+        [
+            event_history_model(
+                **{case_id_field_name: base_case.id},
+                created_by=user,
+                content_type=content_type,
+                object_id=task_id,
+                difference=TASK_READ_DIFFERENCE,
+            )
+            for task_id in task_ids
+        ]
     )
-    for task in tasks:
-        task.read = True  # type: ignore
-        task.save()
 
 
 def exclude_cases_with_pending_reminders(
     cases: QuerySet[TCase],
 ) -> list[TCase]:
     """Return only cases without pending reminders"""
-    today: date = date.today()
-    cases_without_pending_reminders: list[TCase] = []
-    for case in cases:
-        if (
-            Task.objects.filter(
-                base_case=case, type=Task.Type.REMINDER, date__gte=today, read=False
-            ).first()
-            is None
-        ):
-            cases_without_pending_reminders.append(case)
-    return cases_without_pending_reminders
+    cases_to_check: list[TCase] = list(cases)
+    if not cases_to_check:
+        return []
+    case_ids_with_pending_reminders: set[int] = set(
+        Task.objects.filter(
+            base_case_id__in=[case.id for case in cases_to_check],
+            type=Task.Type.REMINDER,
+            date__gte=date.today(),
+            read=False,
+        ).values_list("base_case_id", flat=True)
+    )
+    return [
+        case
+        for case in cases_to_check
+        if case.id not in case_ids_with_pending_reminders
+    ]
 
 
-def get_overdue_cases(user_request: User | None) -> list[SimplifiedCase]:
-    """Return cases with overdue correspondence actions"""
+def get_overdue_cases_queryset(user_request: User | None) -> QuerySet[SimplifiedCase]:
+    """
+    Return queryset of cases with overdue correspondence actions, including
+    those with pending reminders
+    """
     if user_request is not None:
         user: User = get_object_or_404(User, id=user_request.id)
         cases: QuerySet[SimplifiedCase] = SimplifiedCase.objects.filter(auditor=user)
@@ -252,8 +489,13 @@ def get_overdue_cases(user_request: User | None) -> list[SimplifiedCase]:
         | in_12_week_correspondence
     )
 
+    return in_correspondence
+
+
+def get_overdue_cases(user_request: User | None) -> list[SimplifiedCase]:
+    """Return cases with overdue correspondence actions"""
     overdue_cases: list[SimplifiedCase] = exclude_cases_with_pending_reminders(
-        cases=in_correspondence
+        cases=get_overdue_cases_queryset(user_request=user_request)
     )
 
     sorted_overdue_cases: list[SimplifiedCase] = sorted(
@@ -263,85 +505,120 @@ def get_overdue_cases(user_request: User | None) -> list[SimplifiedCase]:
     return sorted_overdue_cases
 
 
-def get_post_case_tasks(user: User) -> list[Task]:
-    """
-    Return list of tasks for unresolved equality body correspondence
-    entries and incomplete equality body retests for a user.
-    """
-    tasks: list[Task] = []
+def build_overdue_task(overdue_case: SimplifiedCase) -> Task:
+    """Return task for case with overdue correspondence"""
+    task: Task = Task(
+        type=Task.Type.OVERDUE,
+        date=overdue_case.next_action_due_date,
+        base_case=overdue_case,
+        description=overdue_case.get_status_display(),
+        action="Chase overdue response",
+    )
+    task.options: list[Link] = [overdue_case.overdue_link]
+    return task
 
-    equality_body_correspondences: QuerySet[EqualityBodyCorrespondence] = (
-        EqualityBodyCorrespondence.objects.filter(
-            simplified_case__auditor=user,
-            status=EqualityBodyCorrespondence.Status.UNRESOLVED,
-        )
+
+def build_equality_body_correspondence_task(
+    equality_body_correspondence: EqualityBodyCorrespondence,
+) -> Task:
+    """Return task for unresolved equality body correspondence"""
+    task: Task = Task(
+        type=Task.Type.POSTCASE,
+        date=equality_body_correspondence.created.date(),
+        base_case=equality_body_correspondence.simplified_case,
+        description="Unresolved correspondence",
+        action="View correspondence",
     )
+    task.options: list[Link] = [
+        Link(
+            label="View correspondence",
+            url=f"{equality_body_correspondence.get_absolute_url()}?view=unresolved",
+        )
+    ]
+    return task
 
-    today: date = date.today()
 
-    for equality_body_correspondence in equality_body_correspondences:
-        if (
-            Task.objects.filter(
-                base_case=equality_body_correspondence.simplified_case,
-                type=Task.Type.REMINDER,
-                date__gte=today,
-            ).first()
-            is None
-        ):
-            task: Task = Task(
-                type=Task.Type.POSTCASE,
-                date=equality_body_correspondence.created.date(),
-                base_case=equality_body_correspondence.simplified_case,
-                description="Unresolved correspondence",
-                action="View correspondence",
-            )
-            task.options: list[Link] = [
-                Link(
-                    label="View correspondence",
-                    url=f"{equality_body_correspondence.get_absolute_url()}?view=unresolved",
-                )
-            ]
-            tasks.append(task)
-
-    wcag_audit_retests: QuerySet[WcagAudit] = WcagAudit.objects.filter(
-        is_deleted=False,
-        audit_round_type=WcagAudit.AuditRoundType.EQUALITY_BODY,
-        simplified_case__auditor=user,
-        compliance_state=WcagAudit.WebsiteCompliance.UNKNOWN,
+def build_retest_task(wcag_audit_retest: WcagAudit) -> Task:
+    """Return task for equality body retest with no compliance decision"""
+    task: Task = Task(
+        type=Task.Type.POSTCASE,
+        date=wcag_audit_retest.date_of_test,
+        base_case=wcag_audit_retest.simplified_case,
+        description="Website compliance decision not set",
+        action="View retest",
     )
+    task.options: list[Link] = [
+        Link(
+            label="View retest",
+            url=reverse(
+                "audits:retest-compliance-update",
+                kwargs={"pk": wcag_audit_retest.id},
+            ),
+        )
+    ]
+    return task
 
-    for wcag_audit_retest in wcag_audit_retests:
-        if (
-            Task.objects.filter(
-                base_case=wcag_audit_retest.simplified_case,
-                type=Task.Type.REMINDER,
-                date__gte=today,
-            ).first()
-            is None
-        ):
-            task: Task = Task(
-                type=Task.Type.POSTCASE,
-                date=wcag_audit_retest.date_of_test,
-                base_case=wcag_audit_retest.simplified_case,
-                description="Website compliance decision not set",
-                action="View retest",
-            )
-            task.options: list[Link] = [
-                Link(
-                    label="View retest",
-                    url=reverse(
-                        "audits:retest-compliance-update",
-                        kwargs={"pk": wcag_audit_retest.id},
-                    ),
-                )
-            ]
-            tasks.append(task)
 
-    return tasks
+def simplified_case_next_action_due_date() -> Case:
+    """Return database expression matching SimplifiedCase.next_action_due_date"""
+    one_week: timedelta = timedelta(days=ONE_WEEK_IN_DAYS)
+    return Case(
+        When(
+            status=SimplifiedCase.Status.REPORT_READY_TO_SEND,
+            no_contact_one_week_chaser_due_date__isnull=False,
+            no_contact_one_week_chaser_sent_date__isnull=True,
+            then=F("no_contact_one_week_chaser_due_date"),
+        ),
+        When(
+            status=SimplifiedCase.Status.REPORT_READY_TO_SEND,
+            no_contact_four_week_chaser_due_date__isnull=False,
+            no_contact_four_week_chaser_sent_date__isnull=True,
+            then=F("no_contact_four_week_chaser_due_date"),
+        ),
+        When(
+            status=SimplifiedCase.Status.REPORT_READY_TO_SEND,
+            no_contact_four_week_chaser_sent_date__isnull=False,
+            then=Cast(
+                F("no_contact_four_week_chaser_sent_date") + one_week, DateField()
+            ),
+        ),
+        When(
+            status=SimplifiedCase.Status.IN_REPORT_CORES,
+            report_followup_week_1_sent_date__isnull=True,
+            then=F("report_followup_week_1_due_date"),
+        ),
+        When(
+            status=SimplifiedCase.Status.IN_REPORT_CORES,
+            report_followup_week_4_sent_date__isnull=True,
+            then=F("report_followup_week_4_due_date"),
+        ),
+        When(
+            status=SimplifiedCase.Status.IN_REPORT_CORES,
+            then=Cast(F("report_followup_week_4_sent_date") + one_week, DateField()),
+        ),
+        When(
+            status=SimplifiedCase.Status.AWAITING_12_WEEK_DEADLINE,
+            then=F("report_followup_week_12_due_date"),
+        ),
+        When(
+            status=SimplifiedCase.Status.AFTER_12_WEEK_CORES,
+            twelve_week_1_week_chaser_sent_date__isnull=True,
+            then=F("twelve_week_1_week_chaser_due_date"),
+        ),
+        When(
+            status=SimplifiedCase.Status.AFTER_12_WEEK_CORES,
+            then=Cast(F("twelve_week_1_week_chaser_sent_date") + one_week, DateField()),
+        ),
+        default=Value(date(1970, 1, 1)),
+        output_field=DateField(),
+    )
 
 
-def build_task_list(user: User | None, **kwargs) -> list[Task]:
-    """Build list of tasks from database and items derived dynamically from Cases"""
+def build_task_feed_querysets(user: User | None, **kwargs) -> dict[str, QuerySet]:
+    """
+    Return querysets, keyed by task feed source, of the tasks in the database and
+    of the objects from which tasks are derived dynamically
+    """
     task_filter: dict[str, Any] = {
         "read": False,
     }
@@ -351,50 +628,173 @@ def build_task_list(user: User | None, **kwargs) -> list[Task]:
 
     type: str | None = kwargs.get("type")
 
-    read: bool = kwargs.get("read") is not None
     if type is not None:
         task_filter["type"] = type
-    if read or kwargs.get("deleted") is not None:
+    if kwargs.get("read") is not None or kwargs.get("deleted") is not None:
         task_filter["read"] = True
         task_filter["date__gte"] = date.today() - TASK_LIST_READ_TIMEDELTA
     elif kwargs.get("future") is None:
         task_filter["date__lte"] = date.today()
 
-    tasks: list[Task] = list(Task.objects.filter(**task_filter))
+    task_feed_querysets: dict[str, QuerySet] = {
+        TASK_FEED_SOURCE_TASK: Task.objects.filter(**task_filter).annotate(
+            task_date=F("date")
+        )
+    }
 
+    today: date = date.today()
     if type is None or type == Task.Type.OVERDUE:
-        overdue_cases: QuerySet[SimplifiedCase] = get_overdue_cases(user_request=user)
-        for overdue_case in overdue_cases:
-            task: Task = Task(
-                type=Task.Type.OVERDUE,
-                date=overdue_case.next_action_due_date,
-                base_case=overdue_case,
-                description=overdue_case.get_status_display(),
-                action="Chase overdue response",
+        task_feed_querysets[TASK_FEED_SOURCE_OVERDUE] = (
+            get_overdue_cases_queryset(user_request=user)
+            .exclude(
+                Exists(
+                    Task.objects.filter(
+                        base_case_id=OuterRef("pk"),
+                        type=Task.Type.REMINDER,
+                        date__gte=today,
+                        read=False,
+                    )
+                )
             )
-            task.options: list[Link] = [overdue_case.overdue_link]
-            tasks.append(task)
+            .annotate(task_date=simplified_case_next_action_due_date())
+        )
 
-    if user is not None:
-        if type is None or type == Task.Type.POSTCASE:
-            tasks += get_post_case_tasks(user=user)
+    if user is not None and (type is None or type == Task.Type.POSTCASE):
+        pending_reminder: Exists = Exists(
+            Task.objects.filter(
+                base_case_id=OuterRef("simplified_case_id"),
+                type=Task.Type.REMINDER,
+                date__gte=today,
+            )
+        )
+        task_feed_querysets[TASK_FEED_SOURCE_CORRESPONDENCE] = (
+            EqualityBodyCorrespondence.objects.filter(
+                simplified_case__auditor=user,
+                status=EqualityBodyCorrespondence.Status.UNRESOLVED,
+            )
+            .exclude(pending_reminder)
+            .annotate(task_date=TruncDate("created", tzinfo=datetime_timezone.utc))
+        )
+        task_feed_querysets[TASK_FEED_SOURCE_RETEST] = (
+            WcagAudit.objects.filter(
+                is_deleted=False,
+                audit_round_type=WcagAudit.AuditRoundType.EQUALITY_BODY,
+                simplified_case__auditor=user,
+                compliance_state=WcagAudit.WebsiteCompliance.UNKNOWN,
+            )
+            .exclude(pending_reminder)
+            .annotate(task_date=F("date_of_test"))
+        )
+
+    return task_feed_querysets
 
-    sorted_tasks: list[Task] = sorted(
-        tasks,
-        key=lambda task: (task.date),
-        reverse=read,
-    )
 
-    return sorted_tasks
+def build_task_feed(user: User | None, **kwargs) -> QuerySet:
+    """
+    Build a single union query of the tasks in the database and the items derived
+    dynamically from Cases. Each row has the source and id of the object the task
+    is built from, and rows are sorted by task date.
+    """
+    feed_querysets: list[QuerySet] = [
+        queryset.annotate(source=Value(source))
+        .values("source", "id", "task_date")
+        .order_by()
+        for source, queryset in build_task_feed_querysets(user=user, **kwargs).items()
+    ]
+
+    task_feed: QuerySet = feed_querysets[0]
+    if len(feed_querysets) > 1:
+        task_feed = task_feed.union(*feed_querysets[1:], all=True)
+    if kwargs.get("read") is not None:
+        return task_feed.order_by("-task_date", "source", "-id")
+    return task_feed.order_by("task_date", "source", "-id")
+
+
+def get_task_feed_tasks(task_feed_rows: list[dict[str, Any]]) -> list[Task]:
+    """Build the tasks for rows of a task feed using one query per source"""
+    ids_by_source: dict[str, list[int]] = {}
+    for task_feed_row in task_feed_rows:
+        ids_by_source.setdefault(task_feed_row["source"], []).append(
+            task_feed_row["id"]
+        )
+
+    tasks: dict[int, Task] = Task.objects.select_related(
+        "user",
+        "base_case",
+        "base_case__auditor",
+        "base_case__simplifiedcase",
+        "base_case__detailedcase",
+        "base_case__mobilecase",
+    ).in_bulk(ids_by_source.get(TASK_FEED_SOURCE_TASK, []))
+    overdue_cases: dict[int, SimplifiedCase] = SimplifiedCase.objects.select_related(
+        "auditor"
+    ).in_bulk(ids_by_source.get(TASK_FEED_SOURCE_OVERDUE, []))
+    equality_body_correspondences: dict[int, EqualityBodyCorrespondence] = (
+        EqualityBodyCorrespondence.objects.select_related(
+            "simplified_case", "simplified_case__auditor"
+        ).in_bulk(ids_by_source.get(TASK_FEED_SOURCE_CORRESPONDENCE, []))
+    )
+    wcag_audit_retests: dict[int, WcagAudit] = WcagAudit.objects.select_related(
+        "simplified_case", "simplified_case__auditor"
+    ).in_bulk(ids_by_source.get(TASK_FEED_SOURCE_RETEST, []))
+
+    feed_tasks: list[Task] = []
+    for task_feed_row in task_feed_rows:
+        source: str = task_feed_row["source"]
+        id: int = task_feed_row["id"]
+        if source == TASK_FEED_SOURCE_TASK:
+            feed_tasks.append(tasks[id])
+        elif source == TASK_FEED_SOURCE_OVERDUE:
+            feed_tasks.append(build_overdue_task(overdue_case=overdue_cases[id]))
+        elif source == TASK_FEED_SOURCE_CORRESPONDENCE:
+            feed_tasks.append(
+                build_equality_body_correspondence_task(
+                    equality_body_correspondence=equality_body_correspondences[id]
+                )
+            )
+        else:
+            feed_tasks.append(
+                build_retest_task(wcag_audit_retest=wcag_audit_retests[id])
+            )
+    return feed_tasks
 
 
 def get_number_of_tasks(user: User) -> int:
     """Return number of tasks"""
     if user.id:  # If logged in user
-        return len(build_task_list(user=user))
+        return build_task_feed(user=user).count()
     return 0
 
 
+def get_task_feed_type_counts(user: User | None, **kwargs) -> dict[str, int]:
+    """Return the number of tasks of each type without building the tasks"""
+    task_feed_querysets: dict[str, QuerySet] = build_task_feed_querysets(
+        user=user, **kwargs
+    )
+    stored_task_counts: dict[str, int] = dict(
+        task_feed_querysets[TASK_FEED_SOURCE_TASK]
+        .order_by()
+        .values_list("type")
+        .annotate(Count("id"))
+    )
+    postcase_count: int = sum(
+        task_feed_querysets[source].count()
+        for source in [TASK_FEED_SOURCE_CORRESPONDENCE, TASK_FEED_SOURCE_RETEST]
+        if source in task_feed_querysets
+    )
+    return {
+        "qa_comment": stored_task_counts.get(Task.Type.QA_COMMENT, 0),
+        "report_approved": stored_task_counts.get(Task.Type.REPORT_APPROVED, 0),
+        "reminder": stored_task_counts.get(Task.Type.REMINDER, 0),
+        "overdue": (
+            task_feed_querysets[TASK_FEED_SOURCE_OVERDUE].count()
+            if TASK_FEED_SOURCE_OVERDUE in task_feed_querysets
+            else 0
+        ),
+        "postcase": postcase_count,
+    }
+
+
 def get_tasks_by_type_count(tasks: list[Task], type: Task.Type) -> int:
     """Return the number of tasks of a specific type"""
     return len([task for task in tasks if task.type == type])
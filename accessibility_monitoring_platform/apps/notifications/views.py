@@ -4,23 +4,30 @@ from typing import Any
 
 from django.contrib import messages
 from django.contrib.auth.models import User
+from django.core.paginator import Page, Paginator
 from django.db.models.query import QuerySet
 from django.forms.models import ModelForm
 from django.http import HttpResponseRedirect
 from django.urls import reverse, reverse_lazy
+from django.utils import timezone
 from django.views.generic import ListView, TemplateView
 from django.views.generic.edit import CreateView, UpdateView
 
 from ..cases.models import BaseCase
+from ..common.utils import get_url_parameters_for_pagination
 from .forms import ReminderForm
 from .models import Task
 from .utils import (
+    TASK_LIST_PAGE_SIZE,
     TASK_LIST_PARAMS,
-    build_task_list,
+    build_task_feed,
+    get_task_feed_tasks,
+    get_task_feed_type_counts,
     get_task_type_counts,
-    mark_tasks_as_read,
+    mark_case_tasks_as_read,
     record_case_model_create_event,
     record_case_model_update_event,
+    record_case_tasks_read_events,
 )
 
 
@@ -39,10 +46,9 @@ class TaskListView(TemplateView):
         }
 
         if "show_all_users" in self.request.GET:
-            tasks: list[Task] = build_task_list(user=None, **params)
+            context.update(self.get_task_page_context(user=None, params=params))
             context["show_all_users"] = True
-            context["tasks"] = tasks
-            context["task_type_counts"] = get_task_type_counts(tasks=tasks)
+            context["task_type_counts"] = get_task_feed_type_counts(user=None, **params)
             return {**context, **params}
 
         if "show_all_detailed_reminders" in self.request.GET:
@@ -52,6 +58,7 @@ class TaskListView(TemplateView):
                 read=False,
             ).order_by("date")
             context["tasks"] = tasks
+            context["number_of_tasks_found"] = len(tasks)
             context["show_all_detailed_reminders"] = True
             context["task_type_counts"] = get_task_type_counts(tasks=tasks)
             return {**context, **params}
@@ -67,11 +74,25 @@ class TaskListView(TemplateView):
                 except User.DoesNotExist:
                     pass
 
-        context["tasks"] = build_task_list(user=user, **params)
-        all_due_tasks: list[Task] = build_task_list(user=user)
-        context["task_type_counts"] = get_task_type_counts(tasks=all_due_tasks)
+        context.update(self.get_task_page_context(user=user, params=params))
+        context["task_type_counts"] = get_task_feed_type_counts(user=user)
         return {**context, **params}
 
+    def get_task_page_context(
+        self, user: User | None, params: dict[str, str]
+    ) -> dict[str, Any]:
+        """Build only the tasks on the requested page of the task feed"""
+        paginator: Paginator = Paginator(
+            build_task_feed(user=user, **params), TASK_LIST_PAGE_SIZE
+        )
+        page_obj: Page = paginator.get_page(self.request.GET.get("page"))
+        return {
+            "tasks": get_task_feed_tasks(task_feed_rows=list(page_obj)),
+            "number_of_tasks_found": paginator.count,
+            "page_obj": page_obj,
+            "url_parameters": get_url_parameters_for_pagination(request=self.request),
+        }
+
 
 class TaskMarkAsReadView(ListView):
     """
@@ -82,12 +103,17 @@ class TaskMarkAsReadView(ListView):
 
     def get(self, request, pk):
         """Hides a task"""
-        task: Task = Task.objects.get(pk=pk)
+        task: Task = Task.objects.select_related("base_case").get(pk=pk)
         if (
-            task.user.id == request.user.id  # type: ignore
+            task.user_id == request.user.id  # type: ignore
         ):  # Checks whether the task was created by user
-            task.read = True
-            task.save()
+            if not task.read:
+                Task.objects.filter(id=task.id).update(
+                    read=True, updated=timezone.now()
+                )
+                record_case_tasks_read_events(
+                    user=request.user, task_ids=[task.id], base_case=task.base_case
+                )
             if task.type == Task.Type.REMINDER:
                 messages.success(request, f"{task.base_case} Reminder task deleted")
             else:
@@ -111,13 +137,10 @@ class CommentsMarkAsReadView(ListView):
     def get(self, request, case_id):
         """Hides a task"""
         base_case: BaseCase = BaseCase.objects.get(id=case_id)
-        mark_tasks_as_read(
-            user=self.request.user, base_case=base_case, type=Task.Type.QA_COMMENT
-        )
-        mark_tasks_as_read(
+        mark_case_tasks_as_read(
             user=self.request.user,
             base_case=base_case,
-            type=Task.Type.REPORT_APPROVED,
+            types=[Task.Type.QA_COMMENT, Task.Type.REPORT_APPROVED],
         )
         messages.success(request, f"{base_case} comments marked as read")
         return HttpResponseRedirect(reverse_lazy("notifications:task-list"))
@@ -4,7 +4,6 @@ Admin for cases
 
 from django.contrib import admin
 
-from ..common.admin import ExportCsvMixin
 from .models import (
     CaseCompliance,
     CaseEvent,
@@ -95,7 +94,7 @@ class CaseComplianceAdmin(admin.ModelAdmin):
     show_facets = admin.ShowFacets.ALWAYS
 
 
-class CaseEventAdmin(admin.ModelAdmin, ExportCsvMixin):
+class CaseEventAdmin(admin.ModelAdmin):
     """Django admin configuration for CaseEvent model"""
 
     readonly_fields = [
@@ -113,7 +112,6 @@ class CaseEventAdmin(admin.ModelAdmin, ExportCsvMixin):
     ]
     list_display = ["message", "event_time", "done_by", "simplified_case", "event_type"]
     list_filter = ["event_type", ("done_by", admin.RelatedOnlyFieldListFilter)]
-    actions = ["export_as_csv"]
 
 
 class ContactAdmin(admin.ModelAdmin):
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.7 on 2026-10-19 05:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("simplified", "0012_populate_archived_case_identifiers"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="simplifiedcase",
+            name="sent_to_enforcement_body_sent_date",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+    ]
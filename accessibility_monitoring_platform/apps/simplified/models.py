@@ -334,7 +334,9 @@ class SimplifiedCase(BaseCase):
     enforcement_correspondence_complete_date = models.DateField(null=True, blank=True)
 
     # Equality body metadata
-    sent_to_enforcement_body_sent_date = models.DateField(null=True, blank=True)
+    sent_to_enforcement_body_sent_date = models.DateField(
+        null=True, blank=True, db_index=True
+    )
     equality_body_case_start_date = models.DateField(null=True, blank=True)
     enforcement_body_case_owner = models.TextField(default="", blank=True)
     enforcement_body_closed_case = models.CharField(
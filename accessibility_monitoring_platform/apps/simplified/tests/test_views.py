@@ -2,6 +2,7 @@
 Tests for cases views
 """
 
+import gzip
 import json
 from datetime import date, timedelta
 from typing import Any
@@ -435,6 +436,26 @@ def test_case_export_list_view(admin_client):
     assertContains(response, case_columns_to_export_str)
 
 
+def test_case_export_list_view_compressed(admin_client):
+    """Test that the case export list view returns gzip compressed csv data"""
+    SimplifiedCase.objects.create(organisation_name="Included")
+
+    response: HttpResponse = admin_client.get(
+        f"{reverse('simplified:case-export-list')}?format=gzip"
+    )
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/gzip"
+    assert response["Content-Disposition"] == (
+        "attachment; filename=simplified_cases.csv.gz"
+    )
+
+    content: str = gzip.decompress(b"".join(response.streaming_content)).decode()
+
+    assert content.startswith(case_columns_to_export_str)
+    assert "Included" in content
+
+
 @pytest.mark.parametrize(
     "export_view_name",
     [
@@ -16,7 +16,7 @@ from django.http import StreamingHttpResponse
 from django.urls import reverse
 
 from ..audits.models import StatementAudit, WcagAudit
-from ..cases.csv_export import csv_output_generator
+from ..cases.csv_export import csv_output_generator, csv_streaming_response
 from ..cases.utils import CaseDetailPage, CaseDetailSection
 from ..common.form_extract_utils import (
     FieldLabelAndValue,
@@ -258,37 +258,38 @@ def record_simplified_model_create_event(
 
 
 def download_simplified_cases(
-    simplified_cases: QuerySet[SimplifiedCase], filename: str = "simplified_cases.csv"
+    simplified_cases: QuerySet[SimplifiedCase],
+    filename: str = "simplified_cases.csv",
+    compress: bool = False,
 ) -> StreamingHttpResponse:
     """Given a SimplifiedCase queryset, download the data in csv format"""
 
-    response = StreamingHttpResponse(
-        csv_output_generator(
+    return csv_streaming_response(
+        output_generator=csv_output_generator(
             cases=simplified_cases,
             columns_for_export=SIMPLIFIED_CASE_COLUMNS_FOR_EXPORT,
         ),
-        content_type="text/csv",
+        filename=filename,
+        compress=compress,
     )
-    response["Content-Disposition"] = f"attachment; filename={filename}"
-    return response
 
 
 def download_simplified_feedback_survey_cases(
     cases: QuerySet[SimplifiedCase],
     filename: str = "simplified_feedback_survey_cases.csv",
+    compress: bool = False,
 ) -> StreamingHttpResponse:
     """
     Given a SimplifiedCase queryset, download the feedback survey data in csv format
     """
-    response = StreamingHttpResponse(
-        csv_output_generator(
+    return csv_streaming_response(
+        output_generator=csv_output_generator(
             cases=cases,
             columns_for_export=SIMPLIFIED_FEEDBACK_SURVEY_COLUMNS_FOR_EXPORT,
         ),
-        content_type="text/csv",
+        filename=filename,
+        compress=compress,
     )
-    response["Content-Disposition"] = f"attachment; filename={filename}"
-    return response
 
 
 def get_email_template_context(simplified_case: SimplifiedCase) -> dict[str, Any]:
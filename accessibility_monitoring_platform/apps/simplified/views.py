@@ -22,7 +22,10 @@ from ..audits.utils import (
     get_audit_summary_context,
     update_published_report_data_updated_time,
 )
-from ..cases.csv_export import populate_equality_body_columns
+from ..cases.csv_export import (
+    is_compressed_export_requested,
+    populate_equality_body_columns,
+)
 from ..cases.forms import CaseSearchForm
 from ..cases.models import TestType
 from ..cases.utils import filter_cases, find_duplicate_cases
@@ -43,7 +46,7 @@ from ..common.views import (
     ShowGoBackJSWidgetMixin,
 )
 from ..notifications.models import Task
-from ..notifications.utils import add_task, mark_tasks_as_read
+from ..notifications.utils import add_task, mark_case_tasks_as_read
 from ..reports.utils import publish_report_util
 from .csv_export import (
     SIMPLIFIED_EQUALITY_BODY_CORRESPONDENCE_COLUMNS_FOR_EXPORT,
@@ -934,7 +937,8 @@ def export_cases(request: HttpRequest) -> StreamingHttpResponse:
     case_search_form: CaseSearchForm = CaseSearchForm(search_parameters)
     case_search_form.is_valid()
     return download_simplified_cases(
-        simplified_cases=filter_cases(form=case_search_form)
+        simplified_cases=filter_cases(form=case_search_form),
+        compress=is_compressed_export_requested(request),
     )
 
 
@@ -945,7 +949,8 @@ def export_feedback_survey_cases(request: HttpRequest) -> StreamingHttpResponse:
     case_search_form: CaseSearchForm = CaseSearchForm(search_parameters)
     case_search_form.is_valid()
     return download_simplified_feedback_survey_cases(
-        cases=filter_cases(form=case_search_form)
+        cases=filter_cases(form=case_search_form),
+        compress=is_compressed_export_requested(request),
     )
 
 
@@ -1312,11 +1317,10 @@ def enable_correspondence_process(
 def mark_qa_comments_as_read(request: HttpRequest, pk: int) -> HttpResponseRedirect:
     """Mark QA comment reminders as read for the current user"""
     simplified_case: SimplifiedCase = SimplifiedCase.objects.get(id=pk)
-    mark_tasks_as_read(
-        user=request.user, base_case=simplified_case, type=Task.Type.QA_COMMENT
-    )
-    mark_tasks_as_read(
-        user=request.user, base_case=simplified_case, type=Task.Type.REPORT_APPROVED
+    mark_case_tasks_as_read(
+        user=request.user,
+        base_case=simplified_case,
+        types=[Task.Type.QA_COMMENT, Task.Type.REPORT_APPROVED],
     )
     messages.success(request, f"{simplified_case} comments marked as read")
     return redirect(
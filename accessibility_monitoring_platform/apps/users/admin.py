@@ -3,7 +3,17 @@ Admin - users
 """
 
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin
+from django.contrib.auth.models import User
 
+from ..common.admin import ExportCsvDisabledMixin
 from .models import AllowedEmail
 
+
+class PlatformUserAdmin(ExportCsvDisabledMixin, UserAdmin):
+    """Django admin configuration for User model without CSV export"""
+
+
 admin.site.register(AllowedEmail)
+admin.site.unregister(User)
+admin.site.register(User, PlatformUserAdmin)
@@ -42,6 +42,50 @@ resource "aws_iam_role_policy" "ecs_execution_secrets" {
   })
 }
 
+locals {
+  platform_environment = [
+    { name = "ALLOWED_HOSTS", value = "${var.app_domain_name} ${aws_lb.app.dns_name}"},
+    { name = "DB_HOST", value = aws_db_instance.postgres.address },
+    { name = "DB_NAME", value = aws_db_instance.postgres.db_name },
+    { name = "DB_USER", value = aws_db_instance.postgres.username },
+    { name = "PORT", value = "8001" },
+    { name = "AWS_REGION", value = "eu-west-2" },
+    { name = "COPILOT_APPLICATION_NAME", value = "ampapp" },
+    { name = "COPILOT_ENVIRONMENT_NAME", value = var.environment },
+    { name = "COPILOT_SERVICE_NAME", value = "amp-svc" },
+    { name = "COPILOT_SERVICE_DISCOVERY_ENDPOINT", value = "${var.environment}.ampapp.local" },
+    { name = "AMP_PROTOCOL", value = "https://" },
+    { name = "TERRAFORM", value = "TRUE" },
+    { name = "BUCKET_NAME", value = aws_s3_bucket.app_files.bucket },
+    { name = "AWS_S3_REGION_NAME", value = "eu-west-2" },
+    { name = "AMP_VIEWER_DOMAIN", value = var.app_two_domain_name },
+  ]
+
+  platform_secrets = [
+    {
+      name      = "DB_PASSWORD"
+      valueFrom = "${aws_db_instance.postgres.master_user_secret[0].secret_arn}"
+    },
+    {
+      name      = "SECRET_KEY"
+      valueFrom = aws_secretsmanager_secret.django_secret_key.arn
+    },
+    {
+      name      = "NOTIFY_API_KEY"
+      valueFrom = data.aws_secretsmanager_secret.notify_api_key.arn
+    }
+  ]
+
+  platform_log_configuration = {
+    logDriver = "awslogs"
+    options = {
+      awslogs-group         = aws_cloudwatch_log_group.app.name
+      awslogs-region        = "eu-west-2"
+      awslogs-stream-prefix = "ecs"
+    }
+  }
+}
+
 resource "aws_ecs_task_definition" "app" {
   family                   = local.app_name
   requires_compatibilities = ["FARGATE"]
@@ -68,47 +112,9 @@ resource "aws_ecs_task_definition" "app" {
         }
       ]
 
-      environment = [
-        { name = "ALLOWED_HOSTS", value = "${var.app_domain_name} ${aws_lb.app.dns_name}"},
-        { name = "DB_HOST", value = aws_db_instance.postgres.address },
-        { name = "DB_NAME", value = aws_db_instance.postgres.db_name },
-        { name = "DB_USER", value = aws_db_instance.postgres.username },
-        { name = "PORT", value = "8001" },
-        { name = "AWS_REGION", value = "eu-west-2" },
-        { name = "COPILOT_APPLICATION_NAME", value = "ampapp" },
-        { name = "COPILOT_ENVIRONMENT_NAME", value = var.environment },
-        { name = "COPILOT_SERVICE_NAME", value = "amp-svc" },
-        { name = "COPILOT_SERVICE_DISCOVERY_ENDPOINT", value = "${var.environment}.ampapp.local" },
-        { name = "AMP_PROTOCOL", value = "https://" },
-        { name = "TERRAFORM", value = "TRUE" },
-        { name = "BUCKET_NAME", value = aws_s3_bucket.app_files.bucket },
-        { name = "AWS_S3_REGION_NAME", value = "eu-west-2" },
-        { name = "AMP_VIEWER_DOMAIN", value = var.app_two_domain_name },
-      ]
-
-      secrets = [
-        {
-          name      = "DB_PASSWORD"
-          valueFrom = "${aws_db_instance.postgres.master_user_secret[0].secret_arn}"
-        },
-        {
-          name      = "SECRET_KEY"
-          valueFrom = aws_secretsmanager_secret.django_secret_key.arn
-        },
-        {
-          name      = "NOTIFY_API_KEY"
-          valueFrom = data.aws_secretsmanager_secret.notify_api_key.arn
-        }
-      ]
-
-      logConfiguration = {
-        logDriver = "awslogs"
-        options = {
-          awslogs-group         = aws_cloudwatch_log_group.app.name
-          awslogs-region        = "eu-west-2"
-          awslogs-stream-prefix = "ecs"
-        }
-      }
+      environment      = local.platform_environment
+      secrets          = local.platform_secrets
+      logConfiguration = local.platform_log_configuration
     }
   ])
 }
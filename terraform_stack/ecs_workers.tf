@@ -0,0 +1,56 @@
+# Background workers run from the platform image with the same settings as
+# the web service. ECS restarts a worker whenever its command exits.
+locals {
+  platform_workers = {
+    export-jobs         = ["python", "manage.py", "run_export_jobs", "--workers", "2"]
+    notification-emails = ["python", "manage.py", "send_notification_emails", "--poll-interval", "60"]
+  }
+}
+
+resource "aws_ecs_task_definition" "worker" {
+  for_each = local.platform_workers
+
+  family                   = "${local.app_name}-${each.key}"
+  requires_compatibilities = ["FARGATE"]
+  network_mode             = "awsvpc"
+  cpu                      = 1024
+  memory                   = 2048
+  runtime_platform {
+    operating_system_family = "LINUX"
+    cpu_architecture        = "X86_64"
+  }
+  execution_role_arn = aws_iam_role.ecs_execution.arn
+  task_role_arn      = aws_iam_role.ecs_task.arn
+
+  container_definitions = jsonencode([
+    {
+      name      = "${local.app_name}-${each.key}"
+      image     = "${aws_ecr_repository.app.repository_url}:${var.image_tag}"
+      essential = true
+      command   = each.value
+
+      environment      = local.platform_environment
+      secrets          = local.platform_secrets
+      logConfiguration = local.platform_log_configuration
+    }
+  ])
+}
+
+resource "aws_ecs_service" "worker" {
+  for_each = local.platform_workers
+
+  name                   = "${local.app_name}-${each.key}"
+  cluster                = aws_ecs_cluster.main.id
+  task_definition        = aws_ecs_task_definition.worker[each.key].arn
+  desired_count          = 1
+  launch_type            = "FARGATE"
+  platform_version       = "1.4.0"
+  force_new_deployment   = true
+  enable_execute_command = true
+
+  network_configuration {
+    subnets          = module.vpc.private_subnets
+    security_groups  = [aws_security_group.ecs.id]
+    assign_public_ip = false
+  }
+}